@@ -0,0 +1,54 @@
+"""
+Moteur de Puissance 4 avec IA Minimax, utilisable sans interface graphique.
+L'interface Tkinter (Puissance4GUI, MenuPrincipal) n'est importée qu'à la demande.
+"""
+
+from .bitboard import BitBoard
+from .book import OpeningBook, build_book, write_book
+from .encoding import board_to_key, decode_moves, encode_moves, key_to_board
+from .engine import Puissance4, SearchTimeout, play_tournament_game
+from .evaluation import IncrementalEvaluator
+from .records import GameRecordReader, GameRecordWriter, read_game_records
+from .solver import Solver
+from .stats import SearchStats
+from .transposition import (
+    SharedTranspositionTable,
+    TranspositionTable,
+    profile_key,
+    zobrist_keys,
+)
+
+__all__ = [
+    "BitBoard",
+    "GameRecordReader",
+    "GameRecordWriter",
+    "IncrementalEvaluator",
+    "MenuPrincipal",
+    "OpeningBook",
+    "Puissance4",
+    "Puissance4GUI",
+    "SearchStats",
+    "SearchTimeout",
+    "SharedTranspositionTable",
+    "Solver",
+    "TranspositionTable",
+    "board_to_key",
+    "build_book",
+    "decode_moves",
+    "encode_moves",
+    "key_to_board",
+    "play_tournament_game",
+    "profile_key",
+    "read_game_records",
+    "write_book",
+    "zobrist_keys",
+]
+
+
+def __getattr__(name):
+    # Tkinter n'est chargé que lorsque l'interface graphique est demandée
+    if name in ("Puissance4GUI", "MenuPrincipal"):
+        from . import gui
+
+        return getattr(gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,325 @@
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .book import open_book, replay
+from .encoding import decode_moves
+from .engine import Puissance4
+
+# Positions confiées à chaque tâche du pool : amortit le coût des échanges entre processus
+CHUNK_SIZE = 64
+# Caractères acceptés pour une case vide dans un plateau en texte
+EMPTY_CELLS = ".-_0 "
+
+
+def parse_board(text, rows=6, cols=7):
+    """
+    Lit un plateau en texte : les rangées, de haut en bas, séparées par des "/" (ex. "......./.../...RJ...").
+    Chaque case vaut "R", "J" ou "." (ou "-", "_", "0") si elle est vide.
+    :param text: Plateau en texte.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Plateau sous forme de liste de rangées (0 en haut) de " ", "R" ou "J".
+    """
+    lines = text.strip().upper().split("/")
+    if len(lines) != rows or any(len(line) != cols for line in lines):
+        raise ValueError(f"Le plateau doit compter {rows} rangées de {cols} cases")
+    board = []
+    for line in lines:
+        row = []
+        for cell in line:
+            if cell in EMPTY_CELLS:
+                row.append(" ")
+            elif cell in "RJ":
+                row.append(cell)
+            else:
+                raise ValueError(f"Case invalide dans le plateau : {cell!r}")
+        board.append(row)
+    for col in range(cols):
+        # Les jetons reposent les uns sur les autres : aucune case vide sous un jeton
+        height = sum(board[row][col] != " " for row in range(rows))
+        if any(board[row][col] != " " for row in range(rows - height)):
+            raise ValueError(f"Jeton suspendu dans la colonne {col + 1}")
+    red = sum(row.count("R") for row in board)
+    yellow = sum(row.count("J") for row in board)
+    if red - yellow not in (0, 1):
+        raise ValueError("Nombre de jetons incohérent (le Rouge commence)")
+    return board
+
+
+def set_position(game, position):
+    """
+    Place la partie sur une position donnée par la suite des coups joués (ex. "4453") ou par un plateau
+    en texte (voir parse_board).
+    Un plateau est rejoué colonne par colonne, chaque jeton avec sa couleur : la position est exacte,
+    mais moves_played ne suit pas un ordre de jeu légal.
+    :param game: Instance de Puissance4 à repositionner.
+    :param position: Position en texte.
+    :return: Joueur au trait ('R' ou 'J').
+    """
+    replay(game, [])
+    if "/" in position:
+        board = parse_board(position, game.rows, game.cols)
+        for col in range(game.cols):
+            for row in range(game.rows - 1, -1, -1):
+                if board[row][col] != " ":
+                    game.insert_token(col, board[row][col])
+        player = "R" if len(game.moves_played) % 2 == 0 else "J"
+    else:
+        player = "R"
+        for col in decode_moves(position):
+            if game.is_game_over() or not game.insert_token(col, player):
+                raise ValueError(f"Coup invalide dans la position : colonne {col + 1}")
+            player = "J" if player == "R" else "R"
+    if game.is_game_over():
+        raise ValueError("La partie est déjà terminée")
+    return player
+
+
+def analyse_position(
+    game, position, time_limit_ms=None, max_depth=None, fresh_table=False
+):
+    """
+    Cherche le meilleur coup d'une position avec un moteur déjà construit ; sa table de transposition
+    reste chaude d'une position à l'autre, si bien que les entrées laissées par les positions précédentes
+    peuvent faire varier le score (et le nombre de nœuds) selon l'ordre et la répartition des positions.
+    :param game: Instance de Puissance4 créée avec collect_stats, dont la difficulté est celle des deux joueurs.
+    :param position: Position en texte (suite de coups ou plateau, voir set_position).
+    :param time_limit_ms: Temps alloué à la recherche, en millisecondes (None pour aucune limite).
+    :param max_depth: Profondeur maximale de l'approfondissement itératif.
+    :param fresh_table: Vide la table et l'historique avant la recherche : sans limite de temps,
+                        le résultat ne dépend alors que de la position.
+    :return: Dictionnaire (position, best : colonne à partir de 1, score, depth et nodes de la dernière itération
+             terminée) ; score vaut None et depth 0 pour un coup du livre. En cas de position invalide,
+             dictionnaire (position, error).
+    """
+    try:
+        player = set_position(game, position)
+    except ValueError as error:
+        return {"position": position, "error": str(error)}
+    # Les coups de même score sont départagés de la même façon quel que soit le processus qui analyse la position
+    game.random.seed(position)
+    if fresh_table:
+        game.clear_search_state()
+    col = game.best_move(player, time_limit_ms=time_limit_ms, max_depth=max_depth)
+    stats = game.last_stats
+    depth = max(stats.depths) if stats is not None and stats.depths else 0
+    return {
+        "position": position,
+        "best": col + 1,
+        "score": stats.depths[depth]["score"] if depth else None,
+        "depth": depth,
+        "nodes": game.nodes if stats is not None else 0,
+    }
+
+
+# Moteur conservé par chaque processus d'analyse, créé une seule fois par init_analysis
+_worker_data = {}
+
+
+def init_analysis(config, time_limit_ms, max_depth, fresh_table=False):
+    """
+    Initialise un processus d'analyse : un seul moteur, et donc une seule table de transposition,
+    sert à toutes les positions que le processus reçoit.
+    :param config: Tuple (rows, cols, connect, difficulté, backend, tt_size_mb, chemin du livre ou None,
+                   paramètres d'évaluation ou None).
+    :param time_limit_ms: Temps alloué à chaque position, en millisecondes, ou None.
+    :param max_depth: Profondeur maximale de l'approfondissement itératif, ou None.
+    :param fresh_table: Vide la table avant chaque position (voir analyse_position).
+    """
+    rows, cols, connect, difficulty, backend, tt_size_mb, book_path, parameters = config
+    _worker_data.clear()
+    _worker_data["game"] = Puissance4(
+        rows=rows,
+        cols=cols,
+        connect=connect,
+        difficulty_R=difficulty,
+        difficulty_J=difficulty,
+        backend=backend,
+        tt_size_mb=tt_size_mb,
+        opening_book=open_book(book_path) if book_path else None,
+        collect_stats=True,
+        evaluation_parameters=parameters,
+    )
+    _worker_data["limits"] = (time_limit_ms, max_depth, fresh_table)
+
+
+def analyse_chunk(positions):
+    """
+    Analyse une tranche de positions avec le moteur du processus (voir init_analysis).
+    :param positions: Liste de positions en texte.
+    :return: Liste des résultats de analyse_position, dans le même ordre.
+    """
+    game = _worker_data["game"]
+    time_limit_ms, max_depth, fresh_table = _worker_data["limits"]
+    return [
+        analyse_position(game, position, time_limit_ms, max_depth, fresh_table)
+        for position in positions
+    ]
+
+
+def read_positions(lines):
+    """
+    Filtre un flux de lignes : les lignes vides et les commentaires ("#") sont ignorés.
+    :param lines: Itérable de lignes (fichier ouvert, sys.stdin...).
+    :return: Générateur des positions en texte.
+    """
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def format_result(result, as_json=False):
+    """
+    Met en forme un résultat sur une ligne : champs séparés par des tabulations (position, coup, score,
+    profondeur, nœuds ; "-" pour un score inconnu, "erreur" suivi du message pour une position invalide),
+    ou objet JSON.
+    :param result: Dictionnaire produit par analyse_position.
+    :param as_json: Produit une ligne JSON plutôt que des tabulations.
+    :return: Ligne, sans retour à la ligne final.
+    """
+    if as_json:
+        return json.dumps(result)
+    if "error" in result:
+        return f"{result['position']}\terreur\t{result['error']}"
+    score = "-" if result["score"] is None else f"{result['score']:g}"
+    return (
+        f"{result['position']}\t{result['best']}\t{score}\t"
+        f"{result['depth']}\t{result['nodes']}"
+    )
+
+
+def completed_lines(path):
+    """
+    Compte les résultats déjà écrits dans un fichier de sortie, pour reprendre une analyse interrompue.
+    Une dernière ligne incomplète (écriture interrompue) est tronquée.
+    :param path: Chemin du fichier de sortie.
+    :return: Nombre de lignes complètes (0 si le fichier n'existe pas).
+    """
+    if not os.path.exists(path):
+        return 0
+    count = 0
+    end = 0
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            count += 1
+            end += len(line)
+    if end != os.path.getsize(path):
+        os.truncate(path, end)
+    return count
+
+
+def output_format(path):
+    """
+    Reconnaît le format d'un fichier de résultats existant d'après sa première ligne.
+    :param path: Chemin du fichier de sortie.
+    :return: 'json', 'tsv', ou None si le fichier n'existe pas ou est vide.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as file:
+        first = file.readline()
+    if not first:
+        return None
+    return "json" if first.startswith(b"{") else "tsv"
+
+
+def analyse_positions(
+    positions,
+    output,
+    difficulty="medium",
+    time_limit_ms=None,
+    max_depth=None,
+    workers=1,
+    skip=0,
+    chunk_size=CHUNK_SIZE,
+    rows=6,
+    cols=7,
+    connect=4,
+    backend="bitboard",
+    tt_size_mb=16,
+    book_path=None,
+    evaluation_parameters=None,
+    as_json=False,
+    fresh_table=False,
+):
+    """
+    Analyse un flux de positions et écrit un résultat par position, dans l'ordre d'entrée.
+    Les positions sont lues à la demande et regroupées en tranches ; seules quelques tranches par processus
+    sont en cours à un instant donné, si bien que la mémoire reste bornée quelle que soit la taille de l'entrée.
+    La sortie est vidée après chaque tranche : une analyse interrompue reprend avec skip = completed_lines(sortie).
+    :param positions: Itérable de positions en texte (voir read_positions).
+    :param output: Flux d'écriture des résultats.
+    :param difficulty: Difficulté utilisée pour la recherche et l'évaluation.
+    :param time_limit_ms: Temps alloué à chaque position, en millisecondes (None pour aucune limite).
+    :param max_depth: Profondeur maximale de l'approfondissement itératif (sans limite ni profondeur, celle
+                      de la difficulté).
+    :param workers: Nombre de processus (1 pour analyser dans le processus courant, None pour tous les cœurs).
+    :param skip: Nombre de positions à sauter au début du flux (déjà analysées).
+    :param chunk_size: Nombre de positions par tâche du pool.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :param backend: Représentation interne du plateau.
+    :param tt_size_mb: Mémoire de la table de transposition de chaque processus, en mégaoctets.
+    :param book_path: Livre d'ouvertures à consulter (projeté en mémoire par chaque processus).
+    :param evaluation_parameters: Paramètres d'évaluation réglés (voir tune), ou None.
+    :param as_json: Écrit une ligne JSON par position plutôt que des champs séparés par des tabulations.
+    :param fresh_table: Vide la table de chaque processus avant chaque position : les résultats ne dépendent
+                        plus du nombre de processus ni d'une reprise (sauf avec une limite de temps).
+    :return: Nombre de positions analysées.
+    """
+    config = (
+        rows,
+        cols,
+        connect,
+        difficulty,
+        backend,
+        tt_size_mb,
+        book_path,
+        evaluation_parameters,
+    )
+    positions = iter(positions)
+    # Positions déjà analysées lors d'une exécution précédente
+    next(itertools.islice(positions, skip, skip), None)
+    chunks = iter(lambda: list(itertools.islice(positions, chunk_size)), [])
+    count = 0
+
+    def write(results):
+        nonlocal count
+        for result in results:
+            output.write(format_result(result, as_json) + "\n")
+        output.flush()
+        count += len(results)
+
+    if workers == 1:
+        init_analysis(config, time_limit_ms, max_depth, fresh_table)
+        for chunk in chunks:
+            write(analyse_chunk(chunk))
+        return count
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_analysis,
+        initargs=(config, time_limit_ms, max_depth, fresh_table),
+    )
+    try:
+        # Quelques tranches d'avance par processus ; les résultats sont dépilés dans l'ordre de soumission
+        in_flight = 2 * (workers or os.cpu_count())
+        futures = deque(
+            executor.submit(analyse_chunk, chunk)
+            for chunk in itertools.islice(chunks, in_flight)
+        )
+        while futures:
+            write(futures.popleft().result())
+            chunk = next(chunks, None)
+            if chunk is not None:
+                futures.append(executor.submit(analyse_chunk, chunk))
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return count
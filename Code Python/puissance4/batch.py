@@ -0,0 +1,118 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy n'est nécessaire que pour l'évaluation par lots
+    np = None
+
+from .engine import Puissance4
+
+# Codage des cases dans les tableaux de positions
+EMPTY = 0
+RED = 1
+YELLOW = 2
+CODES = {" ": EMPTY, "R": RED, "J": YELLOW}
+
+
+class BatchEvaluator:
+    def __init__(self, rows=6, cols=7, connect=4, evaluation_parameters=None):
+        """
+        Évalue de nombreux plateaux en un seul appel vectorisé avec NumPy, avec des scores identiques à evaluate_board
+        (représentation bitboard par défaut : sur un plateau où les deux joueurs sont alignés, le Rouge l'emporte).
+        Les fenêtres de connect cases sont précalculées sous forme d'indices.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        :param evaluation_parameters: Paramètres d'évaluation par difficulté (voir Puissance4), ou None.
+        """
+        if np is None:
+            raise ImportError(
+                "L'évaluation par lots nécessite NumPy (pip install numpy)"
+            )
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.game = Puissance4(
+            rows=rows,
+            cols=cols,
+            tt_size_mb=0,
+            connect=connect,
+            evaluation_parameters=evaluation_parameters,
+        )
+        self.evaluator = self.game.evaluator
+        self.windows = np.array(
+            [
+                [row * cols + col for row, col in window]
+                for window in self.evaluator.windows
+            ],
+            dtype=np.intp,
+        )
+        self.tables = {}
+
+    def table(self, difficulty):
+        """
+        Renvoie la table des scores de fenêtre [nb J][nb R] de la difficulté, sous forme de tableau NumPy.
+        :param difficulty: Difficulté utilisée pour l'évaluation.
+        :return: Tableau (connect + 1) x (connect + 1) d'entiers (de flottants pour des paramètres réglés).
+        """
+        if difficulty not in self.tables:
+            table = self.evaluator.build_table(difficulty)
+            integral = all(isinstance(score, int) for line in table for score in line)
+            self.tables[difficulty] = np.array(
+                table, dtype=np.int64 if integral else np.float64
+            )
+        return self.tables[difficulty]
+
+    def evaluate(self, boards, difficulty):
+        """
+        Évalue un lot de plateaux.
+        :param boards: Tableau (N, rows, cols) d'entiers : EMPTY, RED ou YELLOW.
+        :param difficulty: Niveau de difficulté utilisé pour ajuster l'évaluation.
+        :return: Tableau de N scores (flottants pour 'easy', entiers sinon), égaux à ceux d'evaluate_board.
+        """
+        boards = np.asarray(boards, dtype=np.int8)
+        cells = boards.reshape(len(boards), self.rows * self.cols)[:, self.windows]
+        count_J = (cells == YELLOW).sum(axis=2)
+        count_R = (cells == RED).sum(axis=2)
+
+        center_count = (boards[:, :, self.cols // 2] == YELLOW).sum(axis=1)
+        parameters = self.game.parameters(difficulty)
+        scores = center_count * parameters["center"]
+        scores = scores + self.table(difficulty)[count_J, count_R].sum(axis=1)
+        if parameters["scale"] != 1:
+            scores = scores * parameters["scale"]
+
+        # Le Rouge est testé avant le Jaune, comme dans BitBoard.check_winner
+        red_wins = (count_R == self.connect).any(axis=1)
+        yellow_wins = (count_J == self.connect).any(axis=1)
+        scores = np.where(yellow_wins, 1000, scores)
+        scores = np.where(red_wins, -1000, scores)
+        return scores
+
+    def evaluate_children(self, game, player, difficulty):
+        """
+        Évalue en un seul appel tous les plateaux obtenus en jouant chaque coup possible.
+        :param game: Instance de Puissance4 (non modifiée).
+        :param player: Joueur qui joue le coup ('R' ou 'J').
+        :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+        :return: Dictionnaire colonne -> score du plateau obtenu.
+        """
+        moves = game.generate_possible_moves()
+        children = np.repeat(encode_boards([game.board]), len(moves), axis=0)
+        for index, col in enumerate(moves):
+            column = children[index, :, col]
+            row = np.flatnonzero(column == EMPTY)[-1]
+            children[index, row, col] = CODES[player]
+        return dict(zip(moves, self.evaluate(children, difficulty).tolist()))
+
+
+def encode_boards(boards):
+    """
+    Convertit des plateaux au format de Puissance4.board (listes de ' ', 'R', 'J') en tableau NumPy.
+    :param boards: Liste de plateaux.
+    :return: Tableau (N, rows, cols) d'entiers int8.
+    """
+    if np is None:
+        raise ImportError("L'évaluation par lots nécessite NumPy (pip install numpy)")
+    return np.array(
+        [[[CODES[cell] for cell in row] for row in board] for board in boards],
+        dtype=np.int8,
+    )
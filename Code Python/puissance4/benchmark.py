@@ -0,0 +1,383 @@
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .book import replay
+from .engine import SEARCH_DEPTHS, Puissance4
+
+DIFFICULTIES = ["easy", "medium", "difficult"]
+# Nombre de jetons posés dans les positions de chaque phase du corpus
+PHASES = {"opening": (2, 8), "midgame": (12, 20), "endgame": (26, 34)}
+# Version du format des résultats, vérifiée par la comparaison
+FORMAT_VERSION = 1
+# Sens des métriques comparées, selon le suffixe de leur nom : 1 si elles doivent augmenter, -1 si elles doivent diminuer
+METRIC_DIRECTIONS = {"_per_s": 1, "_ms": -1, "bytes": -1}
+
+
+def build_corpus(seed=0, per_phase=8, rows=6, cols=7, connect=4):
+    """
+    Construit un corpus reproductible de positions non terminées, réparties en ouverture, milieu et fin de partie.
+    Les positions sont tirées de parties aléatoires jouées avec une graine fixe.
+    :param seed: Graine du générateur des parties.
+    :param per_phase: Nombre de positions par phase.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Dictionnaire phase -> liste de suites de coups (Rouge commence).
+    """
+    rng = random.Random(seed)
+    game = Puissance4(rows=rows, cols=cols, tt_size_mb=0, connect=connect)
+    corpus = {phase: [] for phase in PHASES}
+    for phase, (low, high) in PHASES.items():
+        high = min(high, rows * cols - 1)
+        while len(corpus[phase]) < per_phase:
+            target = rng.randint(min(low, high), high)
+            replay(game, [])
+            player = "R"
+            moves = []
+            while len(moves) < target and not game.is_game_over():
+                col = rng.choice(game.generate_possible_moves())
+                game.insert_token(col, player)
+                moves.append(col)
+                player = "J" if player == "R" else "R"
+            if len(moves) == target and not game.is_game_over():
+                corpus[phase].append(moves)
+    return corpus
+
+
+def load_games(
+    corpus, rows=6, cols=7, difficulty="medium", seed=0, tt_size_mb=16, connect=4
+):
+    """
+    Crée une partie par position du corpus.
+    :param corpus: Dictionnaire phase -> suites de coups.
+    :param difficulty: Difficulté des deux IA.
+    :param seed: Graine du générateur aléatoire des IA.
+    :param tt_size_mb: Mémoire de la table de transposition de chaque partie.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Liste de tuples (phase, partie, joueur au trait).
+    """
+    games = []
+    for phase, positions in corpus.items():
+        for moves in positions:
+            game = Puissance4(
+                rows=rows,
+                cols=cols,
+                difficulty_R=difficulty,
+                difficulty_J=difficulty,
+                tt_size_mb=tt_size_mb,
+                seed=seed,
+                connect=connect,
+            )
+            replay(game, moves)
+            games.append((phase, game, "R" if len(moves) % 2 == 0 else "J"))
+    return games
+
+
+def measure_rate(function, items, min_time):
+    """
+    Appelle une fonction sur chaque élément, en boucle, jusqu'à dépasser la durée minimale.
+    :param function: Fonction à mesurer, appelée avec un élément.
+    :param items: Éléments sur lesquels appeler la fonction.
+    :param min_time: Durée minimale de la mesure, en secondes.
+    :return: Nombre d'appels par seconde.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for item in items:
+            function(item)
+        calls += len(items)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def percentile(values, fraction):
+    """
+    Calcule un percentile par la méthode du rang le plus proche.
+    :param values: Valeurs mesurées.
+    :param fraction: Percentile voulu, entre 0 et 1.
+    :return: Valeur du percentile.
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def run_benchmarks(
+    seed=0, per_phase=8, repeat=3, min_time=0.5, rows=6, cols=7, connect=4
+):
+    """
+    Mesure le débit du moteur et la latence de best_move sur le corpus de positions.
+    :param seed: Graine du corpus et des IA.
+    :param per_phase: Nombre de positions par phase du corpus.
+    :param repeat: Nombre de mesures de best_move par position et par difficulté.
+    :param min_time: Durée minimale de chaque mesure de débit, en secondes.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Dictionnaire sérialisable en JSON : contexte de la mesure et métriques (nom -> valeur).
+    """
+    corpus = build_corpus(seed, per_phase, rows, cols, connect)
+    metrics = {}
+
+    games = [
+        game
+        for _, game, _ in load_games(corpus, rows, cols, tt_size_mb=0, connect=connect)
+    ]
+    metrics["check_winner.ops_per_s"] = measure_rate(
+        Puissance4.check_winner, games, min_time
+    )
+    metrics["is_game_over.ops_per_s"] = measure_rate(
+        Puissance4.is_game_over, games, min_time
+    )
+    for difficulty in DIFFICULTIES:
+        metrics[f"evaluate_board.{difficulty}.ops_per_s"] = measure_rate(
+            lambda game: game.evaluate_board(difficulty), games, min_time
+        )
+
+    for difficulty in DIFFICULTIES:
+        entries = load_games(corpus, rows, cols, difficulty, seed, connect=connect)
+        nodes = 0
+        start = time.perf_counter()
+        for _, game, player in entries:
+            game.nodes = 0
+            game.minimax(
+                SEARCH_DEPTHS[difficulty] - 1,
+                float("-inf"),
+                float("inf"),
+                player == "J",
+                difficulty,
+            )
+            nodes += game.nodes
+        metrics[f"minimax.{difficulty}.nodes_per_s"] = nodes / (
+            time.perf_counter() - start
+        )
+
+        latencies = {phase: [] for phase in corpus}
+        for phase, game, player in entries:
+            for _ in range(repeat):
+                # Chaque mesure part d'une table vide et de la même graine
+                game.clear_search_state()
+                game.random.seed(seed)
+                game.best_move(player)
+                latencies[phase].append(game.search_time * 1000)
+        every = [latency for values in latencies.values() for latency in values]
+        for phase, values in list(latencies.items()) + [("all", every)]:
+            prefix = f"best_move.{difficulty}.{phase}"
+            metrics[f"{prefix}.p50_ms"] = percentile(values, 0.5)
+            metrics[f"{prefix}.p99_ms"] = percentile(values, 0.99)
+
+    # Mémoire : table allouée, entrées occupées après une recherche, pic mesuré par tracemalloc
+    tracemalloc.start()
+    try:
+        _, game, player = load_games(
+            {"opening": corpus["opening"][:1]},
+            rows,
+            cols,
+            "difficult",
+            seed,
+            connect=connect,
+        )[0]
+        game.best_move(player)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    table = game.transposition_table
+    metrics["transposition_table.bytes"] = table.stats()["bytes"]
+    metrics["transposition_table.entries"] = sum(
+        1
+        for depths in (table.deep_depths, table.recent_depths)
+        for d in depths
+        if d >= 0
+    )
+    metrics["transposition_table.peak_bytes"] = peak
+
+    return {
+        "version": FORMAT_VERSION,
+        "context": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "per_phase": per_phase,
+            "repeat": repeat,
+            "rows": rows,
+            "cols": cols,
+            "connect": connect,
+        },
+        "metrics": metrics,
+    }
+
+
+def searched_game(moves, difficulty, seed=0, rows=6, cols=7, connect=4, **options):
+    """
+    Crée une partie placée sur une position, prête pour une mesure de best_move reproductible.
+    :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+    :param difficulty: Difficulté des deux IA.
+    :param seed: Graine du générateur aléatoire des IA (départage des coups de même score).
+    :param options: Autres paramètres de Puissance4 (move_ordering, search_workers...).
+    :return: Tuple (partie, joueur au trait).
+    """
+    game = Puissance4(
+        rows=rows,
+        cols=cols,
+        connect=connect,
+        difficulty_R=difficulty,
+        difficulty_J=difficulty,
+        seed=seed,
+        **options,
+    )
+    replay(game, moves)
+    return game, "R" if len(moves) % 2 == 0 else "J"
+
+
+def compare_move_ordering(
+    seed=0, per_phase=8, difficulties=("medium", "difficult"), rows=6, cols=7, connect=4
+):
+    """
+    Compare les nœuds visités et la durée de best_move avec et sans ordonnancement des coups sur le corpus.
+    :param seed: Graine du corpus et des IA.
+    :param per_phase: Nombre de positions par phase du corpus.
+    :param difficulties: Difficultés mesurées.
+    :return: Liste de dictionnaires (difficulty, phase, moves, puis nodes, time et col sans ordre
+             ('plain_nodes', 'plain_time', 'plain_col') et avec ordre).
+    """
+    corpus = build_corpus(seed, per_phase, rows, cols, connect)
+    results = []
+    for difficulty in difficulties:
+        for phase, positions in corpus.items():
+            for moves in positions:
+                entry = {"difficulty": difficulty, "phase": phase, "moves": moves}
+                for prefix, move_ordering in (("plain_", False), ("", True)):
+                    game, player = searched_game(
+                        moves,
+                        difficulty,
+                        seed,
+                        rows,
+                        cols,
+                        connect,
+                        move_ordering=move_ordering,
+                    )
+                    entry[f"{prefix}col"] = game.best_move(player)
+                    entry[f"{prefix}nodes"] = game.nodes
+                    entry[f"{prefix}time"] = game.search_time
+                results.append(entry)
+    return results
+
+
+def parallel_scaling(
+    max_workers=None,
+    difficulty="difficult",
+    seed=0,
+    per_phase=2,
+    rows=6,
+    cols=7,
+    connect=4,
+):
+    """
+    Mesure le passage à l'échelle de la recherche parallèle à la racine, de 1 à max_workers processus.
+    Les processus sont démarrés avant la mesure ; les coups choisis doivent être ceux de la recherche en série.
+    :param max_workers: Nombre maximal de processus (None pour tous les cœurs).
+    :param difficulty: Difficulté des deux IA.
+    :param seed: Graine du corpus et des IA.
+    :param per_phase: Nombre de positions par phase du corpus.
+    :return: Liste de dictionnaires (workers, nodes, time, nodes_per_s, cols), un par nombre de processus.
+    """
+    corpus = build_corpus(seed, per_phase, rows, cols, connect)
+    positions = [moves for moves_list in corpus.values() for moves in moves_list]
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count()) + 1):
+        nodes = 0
+        duration = 0.0
+        choices = []
+        for moves in positions:
+            game, player = searched_game(
+                moves, difficulty, seed, rows, cols, connect, search_workers=workers
+            )
+            if workers > 1:
+                # Démarre les processus avant la mesure
+                game.executor = ProcessPoolExecutor(max_workers=workers)
+                list(game.executor.map(abs, range(workers)))
+            try:
+                choices.append(game.best_move(player))
+            finally:
+                game.close()
+            nodes += game.nodes
+            duration += game.search_time
+        results.append(
+            {
+                "workers": workers,
+                "nodes": nodes,
+                "time": duration,
+                "nodes_per_s": nodes / duration,
+                "cols": choices,
+            }
+        )
+    return results
+
+
+def metric_direction(name):
+    """
+    Indique le sens d'une métrique d'après son suffixe : les débits doivent augmenter, les latences et la mémoire
+    diminuer ; les autres métriques (comme le nombre d'entrées occupées de la table) sont informatives.
+    :param name: Nom de la métrique.
+    :return: 1 pour une métrique à augmenter, -1 pour une métrique à diminuer, 0 pour une métrique informative.
+    """
+    for suffix, direction in METRIC_DIRECTIONS.items():
+        if name.endswith(suffix):
+            return direction
+    return 0
+
+
+def compare(current, baseline, tolerance=0.1):
+    """
+    Compare des résultats à une référence enregistrée.
+    :param current: Résultats de run_benchmarks.
+    :param baseline: Résultats de référence (même format).
+    :param tolerance: Dégradation relative tolérée avant de signaler une régression (0.1 pour 10 %).
+    :return: Liste de tuples (métrique, référence, valeur, rapport, régression), triée par nom ; les métriques
+             informatives n'y figurent pas (voir metric_direction).
+    """
+    if baseline.get("version") != current.get("version"):
+        raise ValueError("Format de référence incompatible")
+    rows = []
+    for name, value in sorted(current["metrics"].items()):
+        reference = baseline["metrics"].get(name)
+        direction = metric_direction(name)
+        if reference is None or not direction:
+            continue
+        ratio = value / reference if reference else 1.0
+        if direction > 0:
+            regression = ratio < 1 - tolerance
+        else:
+            regression = ratio > 1 + tolerance
+        rows.append((name, reference, value, ratio, regression))
+    return rows
+
+
+def load_results(path):
+    """
+    Lit des résultats enregistrés en JSON.
+    :param path: Chemin du fichier.
+    :return: Dictionnaire des résultats.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_results(results, path):
+    """
+    Enregistre des résultats en JSON, par exemple comme référence pour les prochaines comparaisons.
+    :param results: Résultats de run_benchmarks.
+    :param path: Chemin du fichier.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
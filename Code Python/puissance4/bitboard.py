@@ -0,0 +1,175 @@
+class BitBoard:
+    def __init__(self, rows=6, cols=7, connect=4):
+        """
+        Représentation du plateau par bitboards à la Pascal Pons : un entier par joueur et un masque des cases occupées.
+        Chaque colonne occupe rows + 1 bits (le bit supplémentaire sert de sentinelle), la case du bas étant le bit de poids faible.
+        Les entiers Python n'ayant pas de taille fixe, toutes les dimensions de plateau sont possibles.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.height = rows + 1
+        self.pieces = {"R": 0, "J": 0}
+        self.mask = 0
+        self.bottom_masks = [1 << (col * self.height) for col in range(cols)]
+        self.top_masks = [1 << (rows - 1 + col * self.height) for col in range(cols)]
+        self.column_masks = [
+            ((1 << rows) - 1) << (col * self.height) for col in range(cols)
+        ]
+        self.full_mask = sum(self.column_masks)
+        self.bottom_row = sum(self.bottom_masks)
+        # Décalages correspondant aux directions vertical, horizontal et aux deux diagonales
+        self.shifts = (1, self.height, self.height + 1, self.height - 1)
+
+    def can_play(self, col):
+        """
+        Indique si la colonne peut encore recevoir un jeton.
+        :param col: Index de la colonne.
+        :return: Booléen indiquant si la colonne n'est pas pleine.
+        """
+        return 0 <= col < self.cols and not self.mask & self.top_masks[col]
+
+    def play(self, col, player):
+        """
+        Joue un jeton dans la colonne spécifiée en O(1) grâce au masque des hauteurs.
+        :param col: Index de la colonne (supposée jouable).
+        :param player: 'R' pour Rouge ou 'J' pour Jaune.
+        :return: Index de la rangée (0 en haut) où le jeton a été posé.
+        """
+        move = (self.mask + self.bottom_masks[col]) & self.column_masks[col]
+        self.mask |= move
+        self.pieces[player] |= move
+        return self.rows - 1 - (move.bit_length() - 1 - col * self.height)
+
+    def undo(self, col):
+        """
+        Retire le jeton le plus haut de la colonne spécifiée en O(1).
+        :param col: Index de la colonne.
+        :return: Index de la rangée (0 en haut) libérée, ou None si la colonne est vide.
+        """
+        column = self.mask & self.column_masks[col]
+        if not column:
+            return None
+        move = 1 << (column.bit_length() - 1)
+        self.mask ^= move
+        self.pieces["R"] &= ~move
+        self.pieces["J"] &= ~move
+        return self.rows - 1 - (move.bit_length() - 1 - col * self.height)
+
+    def generate_possible_moves(self):
+        """
+        Génère la liste des colonnes jouables à partir du masque des hauteurs.
+        :return: Liste des indices de colonnes disponibles.
+        """
+        return [col for col in range(self.cols) if not self.mask & self.top_masks[col]]
+
+    def key(self):
+        """
+        Calcule une clé unique de la position : jetons Rouges plus masque des cases occupées.
+        Le bit sentinelle de chaque colonne absorbe la retenue, ce qui rend la clé sans collision.
+        :return: Entier identifiant la position (sur 64 bits pour le plateau standard).
+        """
+        return self.pieces["R"] + self.mask
+
+    def is_full(self):
+        """
+        Indique si toutes les cases du plateau sont occupées.
+        :return: Booléen indiquant si le plateau est plein.
+        """
+        return self.mask == self.full_mask
+
+    def has_won(self, player):
+        """
+        Détecte un alignement de connect jetons par décalages et ET binaires.
+        :param player: Joueur à tester.
+        :return: Booléen indiquant si le joueur a aligné connect jetons.
+        """
+        pieces = self.pieces[player]
+        if self.connect == 4:
+            for shift in self.shifts:
+                pairs = pieces & (pieces >> shift)
+                if pairs & (pairs >> (2 * shift)):
+                    return True
+            return False
+        for shift in self.shifts:
+            # runs : cases commençant une suite de length jetons ; la longueur double à chaque étape
+            runs = pieces
+            length = 1
+            while length < self.connect and runs:
+                step = min(length, self.connect - length)
+                runs &= runs >> (step * shift)
+                length += step
+            if runs:
+                return True
+        return False
+
+    def winning_cells(self, pieces, mask):
+        """
+        Calcule par décalages les cases vides qui compléteraient un alignement de connect jetons pour les jetons donnés.
+        :param pieces: Bitboard des jetons du joueur.
+        :param mask: Masque des cases occupées.
+        :return: Bitboard des cases vides gagnantes (jouables ou non).
+        """
+        if self.connect != 4:
+            return self.winning_cells_general(pieces, mask)
+        # Alignement vertical : seules les trois cases du dessous peuvent compléter la case
+        threats = (pieces << 1) & (pieces << 2) & (pieces << 3)
+        for shift in self.shifts[1:]:
+            pairs = (pieces << shift) & (pieces << (2 * shift))
+            threats |= pairs & (pieces << (3 * shift))
+            threats |= pairs & (pieces >> shift)
+            pairs = (pieces >> shift) & (pieces >> (2 * shift))
+            threats |= pairs & (pieces << shift)
+            threats |= pairs & (pieces >> (3 * shift))
+        return threats & (self.full_mask ^ mask)
+
+    def winning_cells_general(self, pieces, mask):
+        """
+        Version de winning_cells pour une longueur d'alignement quelconque : pour chaque direction et chaque place
+        de la case vide dans la fenêtre, on exige un jeton à toutes les autres places.
+        :param pieces: Bitboard des jetons du joueur.
+        :param mask: Masque des cases occupées.
+        :return: Bitboard des cases vides gagnantes (jouables ou non).
+        """
+        connect = self.connect
+        # Alignement vertical : seules les cases du dessous peuvent compléter la case
+        threats = self.full_mask
+        for offset in range(1, connect):
+            threats &= pieces << offset
+        for shift in self.shifts[1:]:
+            for empty in range(connect):
+                cells = self.full_mask
+                for index in range(connect):
+                    offset = (index - empty) * shift
+                    if offset > 0:
+                        cells &= pieces >> offset
+                    elif offset < 0:
+                        cells &= pieces << -offset
+                threats |= cells
+        return threats & (self.full_mask ^ mask)
+
+    def winning_moves(self, player):
+        """
+        Détermine les colonnes où le joueur compléterait immédiatement un alignement de connect jetons.
+        :param player: Joueur pour lequel chercher les coups gagnants.
+        :return: Liste des colonnes où le joueur gagne immédiatement.
+        """
+        threats = self.winning_cells(self.pieces[player], self.mask)
+        threats &= self.mask + self.bottom_row
+        if not threats:
+            return []
+        return [col for col in range(self.cols) if threats & self.column_masks[col]]
+
+    def check_winner(self):
+        """
+        Vérifie les bitboards pour déterminer si un joueur a gagné.
+        :return: Le joueur gagnant ('R' ou 'J') ou None si aucun gagnant.
+        """
+        if self.has_won("R"):
+            return "R"
+        if self.has_won("J"):
+            return "J"
+        return None
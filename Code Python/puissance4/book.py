@@ -0,0 +1,207 @@
+import functools
+import mmap
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import Puissance4
+
+# En-tête : signature, version, rangées, colonnes, alignement gagnant, nombre de sections (une par difficulté)
+HEADER = struct.Struct("<4sBBBBB")
+# Entrée de la table des sections : difficulté, nombre de positions, position des clés dans le fichier
+SECTION = struct.Struct("<16sII")
+MAGIC = b"P4BK"
+VERSION = 3
+
+
+class OpeningBook:
+    def __init__(self, path):
+        """
+        Ouvre un livre d'ouvertures en le projetant en mémoire (mmap) : les pages sont partagées entre processus
+        et seules celles consultées par la recherche dichotomique sont lues.
+        Chaque section contient les clés de position triées (entiers de 64 bits) suivies d'un octet de coup par clé.
+        Les clés et les coups sont ceux de l'orientation canonique de chaque position (voir Puissance4.canonical_key).
+        :param path: Chemin du fichier produit par write_book.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.cols, self.connect, count = HEADER.unpack_from(
+            self.data, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Fichier de livre d'ouvertures invalide : {path}")
+        self.sections = {}
+        for index in range(count):
+            name, size, offset = SECTION.unpack_from(
+                self.data, HEADER.size + index * SECTION.size
+            )
+            self.sections[name.rstrip(b"\0").decode()] = (size, offset)
+
+    def lookup(self, key, difficulty):
+        """
+        Recherche par dichotomie le coup mémorisé pour une position.
+        :param key: Clé canonique de la position (voir Puissance4.canonical_key).
+        :param difficulty: Difficulté pour laquelle le coup a été calculé.
+        :return: Index de la colonne à jouer, ou None si la position n'est pas dans le livre.
+        """
+        if difficulty not in self.sections:
+            return None
+        size, offset = self.sections[difficulty]
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            (current,) = struct.unpack_from("<Q", self.data, offset + 8 * middle)
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return self.data[offset + 8 * size + middle]
+        return None
+
+    def close(self):
+        """
+        Libère la projection en mémoire du fichier.
+        """
+        self.data.close()
+
+
+@functools.lru_cache(maxsize=None)
+def open_book(path):
+    """
+    Ouvre un livre d'ouvertures une seule fois par processus.
+    :param path: Chemin du fichier du livre.
+    :return: Instance d'OpeningBook partagée.
+    """
+    return OpeningBook(path)
+
+
+def write_book(path, rows, cols, entries, connect=4):
+    """
+    Écrit un livre d'ouvertures au format binaire compact lu par OpeningBook.
+    Les clés de position sont stockées sur 64 bits : le plateau doit compter au plus 64 bits de bitboard.
+    :param path: Chemin du fichier à écrire.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param entries: Dictionnaire difficulté -> dictionnaire clé de position -> colonne.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    """
+    if (rows + 1) * cols > 64:
+        raise ValueError(
+            f"Plateau {rows}x{cols} trop grand pour des clés de livre sur 64 bits"
+        )
+    offset = HEADER.size + len(entries) * SECTION.size
+    header = HEADER.pack(MAGIC, VERSION, rows, cols, connect, len(entries))
+    sections = []
+    payloads = []
+    for difficulty, moves in entries.items():
+        keys = sorted(moves)
+        sections.append(SECTION.pack(difficulty.encode(), len(keys), offset))
+        payloads.append(struct.pack(f"<{len(keys)}Q", *keys))
+        payloads.append(bytes(moves[key] for key in keys))
+        offset += 9 * len(keys)
+    with open(path, "wb") as file:
+        file.write(header)
+        file.writelines(sections)
+        file.writelines(payloads)
+
+
+def enumerate_positions(plies, rows=6, cols=7, connect=4):
+    """
+    Énumère les positions distinctes et non terminées atteignables en moins de plies demi-coups (Rouge commence),
+    une seule par paire de positions symétriques lorsque l'évaluation est symétrique.
+    :param plies: Nombre de demi-coups couverts par le livre.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Liste de suites de coups, une par position, par nombre de jetons croissant.
+    """
+    game = Puissance4(rows=rows, cols=cols, tt_size_mb=0, connect=connect)
+    positions = []
+    frontier = [[]]
+    for ply in range(plies):
+        positions.extend(frontier)
+        player = "R" if ply % 2 == 0 else "J"
+        following = {}
+        for moves in frontier:
+            replay(game, moves)
+            for col in game.generate_possible_moves():
+                game.insert_token(col, player)
+                key, _ = game.canonical_key()
+                if key not in following and not game.is_game_over():
+                    following[key] = moves + [col]
+                game.undo_move(col)
+            replay(game, [])
+        frontier = list(following.values())
+    return positions
+
+
+def replay(game, moves):
+    """
+    Ramène la partie au plateau vide puis rejoue la suite de coups donnée (Rouge commence).
+    :param game: Instance de Puissance4 à repositionner.
+    :param moves: Colonnes jouées depuis le plateau vide.
+    """
+    for col in reversed(list(game.moves_played)):
+        game.undo_move(col)
+    player = "R"
+    for col in moves:
+        game.insert_token(col, player)
+        player = "J" if player == "R" else "R"
+
+
+def book_move(rows, cols, difficulty, moves, connect=4):
+    """
+    Calcule avec minimax le coup du livre pour une position ; fonction de module pour être exécutée dans un processus séparé.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param difficulty: Difficulté (profondeur et évaluation) utilisée pour la recherche.
+    :param moves: Colonnes jouées depuis le plateau vide.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Tuple (clé canonique de la position, colonne choisie dans l'orientation canonique).
+    """
+    game = Puissance4(
+        rows=rows,
+        cols=cols,
+        connect=connect,
+        difficulty_R=difficulty,
+        difficulty_J=difficulty,
+        tt_size_mb=4,
+        seed=0,
+    )
+    replay(game, moves)
+    player = "R" if len(moves) % 2 == 0 else "J"
+    key, mirrored = game.canonical_key()
+    col = game.best_move(player)
+    return key, cols - 1 - col if mirrored else col
+
+
+def build_book(path, plies=4, difficulties=None, rows=6, cols=7, workers=1, connect=4):
+    """
+    Précalcule hors ligne les meilleurs coups de toutes les positions des premiers demi-coups et les écrit dans un livre.
+    :param path: Chemin du fichier à écrire.
+    :param plies: Nombre de demi-coups couverts par le livre.
+    :param difficulties: Difficultés pour lesquelles calculer les coups (toutes par défaut).
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param workers: Nombre de processus de calcul (1 pour calculer en série, None pour tous les cœurs).
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Nombre de positions par difficulté.
+    """
+    if difficulties is None:
+        difficulties = ["easy", "medium", "difficult"]
+    positions = enumerate_positions(plies, rows, cols, connect)
+    entries = {}
+    for difficulty in difficulties:
+        arguments = ([rows] * len(positions), [cols] * len(positions))
+        arguments += ([difficulty] * len(positions), positions)
+        arguments += ([connect] * len(positions),)
+        if workers == 1:
+            results = map(book_move, *arguments)
+            entries[difficulty] = dict(results)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(book_move, *arguments, chunksize=16)
+                entries[difficulty] = dict(results)
+    write_book(path, rows, cols, entries, connect)
+    return {difficulty: len(moves) for difficulty, moves in entries.items()}
@@ -0,0 +1,767 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from .analysis import (
+    analyse_positions,
+    completed_lines,
+    output_format,
+    read_positions,
+)
+from .benchmark import (
+    compare,
+    compare_move_ordering,
+    load_results,
+    parallel_scaling,
+    run_benchmarks,
+    save_results,
+)
+from .book import build_book, open_book
+from .encoding import decode_moves
+from .engine import Puissance4
+from .match import parse_engine, run_match
+from .records import GameRecordWriter
+from .server import GameServer
+from .solver import Solver
+from .stats import SearchStats
+from .tuning import Tuner, labelled_positions, load_parameters, save_parameters
+
+DIFFICULTIES = ["easy", "medium", "difficult"]
+# Difficultés sans évaluation propre : solveur exact et recherche Monte-Carlo
+SEARCH_ENGINES = ["perfect", "mcts"]
+
+
+def parse_position(position):
+    """
+    Convertit une suite de colonnes jouées (chiffres de 1 à 9 puis lettres, Rouge commence) en liste d'indices de colonnes.
+    :param position: Chaîne telle que "4453".
+    :return: Liste des indices de colonnes (à partir de 0).
+    """
+    try:
+        return decode_moves(position)
+    except ValueError as error:
+        raise SystemExit(str(error))
+
+
+def command_gui(args):
+    """
+    Lance le menu principal graphique (Tkinter n'est importé qu'ici).
+    """
+    from .gui import main as gui_main
+
+    gui_main(args.rows, args.cols, args.connect)
+
+
+def command_tournament(args):
+    """
+    Lance un tournoi entre les difficultés et affiche les résultats.
+    """
+    game = Puissance4(
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+        backend=args.backend,
+        opening_book=open_book(args.book) if args.book else None,
+        mcts_iterations=args.mcts_iterations,
+    )
+    recorder = None
+    if args.record:
+        recorder = GameRecordWriter(args.record, args.rows, args.cols, args.connect)
+    try:
+        results = game.tournament(
+            num_games=args.games,
+            workers=args.workers,
+            seed=args.seed,
+            profile=args.profile,
+            recorder=recorder,
+            difficulties=args.difficulties,
+            shared_tt_mb=args.shared_tt,
+        )
+    finally:
+        if recorder is not None:
+            recorder.close()
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for difficulty, opponents in results.items():
+        for opponent, result in opponents.items():
+            print(
+                f"{difficulty} contre {opponent} : {result['wins']} victoires, "
+                f"{result['losses']} défaites, {result['draws']} nuls "
+                f"({result['moves']} coups, {result['time']:.2f}s, "
+                f"réflexion {result['cpu_time']:.2f}s CPU)"
+            )
+    if args.profile:
+        print("Statistiques de recherche par difficulté :")
+        for difficulty, opponents in results.items():
+            total = SearchStats(True)
+            for result in opponents.values():
+                total.merge(SearchStats.from_dict(result["stats"]))
+            print(f"  {difficulty} : {total.searches} recherches, {total.summary()}")
+            for depth, entry in sorted(total.depths.items()):
+                print(
+                    f"    profondeur {depth} : {entry['nodes']} nœuds, "
+                    f"{entry['time']:.2f}s"
+                )
+
+
+def command_bestmove(args):
+    """
+    Calcule le meilleur coup pour une position donnée par la suite des colonnes jouées.
+    """
+    solver = Solver(args.rows, args.cols, connect=args.connect)
+    if args.solver_table:
+        # Vérifié avant la recherche, pour ne pas perdre la table calculée au moment de l'enregistrer
+        try:
+            solver.check_table_format()
+        except ValueError as error:
+            raise SystemExit(str(error))
+        if os.path.exists(args.solver_table):
+            solver.load(args.solver_table)
+    game = Puissance4(
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+        difficulty_R=args.difficulty,
+        difficulty_J=args.difficulty,
+        backend=args.backend,
+        seed=args.seed,
+        opening_book=open_book(args.book) if args.book else None,
+        solver=solver,
+        solver_threshold=args.solver_threshold,
+        mcts_iterations=args.mcts_iterations,
+        evaluation_parameters=(
+            load_parameters(args.parameters) if args.parameters else None
+        ),
+    )
+    player = "R"
+    for col in parse_position(args.position):
+        if game.is_game_over() or not game.insert_token(col, player):
+            raise SystemExit(f"Coup invalide dans la position : colonne {col + 1}")
+        player = "J" if player == "R" else "R"
+    if game.is_game_over():
+        raise SystemExit("La partie est déjà terminée")
+    if args.solve:
+        print(game.solve(player))
+    else:
+        col = game.best_move(
+            player, time_limit_ms=args.time_limit, max_depth=args.max_depth
+        )
+        print(col + 1)
+    if args.solver_table:
+        solver.save(args.solver_table)
+
+
+def command_book(args):
+    """
+    Construit hors ligne le livre d'ouvertures.
+    """
+    counts = build_book(
+        args.output,
+        plies=args.plies,
+        difficulties=args.difficulties,
+        rows=args.rows,
+        cols=args.cols,
+        workers=args.workers,
+        connect=args.connect,
+    )
+    for difficulty, count in counts.items():
+        print(f"{difficulty} : {count} positions")
+
+
+def command_bench(args):
+    """
+    Lance les mesures de performance et les compare éventuellement à une référence enregistrée.
+    Le code de sortie vaut 1 si une régression dépasse la tolérance, pour bloquer un changement du moteur.
+    Les suites 'ordering' et 'parallel' comparent l'ordonnancement des coups et le passage à l'échelle
+    de la recherche parallèle.
+    """
+    if args.suite == "ordering":
+        command_bench_ordering(args)
+        return
+    if args.suite == "parallel":
+        command_bench_parallel(args)
+        return
+    results = run_benchmarks(
+        seed=args.seed,
+        per_phase=args.positions,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+    )
+    if args.output:
+        save_results(results, args.output)
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    if not args.baseline:
+        if not args.json:
+            for name, value in sorted(results["metrics"].items()):
+                print(f"{name:45} {value:14.2f}")
+        return
+    regressions = 0
+    for name, reference, value, ratio, regression in compare(
+        results, load_results(args.baseline), args.tolerance
+    ):
+        regressions += regression
+        marker = "RÉGRESSION" if regression else ""
+        print(f"{name:45} {reference:14.2f} -> {value:14.2f} (x{ratio:.2f}) {marker}")
+    if regressions:
+        raise SystemExit(1)
+
+
+def command_bench_ordering(args):
+    """
+    Compare les nœuds visités par best_move avec et sans ordonnancement des coups.
+    """
+    results = compare_move_ordering(
+        seed=args.seed,
+        per_phase=args.positions,
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for entry in results:
+        print(
+            f"{entry['difficulty']:10} {entry['phase']:8} "
+            f"sans ordre: {entry['plain_nodes']:7} nœuds {entry['plain_time']:6.3f}s"
+            f" | avec ordre: {entry['nodes']:7} nœuds {entry['time']:6.3f}s"
+            f" | x{entry['plain_nodes'] / entry['nodes']:.1f}"
+            f" (coups {entry['plain_col']}/{entry['col']})"
+        )
+
+
+def command_bench_parallel(args):
+    """
+    Mesure le débit de la recherche parallèle à la racine selon le nombre de processus.
+    """
+    results = parallel_scaling(
+        max_workers=args.workers,
+        difficulty=args.difficulty,
+        seed=args.seed,
+        per_phase=args.positions,
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    base_rate = results[0]["nodes_per_s"]
+    for entry in results:
+        print(
+            f"{entry['workers']:2} processus : {entry['nodes']:8} nœuds en "
+            f"{entry['time']:6.3f}s, {entry['nodes_per_s']:9.0f} nœuds/s "
+            f"(x{entry['nodes_per_s'] / base_rate:.2f}), coups {entry['cols']}"
+        )
+
+
+def command_match(args):
+    """
+    Compare deux configurations de moteur par un match arrêté dès que le SPRT conclut.
+    """
+
+    def progress(result):
+        games = result["wins"] + result["draws"] + result["losses"]
+        print(
+            f"{games} parties : +{result['wins']} ={result['draws']} -{result['losses']}, "
+            f"Elo {result['elo']:+.1f} [{result['elo_low']:+.1f}, {result['elo_high']:+.1f}], "
+            f"LLR {result['llr']:.2f} [{result['bounds'][0]:.2f}, {result['bounds'][1]:.2f}]"
+        )
+
+    try:
+        first = parse_engine(args.first)
+        second = parse_engine(args.second)
+    except ValueError as error:
+        raise SystemExit(str(error))
+    result = run_match(
+        first,
+        second,
+        elo0=args.elo0,
+        elo1=args.elo1,
+        alpha=args.alpha,
+        beta=args.beta,
+        max_pairs=args.max_pairs,
+        workers=args.workers,
+        seed=args.seed,
+        opening_plies=args.opening_plies,
+        time_limit_ms=args.time_limit,
+        rows=args.rows,
+        cols=args.cols,
+        connect=args.connect,
+        backend=args.backend,
+        book_path=args.book,
+        mcts_iterations=args.mcts_iterations,
+        callback=None if args.json else progress,
+        first_parameters=(
+            load_parameters(args.first_parameters).get(first[0])
+            if args.first_parameters
+            else None
+        ),
+        second_parameters=(
+            load_parameters(args.second_parameters).get(second[0])
+            if args.second_parameters
+            else None
+        ),
+    )
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    if result["decision"] == "H1":
+        print(f"{args.first} est plus fort que {args.second} (H1 acceptée)")
+    elif result["decision"] == "H0":
+        print(f"{args.first} n'est pas plus fort que {args.second} (H0 acceptée)")
+    else:
+        print("Le test n'a pas conclu dans le nombre de paires imparti")
+
+
+def command_tune(args):
+    """
+    Règle les paramètres d'évaluation d'une difficulté sur les positions d'un fichier de parties.
+    """
+    geometry, positions = labelled_positions(
+        args.records, skip_plies=args.skip_plies, limit=args.limit
+    )
+    if not positions:
+        raise SystemExit(f"Aucune position exploitable dans {args.records}")
+    tuner = Tuner(
+        geometry,
+        positions,
+        difficulty=args.difficulty,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        checkpoint=args.checkpoint,
+    )
+    print(f"{len(positions)} positions, reprise à l'itération {tuner.iteration}")
+
+    def progress(iteration, loss, parameters):
+        values = ", ".join(f"{name}={parameters[name]:.3f}" for name in tuner.names)
+        print(f"itération {iteration} : perte {loss:.6f} ({values})")
+
+    parameters = tuner.run(args.iterations, callback=progress)
+    save_parameters(args.output, args.difficulty, parameters)
+    print(f"Paramètres enregistrés dans {args.output}")
+
+
+def command_serve(args):
+    """
+    Lance le serveur de parties (JSON ligne par ligne sur TCP) jusqu'à interruption.
+    """
+    server = GameServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        max_games=args.max_games,
+        default_time_ms=args.time_limit,
+        book_path=args.book,
+    )
+    print(f"Serveur à l'écoute sur {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def command_analyze(args):
+    """
+    Analyse un fichier de positions (ou l'entrée standard) et écrit un résultat par position, dans l'ordre.
+    """
+    if args.resume and not args.output:
+        raise SystemExit("--resume demande un fichier de sortie (--output)")
+    if args.resume:
+        existing = output_format(args.output)
+        requested = "json" if args.json else "tsv"
+        if existing is not None and existing != requested:
+            raise SystemExit(
+                f"{args.output} contient des résultats au format {existing} : "
+                f"reprise impossible au format {requested}"
+            )
+    skip = completed_lines(args.output) if args.resume else 0
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = (
+        open(args.output, "a" if args.resume else "w", encoding="utf-8")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        count = analyse_positions(
+            read_positions(source),
+            output,
+            difficulty=args.difficulty,
+            time_limit_ms=args.time_limit,
+            max_depth=args.max_depth,
+            workers=args.workers,
+            skip=skip,
+            chunk_size=args.chunk_size,
+            rows=args.rows,
+            cols=args.cols,
+            connect=args.connect,
+            backend=args.backend,
+            tt_size_mb=args.tt_size,
+            book_path=args.book,
+            evaluation_parameters=(
+                load_parameters(args.parameters) if args.parameters else None
+            ),
+            as_json=args.json,
+            fresh_table=args.fresh_table,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    if args.output:
+        print(f"{count} positions analysées ({skip} reprises) dans {args.output}")
+
+
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande : python -m puissance4 [gui|tournament|bestmove|book|bench|match|tune|serve|analyze].
+    :param argv: Arguments de la ligne de commande (None pour sys.argv).
+    """
+    parser = argparse.ArgumentParser(
+        prog="puissance4", description="Puissance 4 avec IA Minimax"
+    )
+    parser.add_argument("--rows", type=int, default=6, help="Nombre de rangées")
+    parser.add_argument("--cols", type=int, default=7, help="Nombre de colonnes")
+    parser.add_argument(
+        "--connect", type=int, default=4, help="Nombre de jetons à aligner"
+    )
+    parser.add_argument("--backend", choices=["bitboard", "list"], default="bitboard")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("gui", help="Menu principal graphique (par défaut)")
+
+    tournament = subparsers.add_parser("tournament", help="Tournoi entre difficultés")
+    tournament.add_argument(
+        "--games", type=int, default=5, help="Parties par paire de difficultés"
+    )
+    tournament.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Nombre de processus (0 pour tous les cœurs)",
+    )
+    tournament.add_argument(
+        "--seed", type=int, default=0, help="Graine de base des parties"
+    )
+    tournament.add_argument(
+        "--json", action="store_true", help="Affiche les résultats détaillés en JSON"
+    )
+    tournament.add_argument("--book", help="Livre d'ouvertures à consulter")
+    tournament.add_argument(
+        "--profile",
+        action="store_true",
+        help="Agrège et affiche les statistiques de recherche des parties",
+    )
+    tournament.add_argument(
+        "--record", help="Fichier de parties où ajouter les parties jouées"
+    )
+    tournament.add_argument(
+        "--difficulties",
+        nargs="+",
+        choices=DIFFICULTIES + SEARCH_ENGINES,
+        default=DIFFICULTIES,
+        help="Difficultés en compétition",
+    )
+    tournament.add_argument(
+        "--mcts-iterations",
+        type=int,
+        default=2000,
+        help="Simulations par coup de la difficulté 'mcts'",
+    )
+    tournament.add_argument(
+        "--shared-tt",
+        type=float,
+        default=None,
+        help="Table de transposition partagée entre toutes les parties, en mégaoctets",
+    )
+
+    bestmove = subparsers.add_parser("bestmove", help="Meilleur coup pour une position")
+    bestmove.add_argument(
+        "--position",
+        default="",
+        help="Colonnes jouées depuis le plateau vide, de 1 à 9 puis a, b... (ex. 4453)",
+    )
+    bestmove.add_argument(
+        "--difficulty", choices=DIFFICULTIES + SEARCH_ENGINES, default="medium"
+    )
+    bestmove.add_argument(
+        "--time-limit", type=int, default=None, help="Temps alloué en millisecondes"
+    )
+    bestmove.add_argument(
+        "--max-depth", type=int, default=None, help="Profondeur maximale"
+    )
+    bestmove.add_argument(
+        "--seed", type=int, default=None, help="Graine pour départager les coups égaux"
+    )
+
+    bestmove.add_argument("--book", help="Livre d'ouvertures à consulter")
+    bestmove.add_argument(
+        "--solve", action="store_true", help="Affiche la valeur exacte de la position"
+    )
+    bestmove.add_argument(
+        "--solver-threshold",
+        type=int,
+        default=18,
+        help="Cases vides à partir desquelles 'perfect' résout exactement",
+    )
+    bestmove.add_argument(
+        "--solver-table", help="Table du solveur à charger puis enregistrer"
+    )
+    bestmove.add_argument(
+        "--parameters", help="Fichier de paramètres d'évaluation réglés (voir tune)"
+    )
+    bestmove.add_argument(
+        "--mcts-iterations",
+        type=int,
+        default=2000,
+        help="Simulations de la difficulté 'mcts' sans limite de temps",
+    )
+
+    book = subparsers.add_parser("book", help="Construction du livre d'ouvertures")
+    book.add_argument("--output", default="book.bin", help="Fichier à écrire")
+    book.add_argument("--plies", type=int, default=4, help="Demi-coups couverts")
+    book.add_argument(
+        "--difficulties", nargs="+", choices=DIFFICULTIES, default=DIFFICULTIES
+    )
+    book.add_argument(
+        "--workers", type=int, default=1, help="Nombre de processus (0 pour tous)"
+    )
+
+    bench = subparsers.add_parser("bench", help="Mesures de performance du moteur")
+    bench.add_argument(
+        "--suite",
+        choices=["engine", "ordering", "parallel"],
+        default="engine",
+        help="Mesures du moteur, ordonnancement des coups ou recherche parallèle",
+    )
+    bench.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processus au maximum pour la suite parallel (0 pour tous les cœurs)",
+    )
+    bench.add_argument(
+        "--difficulty",
+        choices=DIFFICULTIES,
+        default="difficult",
+        help="Difficulté de la suite parallel",
+    )
+    bench.add_argument("--seed", type=int, default=0, help="Graine du corpus")
+    bench.add_argument(
+        "--positions", type=int, default=8, help="Positions par phase de partie"
+    )
+    bench.add_argument(
+        "--repeat", type=int, default=3, help="Mesures de best_move par position"
+    )
+    bench.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="Durée minimale de chaque mesure de débit (s)",
+    )
+    bench.add_argument("--output", help="Fichier JSON où enregistrer les résultats")
+    bench.add_argument("--baseline", help="Résultats de référence à comparer")
+    bench.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Dégradation relative tolérée (0.1 pour 10 %%)",
+    )
+    bench.add_argument(
+        "--json", action="store_true", help="Affiche les résultats en JSON"
+    )
+
+    match = subparsers.add_parser(
+        "match", help="Match entre deux configurations, arrêté par un SPRT"
+    )
+    match.add_argument(
+        "first", help="Configuration évaluée : difficulté[:profondeur] (ex. medium:5)"
+    )
+    match.add_argument("second", help="Configuration de référence")
+    match.add_argument(
+        "--elo0", type=float, default=0.0, help="Écart d'Elo de l'hypothèse H0"
+    )
+    match.add_argument(
+        "--elo1", type=float, default=50.0, help="Écart d'Elo de l'hypothèse H1"
+    )
+    match.add_argument(
+        "--alpha", type=float, default=0.05, help="Risque d'accepter H1 à tort"
+    )
+    match.add_argument(
+        "--beta", type=float, default=0.05, help="Risque d'accepter H0 à tort"
+    )
+    match.add_argument(
+        "--max-pairs", type=int, default=500, help="Nombre maximal de paires de parties"
+    )
+    match.add_argument(
+        "--workers", type=int, default=1, help="Nombre de processus (0 pour tous)"
+    )
+    match.add_argument(
+        "--seed", type=int, default=0, help="Graine des ouvertures et des parties"
+    )
+    match.add_argument(
+        "--opening-plies", type=int, default=3, help="Demi-coups des ouvertures"
+    )
+    match.add_argument(
+        "--time-limit", type=int, default=None, help="Temps par coup en millisecondes"
+    )
+    match.add_argument("--book", help="Livre d'ouvertures à consulter")
+    match.add_argument(
+        "--mcts-iterations",
+        type=int,
+        default=2000,
+        help="Simulations par coup de la difficulté 'mcts'",
+    )
+    match.add_argument(
+        "--first-parameters",
+        help="Paramètres d'évaluation réglés de la configuration évaluée",
+    )
+    match.add_argument(
+        "--second-parameters", help="Paramètres d'évaluation réglés de la référence"
+    )
+    match.add_argument(
+        "--json", action="store_true", help="Affiche le résultat final en JSON"
+    )
+
+    tune = subparsers.add_parser(
+        "tune", help="Réglage automatique des paramètres d'évaluation"
+    )
+    tune.add_argument(
+        "records", help="Fichier de parties (voir tournament --record) à exploiter"
+    )
+    tune.add_argument(
+        "--difficulty", choices=DIFFICULTIES, default="medium", help="Profil à régler"
+    )
+    tune.add_argument("--iterations", type=int, default=100, help="Itérations du SPSA")
+    tune.add_argument(
+        "--workers", type=int, default=1, help="Nombre de processus (0 pour tous)"
+    )
+    tune.add_argument(
+        "--chunk-size", type=int, default=2000, help="Positions par tâche du pool"
+    )
+    tune.add_argument(
+        "--skip-plies", type=int, default=4, help="Demi-coups ignorés par partie"
+    )
+    tune.add_argument(
+        "--limit", type=int, default=None, help="Nombre maximal de positions"
+    )
+    tune.add_argument("--seed", type=int, default=0, help="Graine des perturbations")
+    tune.add_argument(
+        "--checkpoint", help="Fichier d'état à reprendre et mettre à jour"
+    )
+    tune.add_argument(
+        "--output", default="parameters.json", help="Fichier de paramètres à écrire"
+    )
+
+    serve = subparsers.add_parser("serve", help="Serveur de parties sur TCP")
+    serve.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute")
+    serve.add_argument("--port", type=int, default=8765, help="Port d'écoute")
+    serve.add_argument(
+        "--workers", type=int, default=0, help="Processus de recherche (0 pour tous)"
+    )
+    serve.add_argument(
+        "--max-queue",
+        type=int,
+        default=64,
+        help="Recherches en attente au-delà desquelles les requêtes sont refusées",
+    )
+    serve.add_argument(
+        "--max-games", type=int, default=1000, help="Parties ouvertes au maximum"
+    )
+    serve.add_argument(
+        "--time-limit",
+        type=int,
+        default=1000,
+        help="Temps alloué par défaut à un coup de l'IA, en millisecondes",
+    )
+    serve.add_argument("--book", help="Livre d'ouvertures partagé par les processus")
+
+    analyze = subparsers.add_parser(
+        "analyze",
+        help="Analyse en série d'un fichier de positions",
+        description="Analyse en série d'un fichier de positions. Chaque processus garde sa table de "
+        "transposition d'une position à l'autre : les scores, profondeurs et nœuds peuvent donc varier "
+        "avec --workers, --chunk-size ou une reprise (--resume), sauf avec --fresh-table sans --time-limit.",
+    )
+    analyze.add_argument(
+        "input",
+        help="Fichier de positions, une par ligne : coups joués (ex. 4453) ou plateau "
+        'en rangées séparées par des "/" ; "-" pour l\'entrée standard',
+    )
+    analyze.add_argument(
+        "--output", help="Fichier des résultats (sortie standard par défaut)"
+    )
+    analyze.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reprend une analyse interrompue là où s'arrête le fichier de sortie",
+    )
+    analyze.add_argument("--difficulty", choices=DIFFICULTIES, default="medium")
+    analyze.add_argument(
+        "--time-limit",
+        type=int,
+        default=None,
+        help="Temps alloué à chaque position, en millisecondes",
+    )
+    analyze.add_argument(
+        "--max-depth", type=int, default=None, help="Profondeur maximale"
+    )
+    analyze.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Nombre de processus (0 pour tous les cœurs)",
+    )
+    analyze.add_argument(
+        "--chunk-size", type=int, default=64, help="Positions par tâche du pool"
+    )
+    analyze.add_argument(
+        "--tt-size",
+        type=int,
+        default=16,
+        help="Table de transposition de chaque processus, en mégaoctets",
+    )
+    analyze.add_argument("--book", help="Livre d'ouvertures à consulter")
+    analyze.add_argument(
+        "--parameters", help="Fichier de paramètres d'évaluation réglés (voir tune)"
+    )
+    analyze.add_argument(
+        "--json", action="store_true", help="Écrit une ligne JSON par position"
+    )
+    analyze.add_argument(
+        "--fresh-table",
+        action="store_true",
+        help="Vide la table avant chaque position : résultats reproductibles, recherche plus lente",
+    )
+
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        args.workers = None
+    if args.command == "tournament":
+        command_tournament(args)
+    elif args.command == "bestmove":
+        command_bestmove(args)
+    elif args.command == "book":
+        command_book(args)
+    elif args.command == "bench":
+        command_bench(args)
+    elif args.command == "match":
+        command_match(args)
+    elif args.command == "tune":
+        command_tune(args)
+    elif args.command == "serve":
+        command_serve(args)
+    elif args.command == "analyze":
+        command_analyze(args)
+    else:
+        command_gui(args)
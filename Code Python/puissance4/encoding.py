@@ -0,0 +1,85 @@
+# Caractère de chaque colonne dans les suites de coups : "1" pour la première, comme sur la ligne de commande
+MOVE_CHARS = "123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def encode_moves(moves):
+    """
+    Encode une suite de coups en chaîne compacte, un caractère par coup (ex. [3, 3, 4] -> "445").
+    :param moves: Colonnes jouées depuis le plateau vide (index à partir de 0).
+    :return: Chaîne de la suite de coups.
+    """
+    return "".join(MOVE_CHARS[col] for col in moves)
+
+
+def decode_moves(text):
+    """
+    Décode une suite de coups produite par encode_moves (les majuscules sont acceptées).
+    :param text: Chaîne de la suite de coups.
+    :return: Liste des indices de colonnes (à partir de 0).
+    """
+    moves = []
+    for char in text.strip().lower():
+        col = MOVE_CHARS.find(char)
+        if col < 0:
+            raise ValueError(f"Coup invalide dans la suite : {char!r}")
+        moves.append(col)
+    return moves
+
+
+def board_to_key(board):
+    """
+    Calcule la clé compacte d'un plateau (jetons Rouges plus masque des cases occupées, voir BitBoard.key).
+    Sur le plateau standard, la clé tient sur 64 bits.
+    :param board: Plateau sous forme de liste de rangées (0 en haut) de " ", "R" ou "J".
+    :return: Entier identifiant la position.
+    """
+    rows = len(board)
+    red = mask = 0
+    for col in range(len(board[0])):
+        for row in range(rows):
+            if board[row][col] != " ":
+                bit = 1 << (col * (rows + 1) + rows - 1 - row)
+                mask |= bit
+                if board[row][col] == "R":
+                    red |= bit
+    return red + mask
+
+
+def mirror_key(key, rows=6, cols=7):
+    """
+    Calcule la clé compacte de la position symétrique (colonnes inversées de gauche à droite).
+    Chaque colonne occupe rows + 1 bits de la clé sans retenue vers la suivante : il suffit de permuter ces blocs.
+    :param key: Clé produite par board_to_key, Puissance4.position_key ou BitBoard.key.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Clé de la position symétrique.
+    """
+    height = rows + 1
+    column = (1 << height) - 1
+    mirrored = 0
+    for col in range(cols):
+        mirrored |= ((key >> (col * height)) & column) << ((cols - 1 - col) * height)
+    return mirrored
+
+
+def key_to_board(key, rows=6, cols=7):
+    """
+    Reconstruit le plateau à partir de sa clé compacte.
+    Dans chaque colonne de hauteur h, la clé vaut jetons Rouges + 2^h - 1 : en ajoutant 1,
+    le bit de poids fort donne la hauteur et le reste les jetons Rouges.
+    :param key: Clé produite par board_to_key ou Puissance4.position_key.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Plateau sous forme de liste de rangées (0 en haut).
+    """
+    height = rows + 1
+    board = [[" " for _ in range(cols)] for _ in range(rows)]
+    for col in range(cols):
+        value = ((key >> (col * height)) & ((1 << height) - 1)) + 1
+        filled = value.bit_length() - 1
+        if filled > rows:
+            raise ValueError(f"Clé de position invalide : {key}")
+        red = value - (1 << filled)
+        for bit in range(filled):
+            board[rows - 1 - bit][col] = "R" if red >> bit & 1 else "J"
+    return board
@@ -0,0 +1,1258 @@
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .bitboard import BitBoard
+from .encoding import board_to_key, mirror_key
+from .evaluation import IncrementalEvaluator, evaluation_parameters
+from .mcts import MCTS, mcts_root_visits
+from .solver import Solver
+from .stats import SearchStats
+from .transposition import (
+    SharedTranspositionTable,
+    TranspositionTable,
+    profile_key,
+    zobrist_keys,
+)
+
+# Profondeur de la recherche à profondeur fixe de chaque difficulté
+SEARCH_DEPTHS = {"easy": 3, "medium": 4, "difficult": 5}
+
+
+class SearchTimeout(Exception):
+    """
+    Levée dans minimax lorsque le temps alloué à la recherche est écoulé ou que son arrêt est demandé.
+    """
+
+
+class Puissance4:
+    def __init__(
+        self,
+        rows=6,
+        cols=7,
+        difficulty_R="medium",
+        difficulty_J="medium",
+        backend="bitboard",
+        tt_size_mb=16,
+        transposition_table=None,
+        move_ordering=True,
+        seed=None,
+        opening_book=None,
+        solver=None,
+        solver_threshold=18,
+        search_workers=1,
+        collect_stats=False,
+        profile_search=False,
+        stats_callback=None,
+        mcts_iterations=2000,
+        connect=4,
+        evaluation_parameters=None,
+    ):
+        """
+        Initialisation du jeu Puissance 4 avec les paramètres de base et les difficultés des IA.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param difficulty_R: Difficulté de l'IA Rouge.
+        :param difficulty_J: Difficulté de l'IA Jaune.
+        :param backend: Représentation interne du plateau : 'bitboard' (rapide) ou 'list' (historique).
+        :param tt_size_mb: Mémoire maximale de la table de transposition, en mégaoctets.
+        :param transposition_table: Table de transposition existante à réutiliser (par exemple d'une partie à l'autre) ;
+                                    une SharedTranspositionTable est aussi partagée avec les processus de la recherche parallèle.
+        :param move_ordering: Active l'ordonnancement des coups (centre, coup de la table, gains/parades, killers, historique).
+        :param seed: Graine du générateur aléatoire de l'IA (None pour une graine arbitraire).
+        :param opening_book: Livre d'ouvertures (OpeningBook) consulté avant toute recherche.
+        :param solver: Solveur exact (Solver) à utiliser, par exemple avec une table préchargée ; créé à la demande sinon.
+        :param solver_threshold: Nombre de cases vides à partir duquel la difficulté 'perfect' résout la position exactement.
+        :param search_workers: Nombre de processus entre lesquels répartir les coups de la racine (1 pour chercher en série,
+                               None pour tous les cœurs).
+        :param collect_stats: Collecte les statistiques de chaque recherche (SearchStats, voir last_stats) ;
+                              désactivé, minimax ne fait qu'un test par nœud.
+        :param profile_search: Mesure en plus le temps passé dans is_game_over et evaluate_board (implique collect_stats).
+        :param stats_callback: Fonction appelée avec le SearchStats de chaque recherche terminée (implique collect_stats),
+                               par exemple pour transmettre les métriques.
+        :param mcts_iterations: Nombre de simulations par coup de la difficulté 'mcts' sans limite de temps.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        :param evaluation_parameters: Paramètres d'évaluation par difficulté remplaçant ceux d'EVALUATION_PARAMETERS
+                                      (par exemple ceux produits par le réglage automatique), ou None.
+        """
+        if backend not in ("bitboard", "list"):
+            raise ValueError(f"Représentation de plateau inconnue : {backend}")
+        self.difficulty_R = difficulty_R
+        self.difficulty_J = difficulty_J
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.backend = backend
+        self.evaluation_parameters = evaluation_parameters
+        # Paramètres complets de chaque difficulté déjà évaluée, et clé de table de transposition qui en dérive
+        self.profiles = {}
+        self.profile_keys = {}
+        self.board = [[" " for _ in range(cols)] for _ in range(rows)]
+        # Le bitboard accélère les coups et la détection de victoire ; self.board reste synchronisé pour l'évaluation et l'interface
+        self.bitboard = BitBoard(rows, cols, connect) if backend == "bitboard" else None
+        # Évaluation incrémentale mise à jour par insert_token et undo_move ; ses fenêtres servent aussi à check_winner
+        self.evaluator = IncrementalEvaluator(rows, cols, self.evaluate_window, connect)
+        self.turn = "R"
+        self.random = random.Random(seed)
+        self.opening_book = opening_book
+        self.solver = solver
+        self.solver_threshold = solver_threshold
+        self.tt_size_mb = tt_size_mb
+        self.search_workers = (
+            os.cpu_count() if search_workers is None else search_workers
+        )
+        # Pool de processus de la recherche parallèle, créé à la demande
+        self.executor = None
+        self.search_time = 0.0  # Durée du dernier best_move, en secondes
+        if transposition_table is None:
+            transposition_table = TranspositionTable(tt_size_mb)
+        self.transposition_table = transposition_table
+        # Clé de Zobrist de la position, mise à jour incrémentalement à chaque coup
+        self.zobrist = zobrist_keys(rows, cols)
+        self.hash = 0
+        # Clé de Zobrist de la position symétrique (colonnes inversées), mise à jour en même temps
+        self.zobrist_mirror = {
+            player: tuple(row[::-1] for row in self.zobrist[player])
+            for player in ("R", "J")
+        }
+        self.mirror_hash = 0
+        # Avec un nombre impair de colonnes, la colonne centrale est sa propre symétrique et l'évaluation est symétrique :
+        # une position et sa symétrique partagent alors leurs entrées de table et de livre
+        self.symmetric = cols % 2 == 1
+        # Échéance (time.perf_counter) de la recherche en cours, ou None
+        self.deadline = None
+        self.stop_requested = False  # Demande d'arrêt de la recherche (voir stop)
+        self.moves_played = []  # Colonnes jouées depuis le début de la partie
+        self.nodes = 0  # Nœuds visités par minimax lors du dernier best_move
+        self.collect_stats = (
+            collect_stats or profile_search or stats_callback is not None
+        )
+        self.profile_search = profile_search
+        self.stats_callback = stats_callback
+        # Statistiques de la recherche en cours (None si la collecte est désactivée)
+        self.stats = None
+        # Statistiques du dernier best_move ayant lancé une recherche
+        self.last_stats = None
+        self.mcts_iterations = mcts_iterations
+        # Arbre de la difficulté 'mcts', créé à la demande et conservé d'un coup à l'autre
+        self.mcts = None
+        # Temps CPU de réflexion de chaque IA dans play_full_game
+        self.cpu_time = {"R": 0.0, "J": 0.0}
+
+        # Ordonnancement des coups : colonnes du centre vers les bords, killers par demi-coup, historique par joueur
+        self.move_ordering = move_ordering
+        self.center_order = sorted(range(cols), key=lambda c: abs(2 * c - (cols - 1)))
+        self.center_rank = [self.center_order.index(col) for col in range(cols)]
+        self.killers = {}
+        self.history_scores = {"R": [0] * cols, "J": [0] * cols}
+
+    def copy(self):
+        """
+        Crée une copie indépendante de la partie (même position, mêmes réglages), partageant la table de transposition.
+        Utile pour lancer une recherche dans un autre fil d'exécution sans toucher au plateau affiché.
+        :return: Nouvelle instance de Puissance4.
+        """
+        clone = Puissance4(
+            rows=self.rows,
+            cols=self.cols,
+            difficulty_R=self.difficulty_R,
+            difficulty_J=self.difficulty_J,
+            backend=self.backend,
+            transposition_table=self.transposition_table,
+            move_ordering=self.move_ordering,
+            opening_book=self.opening_book,
+            solver=self.solver,
+            solver_threshold=self.solver_threshold,
+            search_workers=self.search_workers,
+            collect_stats=self.collect_stats,
+            profile_search=self.profile_search,
+            stats_callback=self.stats_callback,
+            mcts_iterations=self.mcts_iterations,
+            connect=self.connect,
+            evaluation_parameters=self.evaluation_parameters,
+        )
+        clone.mcts = self.mcts
+        clone.executor = self.executor
+        clone.random.setstate(self.random.getstate())
+        for col, player in self.played_moves():
+            clone.insert_token(col, player)
+        clone.turn = self.turn
+        return clone
+
+    def played_moves(self):
+        """
+        Renvoie les coups joués depuis le début de la partie avec le joueur de chaque coup, lu sur le plateau.
+        :return: Liste de tuples (colonne, joueur).
+        """
+        heights = [0] * self.cols
+        played = []
+        for col in self.moves_played:
+            row = self.rows - 1 - heights[col]
+            heights[col] += 1
+            played.append((col, self.board[row][col]))
+        return played
+
+    def close(self):
+        """
+        Arrête le pool de processus de la recherche parallèle, s'il a été créé.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def clear_search_state(self):
+        """
+        Oublie tout ce que les recherches précédentes ont appris (table de transposition, killers, historique) :
+        la recherche suivante ne dépend que de la position.
+        """
+        self.transposition_table.clear()
+        self.killers.clear()
+        self.history_scores = {"R": [0] * self.cols, "J": [0] * self.cols}
+
+    def stop(self):
+        """
+        Demande l'arrêt de la recherche en cours ; peut être appelée depuis un autre fil d'exécution.
+        """
+        self.stop_requested = True
+        if self.mcts is not None:
+            self.mcts.stop_requested = True
+
+    def tournament(
+        self,
+        num_games=5,
+        workers=1,
+        seed=0,
+        profile=False,
+        recorder=None,
+        difficulties=None,
+        shared_tt_mb=None,
+    ):
+        """
+        Organise un tournoi entre les IA de différentes difficultés.
+        Chaque partie reçoit sa propre graine : les résultats sont identiques quel que soit le nombre de processus.
+        Le livre d'ouvertures de l'instance, s'il y en a un, est rouvert par chemin (mmap partagé) dans chaque processus.
+        :param num_games: Nombre de jeux à jouer entre chaque paire de difficultés.
+        :param workers: Nombre de processus pour jouer les parties en parallèle (1 pour jouer en série, None pour tous les cœurs).
+        :param seed: Graine de base dont sont dérivées les graines des parties.
+        :param profile: Collecte les statistiques de recherche (mode profil) de chaque coup ; elles sont agrégées
+                        par difficulté et par adversaire sous la clé 'stats' (voir SearchStats.to_dict).
+        :param recorder: GameRecordWriter où enregistrer les parties, dans l'ordre des graines (None pour ne rien enregistrer).
+        :param difficulties: Difficultés en compétition, 'perfect' et 'mcts' comprises (par défaut easy, medium, difficult).
+        :param shared_tt_mb: Taille, en mégaoctets, d'une table de transposition en mémoire partagée commune à toutes
+                             les parties et à tous les processus (None pour une table privée par partie). Les parties
+                             profitent alors des recherches des autres, mais leurs résultats dépendent de l'ordre d'exécution.
+        :return: Un dictionnaire avec les résultats des matchs (victoires, défaites, nuls, coups, durées, temps CPU
+                 de réflexion de la difficulté et détail des parties).
+        """
+        if difficulties is None:
+            difficulties = ["easy", "medium", "difficult"]
+        book_path = self.opening_book.path if self.opening_book is not None else None
+        shared_table = None
+        if shared_tt_mb is not None:
+            shared_table = SharedTranspositionTable(shared_tt_mb)
+        results = {
+            diff: {
+                other: {
+                    "wins": 0,
+                    "losses": 0,
+                    "draws": 0,
+                    "moves": 0,
+                    "time": 0.0,
+                    "cpu_time": 0.0,
+                    "games": [],
+                }
+                for other in difficulties
+                if other != diff
+            }
+            for diff in difficulties
+        }
+
+        games = []
+        for difficulty_R in difficulties:
+            for difficulty_J in difficulties:
+                if difficulty_R == difficulty_J:
+                    continue
+                for _ in range(num_games):
+                    games.append(
+                        (
+                            self.rows,
+                            self.cols,
+                            difficulty_R,
+                            difficulty_J,
+                            self.backend,
+                            seed + len(games),
+                            book_path,
+                            profile,
+                            self.mcts_iterations,
+                            self.connect,
+                            shared_table,
+                        )
+                    )
+
+        try:
+            if workers == 1:
+                records = [play_tournament_game(*game) for game in games]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    records = list(executor.map(play_tournament_game, *zip(*games)))
+        finally:
+            if shared_table is not None:
+                shared_table.close()
+
+        stats = {}
+        for record in records:
+            difficulty_R = record["difficulty_R"]
+            difficulty_J = record["difficulty_J"]
+            if recorder is not None:
+                recorder.write(
+                    record["columns"],
+                    record["winner"],
+                    difficulty_R,
+                    difficulty_J,
+                    record["seed"],
+                )
+            if profile:
+                for first, second, player in (
+                    (difficulty_R, difficulty_J, "R"),
+                    (difficulty_J, difficulty_R, "J"),
+                ):
+                    total = stats.setdefault((first, second), SearchStats(True))
+                    total.merge(SearchStats.from_dict(record["stats"][player]))
+            for first, second, player in (
+                (difficulty_R, difficulty_J, "R"),
+                (difficulty_J, difficulty_R, "J"),
+            ):
+                results[first][second]["moves"] += record["moves"]
+                results[first][second]["time"] += record["time"]
+                results[first][second]["cpu_time"] += record["cpu_time"][player]
+                results[first][second]["games"].append(record)
+            if record["winner"] == "R":
+                results[difficulty_R][difficulty_J]["wins"] += 1
+                results[difficulty_J][difficulty_R]["losses"] += 1
+            elif record["winner"] == "J":
+                results[difficulty_J][difficulty_R]["wins"] += 1
+                results[difficulty_R][difficulty_J]["losses"] += 1
+            else:
+                results[difficulty_R][difficulty_J]["draws"] += 1
+                results[difficulty_J][difficulty_R]["draws"] += 1
+        for (first, second), total in stats.items():
+            results[first][second]["stats"] = total.to_dict()
+
+        return results
+
+    def play_full_game(self, game, recorder=None):
+        """
+        Joue une partie complète en utilisant les IA jusqu'à ce qu'un gagnant soit déterminé ou que le jeu soit terminé.
+        :param game: Instance du jeu Puissance 4.
+        :param recorder: GameRecordWriter où enregistrer la partie terminée (None pour ne rien enregistrer).
+        :return: Gagnant du jeu.
+        """
+        while not game.is_game_over():
+            current_player = "R" if game.turn == "R" else "J"
+            start = time.process_time()
+            best_move = game.best_move(current_player)
+            game.cpu_time[current_player] += time.process_time() - start
+            game.insert_token(best_move, current_player)
+            game.turn = "J" if game.turn == "R" else "R"
+        winner = game.check_winner()
+        if recorder is not None:
+            recorder.write(
+                game.moves_played, winner, game.difficulty_R, game.difficulty_J
+            )
+        return winner
+
+    def insert_token(self, col, player):
+        """
+        Insère un jeton dans la colonne spécifiée pour le joueur donné.
+        :param col: Index de la colonne.
+        :param player: 'R' pour Rouge ou 'J' pour Jaune.
+        :return: Booléen indiquant si le jeton a été inséré avec succès.
+        """
+        if col < 0 or col >= self.cols or self.board[0][col] != " ":
+            return False
+        if self.bitboard is not None:
+            row = self.bitboard.play(col, player)
+            self.board[row][col] = player
+            self.evaluator.add(row, col, player)
+            self.hash ^= self.zobrist[player][row][col]
+            self.mirror_hash ^= self.zobrist_mirror[player][row][col]
+            self.moves_played.append(col)
+            return True
+        for row in range(self.rows - 1, -1, -1):
+            if self.board[row][col] == " ":
+                self.board[row][col] = player
+                self.evaluator.add(row, col, player)
+                self.hash ^= self.zobrist[player][row][col]
+                self.mirror_hash ^= self.zobrist_mirror[player][row][col]
+                self.moves_played.append(col)
+                return True
+        return False
+
+    def check_winner(self):
+        """
+        Vérifie le plateau de jeu pour déterminer si un joueur a gagné.
+        :return: Le joueur gagnant ('R' ou 'J') ou None si aucun gagnant.
+        """
+        if self.bitboard is not None:
+            return self.bitboard.check_winner()
+
+        board = self.board
+        for window in self.evaluator.windows:
+            row, col = window[0]
+            first = board[row][col]
+            if first != " " and all(board[r][c] == first for r, c in window[1:]):
+                return first
+        return None
+
+    def generate_possible_moves(self):
+        """
+        Génère une liste de mouvements possibles (colonnes disponibles).
+        :return: Liste des indices de colonnes disponibles.
+        """
+        if self.bitboard is not None:
+            return self.bitboard.generate_possible_moves()
+        return [col for col in range(self.cols) if self.board[0][col] == " "]
+
+    def is_game_over(self):
+        """
+        Détermine si le jeu est terminé.
+        :return: Booléen indiquant si le jeu est terminé.
+        """
+        if self.bitboard is not None:
+            return self.bitboard.check_winner() is not None or self.bitboard.is_full()
+        return self.check_winner() is not None or all(
+            self.board[0][col] != " " for col in range(self.cols)
+        )
+
+    def evaluate_board(self, difficulty):
+        """
+        Évalue le plateau actuel à partir de l'évaluation incrémentale, sans reparcourir toutes les fenêtres.
+        Le score est identique à celui de evaluate_board_scan.
+        :param difficulty: Niveau de difficulté utilisé pour ajuster l'évaluation.
+        :return: Score numérique du plateau.
+        """
+        winner = self.check_winner()
+        if winner == "J":
+            return 1000
+        elif winner == "R":
+            return -1000
+        parameters = self.parameters(difficulty)
+        score = self.evaluator.center_count * parameters[
+            "center"
+        ] + self.evaluator.window_score(difficulty)
+        if parameters["scale"] != 1:
+            score *= parameters["scale"]
+        return score
+
+    def evaluate_board_scan(self, difficulty):
+        """
+        Évalue le plateau actuel et renvoie un score basé sur la configuration des jetons, en parcourant toutes les fenêtres
+        (la table précalculée des fenêtres de l'évaluateur, dans l'ordre historique du parcours).
+        :param difficulty: Niveau de difficulté utilisé pour ajuster l'évaluation.
+        :return: Score numérique du plateau.
+        """
+        winner = self.check_winner()
+        if winner == "J":
+            return 1000
+        elif winner == "R":
+            return -1000
+        else:
+            parameters = self.parameters(difficulty)
+
+            # Priorité des colonnes centrales, pondérée selon la difficulté
+            center_array = [self.board[i][self.cols // 2] for i in range(self.rows)]
+            score = center_array.count("J") * parameters["center"]
+
+            # Détection des configurations potentiellement gagnantes pour le joueur J, puis pour le joueur R
+            windows = [
+                [self.board[row][col] for row, col in window]
+                for window in self.evaluator.windows
+            ]
+            for window in windows:
+                score += self.evaluate_window(window, "J", difficulty)
+            for window in windows:
+                score -= self.evaluate_window(window, "R", difficulty)
+            if parameters["scale"] != 1:
+                # Pour le niveau facile, l'impact de l'évaluation est divisé par 2
+                score *= parameters["scale"]
+
+            return score
+
+    def evaluate_window(self, window, player, difficulty):
+        """
+        Évalue une fenêtre de connect cellules pour un joueur spécifique.
+        :param window: Liste de connect cellules à évaluer.
+        :param player: Joueur pour lequel évaluer la fenêtre.
+        :param difficulty: Difficulté pour ajuster l'évaluation.
+        :return: Score de la fenêtre.
+        """
+        parameters = self.parameters(difficulty)
+        score = 0
+        opponent = "J" if player == "R" else "R"
+        size = len(window)
+
+        if window.count(player) == size:
+            score += parameters["win"]
+        elif window.count(player) == size - 1 and window.count(" ") == 1:
+            score += parameters["three"]
+        elif window.count(player) == size - 2 and window.count(" ") == 2:
+            score += parameters["two"]
+
+        # En difficulté 'difficult', on pénalise en plus le fait de laisser l'opposant avoir 3 jetons alignés
+        if window.count(opponent) == size - 1 and window.count(" ") == 1:
+            score -= parameters["opponent_three"]
+
+        return score
+
+    def parameters(self, difficulty):
+        """
+        Renvoie les paramètres d'évaluation d'une difficulté (voir evaluation_parameters).
+        :param difficulty: Difficulté (profil d'évaluation).
+        :return: Dictionnaire nom -> valeur.
+        """
+        parameters = self.profiles.get(difficulty)
+        if parameters is None:
+            parameters = evaluation_parameters(difficulty, self.evaluation_parameters)
+            self.profiles[difficulty] = parameters
+        return parameters
+
+    def minimax(self, depth, alpha, beta, maximizingPlayer, difficulty):
+        """
+        Implémente l'algorithme Minimax avec élagage Alpha-Bêta pour optimiser le choix des mouvements.
+        Les entrées de la table de transposition sont typées (exacte, borne inférieure, borne supérieure)
+        et resserrent la fenêtre alpha-bêta au lieu d'être renvoyées telles quelles.
+        :param depth: Profondeur de recherche actuelle.
+        :param alpha: Valeur alpha pour l'élagage.
+        :param beta: Valeur beta pour l'élagage.
+        :param maximizingPlayer: Booléen pour savoir si c'est le tour du joueur maximisant.
+        :param difficulty: Niveau de difficulté pour ajuster les paramètres de recherche.
+        :return: Meilleure évaluation pour le joueur actuel.
+        """
+        self.nodes += 1
+        stats = self.stats
+        if self.stop_requested or (
+            self.deadline is not None and time.perf_counter() >= self.deadline
+        ):
+            raise SearchTimeout()
+        state_key, mirrored = self.search_key(maximizingPlayer, difficulty)
+        entry = self.transposition_table.probe(state_key)
+        tt_move = -1
+        if stats is not None:
+            if entry is None:
+                stats.tt_misses += 1
+            else:
+                stats.tt_hits += 1
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            if mirrored and tt_move >= 0:
+                tt_move = self.cols - 1 - tt_move
+            if entry_depth >= depth:
+                if flag == TranspositionTable.EXACT:
+                    return value
+                if flag == TranspositionTable.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        if stats is None:
+            terminal = depth == 0 or self.is_game_over()
+        else:
+            terminal = depth == 0 or stats.timed("game_over_time", self.is_game_over)
+        if terminal:
+            if stats is None:
+                score = self.evaluate_board(difficulty)
+            else:
+                stats.leaves += 1
+                score = stats.timed("evaluate_time", self.evaluate_board, difficulty)
+            self.transposition_table.store(
+                state_key, depth, TranspositionTable.EXACT, score
+            )
+            return score
+
+        # Fenêtre effectivement utilisée, pour typer le résultat stocké
+        window_alpha, window_beta = alpha, beta
+        best_col = -1
+        if stats is not None:
+            stats.interior_nodes += 1
+        if maximizingPlayer:
+            maxEval = float("-inf")
+            for move in self.order_moves(self.generate_possible_moves(), "J", tt_move):
+                self.insert_token(move, "J")
+                try:
+                    eval = self.minimax(depth - 1, alpha, beta, False, difficulty)
+                finally:
+                    self.undo_move(move)
+                if eval > maxEval:
+                    maxEval = eval
+                    best_col = move
+                alpha = max(alpha, eval)
+                if beta <= alpha:
+                    self.record_cutoff(move, "J", depth)
+                    if stats is not None:
+                        stats.cutoffs += 1
+                    break
+            best_value = maxEval
+        else:
+            minEval = float("inf")
+            for move in self.order_moves(self.generate_possible_moves(), "R", tt_move):
+                self.insert_token(move, "R")
+                try:
+                    eval = self.minimax(depth - 1, alpha, beta, True, difficulty)
+                finally:
+                    self.undo_move(move)
+                if eval < minEval:
+                    minEval = eval
+                    best_col = move
+                beta = min(beta, eval)
+                if beta <= alpha:
+                    self.record_cutoff(move, "R", depth)
+                    if stats is not None:
+                        stats.cutoffs += 1
+                    break
+            best_value = minEval
+
+        if best_value <= window_alpha:
+            flag = TranspositionTable.UPPER
+        elif best_value >= window_beta:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        if mirrored and best_col >= 0:
+            best_col = self.cols - 1 - best_col
+        self.transposition_table.store(state_key, depth, flag, best_value, best_col)
+        return best_value
+
+    def order_moves(self, moves, player, tt_move=-1):
+        """
+        Ordonne les coups pour maximiser les coupures alpha-bêta : gain immédiat, coup de la table de transposition,
+        parade d'un gain adverse, coups killers, puis score d'historique et proximité du centre.
+        :param moves: Coups possibles.
+        :param player: Joueur qui joue ces coups.
+        :param tt_move: Meilleur coup mémorisé dans la table de transposition (-1 si aucun).
+        :return: Liste des coups dans l'ordre d'exploration.
+        """
+        if not self.move_ordering:
+            return moves
+        opponent = "J" if player == "R" else "R"
+        wins = self.winning_moves(player)
+        blocks = self.winning_moves(opponent)
+        killers = self.killers.get(len(self.moves_played), ())
+        history = self.history_scores[player]
+        center_rank = self.center_rank
+
+        def priority(col):
+            if col in wins:
+                category = 0
+            elif col == tt_move:
+                category = 1
+            elif col in blocks:
+                category = 2
+            elif col in killers:
+                category = 3
+            else:
+                category = 4
+            return category, -history[col], center_rank[col]
+
+        return sorted(moves, key=priority)
+
+    def winning_moves(self, player):
+        """
+        Détermine les colonnes où le joueur gagne immédiatement.
+        :param player: Joueur concerné ('R' ou 'J').
+        :return: Liste des colonnes gagnantes.
+        """
+        if self.bitboard is not None:
+            return self.bitboard.winning_moves(player)
+        wins = []
+        for col in self.generate_possible_moves():
+            self.insert_token(col, player)
+            if self.check_winner() == player:
+                wins.append(col)
+            self.undo_move(col)
+        return wins
+
+    def record_cutoff(self, move, player, depth):
+        """
+        Mémorise un coup ayant provoqué une coupure, comme killer de ce demi-coup et dans l'historique du joueur.
+        :param move: Colonne ayant provoqué la coupure.
+        :param player: Joueur ayant joué ce coup.
+        :param depth: Profondeur restante au moment de la coupure.
+        """
+        if not self.move_ordering:
+            return
+        killers = self.killers.setdefault(len(self.moves_played), [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self.history_scores[player][move] += depth * depth
+
+    def search_key(self, maximizingPlayer, difficulty):
+        """
+        Calcule la clé de la position pour la table de transposition, en distinguant le joueur au trait et les paramètres
+        d'évaluation de la difficulté (voir profile_key).
+        Si l'évaluation est symétrique, la clé est celle de la plus petite des deux orientations (canonique) :
+        les coups mémorisés sont alors ceux de cette orientation.
+        :param maximizingPlayer: Booléen indiquant si le Jaune (maximisant) a le trait.
+        :param difficulty: Difficulté dont dépend l'évaluation.
+        :return: Tuple (clé de 64 bits, booléen indiquant si la clé est celle de la position symétrique).
+        """
+        key = self.hash
+        mirrored = self.symmetric and self.mirror_hash < key
+        if mirrored:
+            key = self.mirror_hash
+        profile = self.profile_keys.get(difficulty)
+        if profile is None:
+            profile = profile_key(self.parameters(difficulty))
+            self.profile_keys[difficulty] = profile
+        key ^= profile
+        if maximizingPlayer:
+            key ^= self.zobrist["side"]
+        return key, mirrored
+
+    def serialize_state(self):
+        """
+        Sérialise l'état actuel du plateau sous forme lisible (la table de transposition utilise la clé de Zobrist canonique, voir search_key).
+        :return: Chaîne représentant l'état du plateau.
+        """
+        return str(self.board)
+
+    def undo_move(self, col):
+        """
+        Annule le dernier mouvement effectué dans la colonne spécifiée.
+        :param col: Index de la colonne où annuler le mouvement.
+        """
+        if self.bitboard is not None:
+            row = self.bitboard.undo(col)
+            if row is not None:
+                self.evaluator.remove(row, col, self.board[row][col])
+                self.hash ^= self.zobrist[self.board[row][col]][row][col]
+                self.mirror_hash ^= self.zobrist_mirror[self.board[row][col]][row][col]
+                self.board[row][col] = " "
+                self.moves_played.pop()
+            return
+        for row in range(self.rows):
+            if self.board[row][col] != " ":
+                self.evaluator.remove(row, col, self.board[row][col])
+                self.hash ^= self.zobrist[self.board[row][col]][row][col]
+                self.mirror_hash ^= self.zobrist_mirror[self.board[row][col]][row][col]
+                self.board[row][col] = " "
+                self.moves_played.pop()
+                break
+
+    def best_move(self, player, time_limit_ms=None, max_depth=None):
+        """
+        Détermine le meilleur mouvement pour le joueur donné en utilisant Minimax.
+        Sans limite de temps ni de profondeur, la profondeur est fixée par la difficulté ; sinon la recherche
+        procède par approfondissement itératif et renvoie le résultat de la dernière itération complète.
+        En difficulté 'perfect', la position est résolue exactement dès qu'il reste au plus solver_threshold cases vides,
+        et cherchée comme en 'difficult' avant cela. En difficulté 'mcts', le coup est choisi par recherche Monte-Carlo
+        (mcts_iterations simulations, ou le temps alloué).
+        :param player: Joueur actuel ('R' ou 'J').
+        :param time_limit_ms: Temps alloué à la recherche, en millisecondes (None pour aucune limite).
+        :param max_depth: Profondeur maximale de l'approfondissement itératif (None pour le nombre de cases vides).
+        :return: Index de la meilleure colonne à jouer (None si une recherche à profondeur fixe est interrompue).
+                 Si la collecte est activée, les statistiques de la recherche sont ensuite dans last_stats.
+        """
+        difficulty = self.difficulty_R if player == "R" else self.difficulty_J
+        self.last_stats = None
+        col = self.book_move(player, difficulty)
+        if col is not None:
+            return col
+        if difficulty == "mcts":
+            return self.mcts_move(player, time_limit_ms)
+        if difficulty == "perfect":
+            if sum(row.count(" ") for row in self.board) <= self.solver_threshold:
+                return self.perfect_move(player)
+            difficulty = "difficult"
+        depth = SEARCH_DEPTHS.get(difficulty, 3)
+        self.nodes = 0
+        if self.collect_stats:
+            self.stats = SearchStats(self.profile_search)
+        start = time.perf_counter()
+        try:
+            return self.search(player, difficulty, depth, time_limit_ms, max_depth)
+        finally:
+            self.search_time = time.perf_counter() - start
+            if self.stats is not None:
+                self.finish_stats()
+
+    def search(self, player, difficulty, depth, time_limit_ms, max_depth):
+        """
+        Recherche Minimax de best_move, à profondeur fixe ou par approfondissement itératif.
+        :param player: Joueur actuel ('R' ou 'J').
+        :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+        :param depth: Profondeur fixe utilisée sans limite de temps ni de profondeur.
+        :param time_limit_ms: Temps alloué à la recherche, en millisecondes (None pour aucune limite).
+        :param max_depth: Profondeur maximale de l'approfondissement itératif.
+        :return: Index de la meilleure colonne à jouer.
+        """
+        # L'historique des recherches précédentes est vieilli pour privilégier les coupures récentes
+        for scores in self.history_scores.values():
+            scores[:] = [score // 2 for score in scores]
+        moves = self.order_moves(self.generate_possible_moves(), player)
+        if time_limit_ms is None and max_depth is None:
+            try:
+                return self.search_depth(player, depth, difficulty, moves)[0]
+            except SearchTimeout:
+                return None  # Recherche interrompue par stop() avant son terme
+            finally:
+                self.stop_requested = False
+        if not moves:
+            return None
+
+        empty_cells = sum(row.count(" ") for row in self.board)
+        max_depth = empty_cells if max_depth is None else min(max_depth, empty_cells)
+        if time_limit_ms is not None:
+            self.deadline = time.perf_counter() + time_limit_ms / 1000
+        best_col = moves[0]
+        try:
+            for current_depth in range(1, max_depth + 1):
+                best_col, best_score = self.search_depth(
+                    player, current_depth, difficulty, moves
+                )
+                # Le meilleur coup de l'itération précédente est exploré en premier
+                moves.remove(best_col)
+                moves.insert(0, best_col)
+                if abs(best_score) >= 1000:
+                    break  # Victoire ou défaite forcée : inutile d'aller plus profond
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+            self.stop_requested = False
+        return best_col
+
+    def search_depth(self, player, depth, difficulty, moves):
+        """
+        Lance une itération complète de la recherche et en enregistre les statistiques si la collecte est activée.
+        :param player: Joueur actuel ('R' ou 'J').
+        :param depth: Profondeur de recherche, coup de la racine compris.
+        :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+        :param moves: Coups de la racine, dans l'ordre d'exploration.
+        :return: Tuple (meilleure colonne, meilleur score).
+        """
+        if self.stats is None:
+            return self.search_root(player, depth, difficulty, moves)
+        nodes = self.nodes
+        start = time.perf_counter()
+        best_col, best_score = self.search_root(player, depth, difficulty, moves)
+        self.stats.record_depth(
+            depth, self.nodes - nodes, time.perf_counter() - start, best_col, best_score
+        )
+        return best_col, best_score
+
+    def finish_stats(self):
+        """
+        Clôt les statistiques de la recherche terminée : les range dans last_stats et les transmet au callback.
+        """
+        stats = self.stats
+        self.stats = None
+        stats.searches = 1
+        stats.nodes = self.nodes
+        stats.time = self.search_time
+        self.last_stats = stats
+        if self.stats_callback is not None:
+            self.stats_callback(stats)
+
+    def solve(self, player=None):
+        """
+        Calcule la valeur exacte (théorie des jeux) de la position avec le solveur.
+        :param player: Joueur au trait (None pour le déduire du nombre de jetons, le Rouge commençant).
+        :return: Score positif si le joueur au trait gagne (d'autant plus grand que la victoire est rapide),
+                 négatif s'il perd, 0 pour une partie nulle.
+        """
+        if player is None:
+            player = "R" if len(self.moves_played) % 2 == 0 else "J"
+        bitboard = self.to_bitboard()
+        return self.get_solver().solve(bitboard.pieces[player], bitboard.mask)
+
+    def perfect_move(self, player):
+        """
+        Choisit un coup parfait : le meilleur score exact, les coups de même score étant départagés au hasard.
+        :param player: Joueur actuel ('R' ou 'J').
+        :return: Index de la colonne à jouer.
+        """
+        bitboard = self.to_bitboard()
+        scores = self.get_solver().analyze(bitboard.pieces[player], bitboard.mask)
+        if not scores:
+            return None
+        best_score = max(scores.values())
+        return self.random.choice(
+            sorted(col for col, score in scores.items() if score == best_score)
+        )
+
+    def mcts_move(self, player, time_limit_ms=None):
+        """
+        Choisit un coup par recherche Monte-Carlo (UCT) : le coup de la racine le plus visité.
+        Avec plusieurs processus, chacun construit son propre arbre et les visites sont additionnées (parallélisation à la racine).
+        :param player: Joueur actuel ('R' ou 'J').
+        :param time_limit_ms: Temps alloué, en millisecondes (None pour mcts_iterations simulations).
+        :return: Index de la colonne à jouer, ou None s'il n'y a aucun coup.
+        """
+        bitboard = self.to_bitboard()
+        position, mask = bitboard.pieces[player], bitboard.mask
+        iterations = self.mcts_iterations if time_limit_ms is None else None
+        tree = self.get_mcts()
+        start = time.perf_counter()
+        if self.search_workers > 1:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.search_workers)
+            if iterations is not None:
+                iterations = -(-iterations // self.search_workers)
+            futures = [
+                self.executor.submit(
+                    mcts_root_visits,
+                    self.rows,
+                    self.cols,
+                    self.connect,
+                    position,
+                    mask,
+                    iterations,
+                    time_limit_ms,
+                    self.random.getrandbits(32),
+                )
+                for _ in range(self.search_workers)
+            ]
+            visits = {}
+            self.nodes = 0
+            for future in futures:
+                worker_visits, worker_iterations = future.result()
+                self.nodes += worker_iterations
+                for col, count in worker_visits.items():
+                    visits[col] = visits.get(col, 0) + count
+        else:
+            visits = tree.search(position, mask, iterations, time_limit_ms)
+            self.nodes = tree.iterations
+        self.search_time = time.perf_counter() - start
+        self.stop_requested = False
+        return tree.best_move(visits)
+
+    def get_mcts(self):
+        """
+        Renvoie l'arbre Monte-Carlo de la partie, en le créant au premier appel (graine tirée du générateur de l'IA).
+        :return: Instance de MCTS.
+        """
+        if self.mcts is None:
+            self.mcts = MCTS(
+                self.rows,
+                self.cols,
+                seed=self.random.getrandbits(32),
+                connect=self.connect,
+            )
+        return self.mcts
+
+    def get_solver(self):
+        """
+        Renvoie le solveur exact de la partie, en le créant au premier appel.
+        :return: Instance de Solver.
+        """
+        if self.solver is None:
+            self.solver = Solver(self.rows, self.cols, connect=self.connect)
+        return self.solver
+
+    def to_bitboard(self):
+        """
+        Renvoie la position sous forme de bitboard (celui de la partie, ou une conversion de self.board).
+        :return: Instance de BitBoard.
+        """
+        if self.bitboard is not None:
+            return self.bitboard
+        bitboard = BitBoard(self.rows, self.cols, self.connect)
+        for col in range(self.cols):
+            for row in range(self.rows - 1, -1, -1):
+                if self.board[row][col] == " ":
+                    break
+                bitboard.play(col, self.board[row][col])
+        return bitboard
+
+    def book_move(self, player, difficulty):
+        """
+        Consulte le livre d'ouvertures pour la position actuelle.
+        :param player: Joueur actuel ('R' ou 'J').
+        :param difficulty: Difficulté pour laquelle le coup a été précalculé.
+        :return: Colonne du livre, ou None si la position n'y figure pas.
+        """
+        book = self.opening_book
+        geometry = (self.rows, self.cols, self.connect)
+        if book is None or (book.rows, book.cols, book.connect) != geometry:
+            return None
+        # Le livre est construit en faisant commencer le Rouge : le trait se déduit du nombre de jetons
+        if player != ("R" if len(self.moves_played) % 2 == 0 else "J"):
+            return None
+        key, mirrored = self.canonical_key()
+        col = book.lookup(key, difficulty)
+        if col is None:
+            return None
+        if mirrored:
+            col = self.cols - 1 - col
+        if col not in self.generate_possible_moves():
+            return None
+        return col
+
+    def position_key(self):
+        """
+        Calcule la clé compacte de la position (jetons Rouges plus masque des cases occupées, voir BitBoard.key).
+        :return: Entier identifiant la position, indépendant du processus.
+        """
+        if self.bitboard is not None:
+            return self.bitboard.key()
+        return board_to_key(self.board)
+
+    def canonical_key(self):
+        """
+        Calcule la clé compacte canonique de la position : la plus petite de sa clé et de celle de sa symétrique,
+        si l'évaluation est symétrique (voir self.symmetric).
+        :return: Tuple (clé, booléen indiquant si la clé est celle de la position symétrique).
+        """
+        key = self.position_key()
+        if self.symmetric:
+            mirrored = mirror_key(key, self.rows, self.cols)
+            if mirrored < key:
+                return mirrored, True
+        return key, False
+
+    def search_root(self, player, depth, difficulty, moves):
+        """
+        Évalue chaque coup de la racine à la profondeur donnée et renvoie le meilleur.
+        :param player: Joueur actuel ('R' ou 'J').
+        :param depth: Profondeur de recherche, coup de la racine compris.
+        :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+        :param moves: Coups de la racine, dans l'ordre d'exploration.
+        :return: Tuple (meilleure colonne, meilleur score).
+        """
+        if self.search_workers > 1 and len(moves) > 1:
+            scores = self.search_root_parallel(player, depth, difficulty, moves)
+        else:
+            scores = []
+            for col in moves:
+                if self.stats is not None:
+                    self.stats.root_moves += 1
+                self.insert_token(col, player)
+                try:
+                    score = self.minimax(
+                        depth - 1,
+                        float("-inf"),
+                        float("inf"),
+                        player == "R",
+                        difficulty,
+                    )
+                finally:
+                    self.undo_move(col)
+                scores.append((col, score))
+
+        best_score = float("-inf") if player == "J" else float("inf")
+        best_cols = []
+        for col, score in scores:
+            if (player == "J" and score > best_score) or (
+                player == "R" and score < best_score
+            ):
+                best_score = score
+                best_cols = [col]
+            elif score == best_score:
+                best_cols.append(col)
+        if not best_cols:
+            return None, best_score
+        # L'aléatoire ne sert qu'à départager les coups de même score, pour éviter un comportement prévisible
+        return self.random.choice(sorted(best_cols)), best_score
+
+    def search_root_parallel(self, player, depth, difficulty, moves):
+        """
+        Répartit les coups de la racine entre les processus du pool ; chaque coup est cherché avec une fenêtre complète,
+        si bien que les scores, et donc le coup choisi, sont ceux de la recherche en série à la même profondeur.
+        :param player: Joueur actuel ('R' ou 'J').
+        :param depth: Profondeur de recherche, coup de la racine compris.
+        :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+        :param moves: Coups de la racine.
+        :return: Liste de tuples (colonne, score) dans l'ordre des coups.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.search_workers)
+        config = (
+            self.rows,
+            self.cols,
+            self.connect,
+            self.difficulty_R,
+            self.difficulty_J,
+            self.backend,
+            self.tt_size_mb,
+            self.move_ordering,
+            # Sérialisés pour que la configuration reste utilisable comme clé de dictionnaire
+            json.dumps(self.evaluation_parameters, sort_keys=True),
+            # Transmise par son nom : les processus s'attachent au même segment
+            (
+                self.transposition_table
+                if isinstance(self.transposition_table, SharedTranspositionTable)
+                else None
+            ),
+        )
+        time_left = None
+        if self.deadline is not None:
+            time_left = self.deadline - time.perf_counter()
+        profile = None if self.stats is None else self.stats.profile
+        futures = [
+            self.executor.submit(
+                search_root_move,
+                config,
+                self.played_moves(),
+                player,
+                col,
+                depth,
+                difficulty,
+                time_left,
+                profile,
+            )
+            for col in moves
+        ]
+        scores = []
+        timed_out = False
+        for col, future in zip(moves, futures):
+            score, nodes, stats = future.result()
+            self.nodes += nodes
+            if stats is not None:
+                self.stats.merge(stats)
+                self.stats.root_moves += 1
+            timed_out = timed_out or score is None
+            scores.append((col, score))
+        if timed_out:
+            raise SearchTimeout()
+        return scores
+
+
+# Partie conservée par chaque processus de la recherche parallèle (table de transposition gardée chaude)
+_worker_games = {}
+
+
+def search_root_move(
+    config, played, player, col, depth, difficulty, time_left, profile=None
+):
+    """
+    Cherche un coup de la racine dans un processus du pool de la recherche parallèle.
+    :param config: Tuple (rows, cols, connect, difficulty_R, difficulty_J, backend, tt_size_mb, move_ordering,
+                   paramètres d'évaluation en JSON, table de transposition partagée ou None).
+    :param played: Coups déjà joués, sous forme de tuples (colonne, joueur).
+    :param player: Joueur qui joue le coup de la racine.
+    :param col: Coup de la racine à évaluer.
+    :param depth: Profondeur de recherche, coup de la racine compris.
+    :param difficulty: Niveau de difficulté utilisé pour l'évaluation.
+    :param time_left: Temps restant en secondes, ou None pour aucune limite.
+    :param profile: None pour ne pas collecter de statistiques, sinon mode profil du SearchStats à renvoyer.
+    :return: Tuple (score ou None si le temps est écoulé, nœuds visités, SearchStats ou None).
+    """
+    game = _worker_games.get(config)
+    if game is None:
+        (
+            rows,
+            cols,
+            connect,
+            difficulty_R,
+            difficulty_J,
+            backend,
+            tt_size_mb,
+            ordering,
+            parameters,
+            shared_table,
+        ) = config
+        game = Puissance4(
+            rows=rows,
+            cols=cols,
+            connect=connect,
+            difficulty_R=difficulty_R,
+            difficulty_J=difficulty_J,
+            backend=backend,
+            tt_size_mb=tt_size_mb,
+            transposition_table=shared_table,
+            move_ordering=ordering,
+            evaluation_parameters=json.loads(parameters),
+        )
+        _worker_games[config] = game
+    for previous in reversed(list(game.moves_played)):
+        game.undo_move(previous)
+    for previous, previous_player in played:
+        game.insert_token(previous, previous_player)
+
+    game.nodes = 0
+    game.stats = None if profile is None else SearchStats(profile)
+    if time_left is not None:
+        game.deadline = time.perf_counter() + time_left
+    game.insert_token(col, player)
+    try:
+        score = game.minimax(
+            depth - 1, float("-inf"), float("inf"), player == "R", difficulty
+        )
+    except SearchTimeout:
+        score = None
+    finally:
+        game.undo_move(col)
+        game.deadline = None
+    stats, game.stats = game.stats, None
+    return score, game.nodes, stats
+
+
+def play_tournament_game(
+    rows,
+    cols,
+    difficulty_R,
+    difficulty_J,
+    backend,
+    seed,
+    book_path=None,
+    profile=False,
+    mcts_iterations=2000,
+    connect=4,
+    transposition_table=None,
+):
+    """
+    Joue une partie de tournoi entre deux IA ; fonction de module pour pouvoir être exécutée dans un processus séparé.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param difficulty_R: Difficulté de l'IA Rouge.
+    :param difficulty_J: Difficulté de l'IA Jaune.
+    :param backend: Représentation interne du plateau.
+    :param seed: Graine de la partie.
+    :param book_path: Chemin du livre d'ouvertures à consulter, ou None.
+    :param profile: Collecte les statistiques de recherche de chaque joueur (clé 'stats' du résultat).
+    :param mcts_iterations: Nombre de simulations par coup de la difficulté 'mcts'.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :param transposition_table: Table de transposition partagée (SharedTranspositionTable), ou None pour une table privée.
+    :return: Dictionnaire décrivant la partie (difficultés, graine, gagnant, nombre de coups, colonnes jouées, durée,
+             temps CPU de réflexion de chaque IA).
+    """
+    opening_book = None
+    if book_path is not None:
+        from .book import open_book
+
+        opening_book = open_book(book_path)
+    game = Puissance4(
+        rows=rows,
+        cols=cols,
+        difficulty_R=difficulty_R,
+        difficulty_J=difficulty_J,
+        backend=backend,
+        seed=seed,
+        opening_book=opening_book,
+        profile_search=profile,
+        mcts_iterations=mcts_iterations,
+        connect=connect,
+        transposition_table=transposition_table,
+    )
+    totals = {"R": SearchStats(profile), "J": SearchStats(profile)}
+    # Le callback est appelé à la fin de best_move, avant que play_full_game ne passe le trait
+    game.stats_callback = lambda stats: totals[game.turn].merge(stats)
+    start = time.perf_counter()
+    winner = game.play_full_game(game)
+    record = {
+        "difficulty_R": difficulty_R,
+        "difficulty_J": difficulty_J,
+        "seed": seed,
+        "winner": winner,
+        "moves": len(game.moves_played),
+        "columns": list(game.moves_played),
+        "time": time.perf_counter() - start,
+        "cpu_time": dict(game.cpu_time),
+    }
+    if profile:
+        record["stats"] = {player: total.to_dict() for player, total in totals.items()}
+    return record
@@ -0,0 +1,152 @@
+from .geometry import cell_windows, line_windows
+
+# Paramètres d'évaluation de chaque difficulté : score d'une fenêtre complète ('win'), d'une fenêtre à un jeton
+# ('three') ou à deux jetons ('two') de l'alignement, pénalité d'une fenêtre adverse à un jeton de l'alignement
+# ('opponent_three'), poids de chaque jeton Jaune de la colonne centrale ('center') et facteur du score total ('scale')
+EVALUATION_PARAMETERS = {
+    "easy": {
+        "win": 100,
+        "three": 5,
+        "two": 2,
+        "opponent_three": 0,
+        "center": 2,
+        "scale": 0.5,
+    },
+    "medium": {
+        "win": 100,
+        "three": 5,
+        "two": 2,
+        "opponent_three": 0,
+        "center": 3,
+        "scale": 1,
+    },
+    "difficult": {
+        "win": 100,
+        "three": 5,
+        "two": 2,
+        "opponent_three": 4,
+        "center": 3,
+        "scale": 1,
+    },
+}
+# Paramètres d'une difficulté inconnue (par exemple 'default', celle du joueur humain) : pas de bonus central
+DEFAULT_PARAMETERS = {
+    "win": 100,
+    "three": 5,
+    "two": 2,
+    "opponent_three": 0,
+    "center": 0,
+    "scale": 1,
+}
+
+
+def evaluation_parameters(difficulty, overrides=None):
+    """
+    Renvoie le vecteur de paramètres d'évaluation d'une difficulté.
+    :param difficulty: Difficulté (profil d'évaluation).
+    :param overrides: Dictionnaire difficulté -> paramètres remplaçant ceux d'EVALUATION_PARAMETERS, ou None.
+    :return: Dictionnaire nom -> valeur de tous les paramètres.
+    """
+    parameters = EVALUATION_PARAMETERS.get(difficulty, DEFAULT_PARAMETERS)
+    if overrides and difficulty in overrides:
+        parameters = {**parameters, **overrides[difficulty]}
+    return parameters
+
+
+class IncrementalEvaluator:
+    def __init__(self, rows, cols, evaluate_window, connect=4):
+        """
+        Évaluation maintenue incrémentalement : chaque fenêtre de connect cases connaît son nombre de jetons par joueur,
+        et seules les fenêtres passant par la case jouée sont mises à jour à chaque coup.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param evaluate_window: Fonction d'évaluation d'une fenêtre (celle de Puissance4), utilisée pour précalculer les scores.
+        :param connect: Nombre de jetons à aligner pour gagner (taille des fenêtres).
+        """
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.evaluate_window = evaluate_window
+        self.center_col = cols // 2
+        self.center_count = 0  # Nombre de jetons Jaunes dans la colonne centrale
+
+        # Fenêtres et index case -> fenêtres, partagés par toutes les parties de même géométrie
+        self.windows = line_windows(rows, cols, connect)
+        self.cell_windows = cell_windows(rows, cols, connect)
+
+        self.counts = {"R": [0] * len(self.windows), "J": [0] * len(self.windows)}
+        # Par difficulté : table [nb J][nb R] -> score de la fenêtre, et somme courante sur toutes les fenêtres
+        self.tables = {}
+        self.sums = {}
+
+    def build_table(self, difficulty):
+        """
+        Précalcule le score (Jaune moins Rouge) d'une fenêtre selon son nombre de jetons de chaque joueur.
+        :param difficulty: Difficulté pour laquelle construire la table.
+        :return: Table indexée par [nombre de jetons J][nombre de jetons R].
+        """
+        size = self.connect + 1
+        table = [[0] * size for _ in range(size)]
+        for count_J in range(size):
+            for count_R in range(size - count_J):
+                window = ["J"] * count_J + ["R"] * count_R
+                window += [" "] * (self.connect - count_J - count_R)
+                table[count_J][count_R] = self.evaluate_window(
+                    window, "J", difficulty
+                ) - self.evaluate_window(window, "R", difficulty)
+        return table
+
+    def window_score(self, difficulty):
+        """
+        Renvoie la somme courante des scores de fenêtres ; une difficulté inconnue est suivie à partir de ce premier appel.
+        :param difficulty: Difficulté utilisée pour l'évaluation.
+        :return: Somme des scores de toutes les fenêtres du plateau.
+        """
+        if difficulty not in self.sums:
+            table = self.build_table(difficulty)
+            self.tables[difficulty] = table
+            self.sums[difficulty] = sum(
+                table[count_J][count_R]
+                for count_J, count_R in zip(self.counts["J"], self.counts["R"])
+            )
+        return self.sums[difficulty]
+
+    def add(self, row, col, player):
+        """
+        Met à jour les fenêtres passant par la case après la pose d'un jeton.
+        :param row: Rangée de la case jouée.
+        :param col: Colonne de la case jouée.
+        :param player: Joueur ayant posé le jeton.
+        """
+        self.update(row, col, player, 1)
+
+    def remove(self, row, col, player):
+        """
+        Met à jour les fenêtres passant par la case après le retrait d'un jeton.
+        :param row: Rangée de la case libérée.
+        :param col: Colonne de la case libérée.
+        :param player: Joueur dont le jeton est retiré.
+        """
+        self.update(row, col, player, -1)
+
+    def update(self, row, col, player, delta):
+        """
+        Ajoute delta au nombre de jetons du joueur dans chaque fenêtre passant par la case, en corrigeant les sommes courantes.
+        :param row: Rangée de la case.
+        :param col: Colonne de la case.
+        :param player: Joueur concerné.
+        :param delta: +1 pour une pose, -1 pour un retrait.
+        """
+        counts_J = self.counts["J"]
+        counts_R = self.counts["R"]
+        counts = counts_J if player == "J" else counts_R
+        for index in self.cell_windows[row][col]:
+            count_J = counts_J[index]
+            count_R = counts_R[index]
+            counts[index] += delta
+            for difficulty, table in self.tables.items():
+                self.sums[difficulty] += (
+                    table[counts_J[index]][counts_R[index]] - table[count_J][count_R]
+                )
+        if col == self.center_col and player == "J":
+            self.center_count += delta
@@ -0,0 +1,45 @@
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def line_windows(rows, cols, connect=4):
+    """
+    Précalcule toutes les fenêtres de connect cases alignées du plateau, une seule fois par géométrie.
+    Elles sont listées dans l'ordre historique du parcours : horizontales, verticales, diagonales descendantes
+    puis montantes.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Tuple de fenêtres, chacune étant un tuple de cases (rangée, colonne).
+    """
+    span = connect - 1
+    windows = []
+    for row in range(rows):
+        for col in range(cols - span):
+            windows.append(tuple((row, col + i) for i in range(connect)))
+    for col in range(cols):
+        for row in range(rows - span):
+            windows.append(tuple((row + i, col) for i in range(connect)))
+    for row in range(rows - span):
+        for col in range(cols - span):
+            windows.append(tuple((row + i, col + i) for i in range(connect)))
+    for row in range(span, rows):
+        for col in range(cols - span):
+            windows.append(tuple((row - i, col + i) for i in range(connect)))
+    return tuple(windows)
+
+
+@functools.lru_cache(maxsize=None)
+def cell_windows(rows, cols, connect=4):
+    """
+    Précalcule, pour chaque case, les index des fenêtres de line_windows qui la contiennent.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Tableau [rangée][colonne] de tuples d'index de fenêtres.
+    """
+    cells = [[[] for _ in range(cols)] for _ in range(rows)]
+    for index, window in enumerate(line_windows(rows, cols, connect)):
+        for row, col in window:
+            cells[row][col].append(index)
+    return tuple(tuple(tuple(indexes) for indexes in line) for line in cells)
@@ -0,0 +1,480 @@
+import queue
+import threading
+import tkinter as tk
+from tkinter import simpledialog
+
+from .engine import Puissance4
+
+# Taille maximale du plateau dessiné, en pixels ; les cases rétrécissent sur les grands plateaux
+MAX_CANVAS_WIDTH = 700
+MAX_CANVAS_HEIGHT = 600
+# Couleur de remplissage de chaque contenu de case
+CELL_COLORS = {" ": "white", "R": "red", "J": "yellow"}
+
+
+class Puissance4GUI:
+    def __init__(self, game, time_limit_ms=None):
+        """
+        Initialise l'interface graphique pour le jeu de Puissance 4.
+        :param game: Une instance du jeu Puissance4, contenant la logique du jeu.
+        :param time_limit_ms: Temps de réflexion alloué à l'IA par coup, en millisecondes (None pour la profondeur fixe de la difficulté).
+        """
+        self.game = game
+        self.time_limit_ms = time_limit_ms
+        # La recherche de l'IA tourne dans un fil séparé, sur une copie de la partie ; son résultat revient par une file
+        self.search_game = None
+        self.search_results = queue.Queue()
+        self.thinking_ticks = 0
+        self.ia_vs_ia = False
+        self.cancelled = False
+        self.last_opponent_row = None  # Dernière rangée jouée par l'adversaire
+        self.last_opponent_col = None  # Dernière colonne jouée par l'adversaire
+        self.window = tk.Tk()
+        self.window.title("Puissance 4")
+
+        # Création des boutons pour chaque colonne du jeu
+        self.buttons = []
+        for col in range(self.game.cols):
+            btn = tk.Button(
+                self.window,
+                text=f"Col {col+1}",
+                command=lambda c=col: self.play_turn(c),
+            )
+            btn.grid(row=0, column=col)
+            self.buttons.append(btn)
+
+        # Configuration du canvas pour le dessin du plateau de jeu, la taille des cases dépendant de la géométrie
+        self.cell_size = min(
+            100, MAX_CANVAS_WIDTH // self.game.cols, MAX_CANVAS_HEIGHT // self.game.rows
+        )
+        self.canvas = tk.Canvas(
+            self.window,
+            width=self.cell_size * self.game.cols,
+            height=self.cell_size * self.game.rows,
+            bg="blue",
+        )
+        self.canvas.grid(row=1, column=0, columnspan=self.game.cols)
+        self.create_board()
+
+        # Label d'état pour indiquer à quel joueur c'est le tour
+        self.status_label = tk.Label(
+            self.window, text="Joueur Rouge, c'est votre tour", fg="red"
+        )
+        self.status_label.grid(row=2, column=0, columnspan=self.game.cols)
+
+        # Labels pour afficher la difficulté des IA
+        self.difficulty_label_R = tk.Label(
+            self.window,
+            text=f"Difficulté IA Rouge: {self.game.difficulty_R}",
+            fg="black",
+        )
+        self.difficulty_label_R.grid(row=3, column=0, columnspan=self.game.cols // 2)
+
+        self.difficulty_label_J = tk.Label(
+            self.window,
+            text=f"Difficulté IA Jaune: {self.game.difficulty_J}",
+            fg="black",
+        )
+        self.difficulty_label_J.grid(
+            row=3, column=self.game.cols // 2, columnspan=self.game.cols // 2
+        )
+
+        # Bouton pour interrompre la réflexion de l'IA
+        self.cancel_button = tk.Button(
+            self.window, text="Arrêter l'IA", command=self.cancel_search
+        )
+        self.cancel_button.grid(row=4, column=0, columnspan=self.game.cols)
+        self.cancel_button.config(state=tk.DISABLED)
+
+        self.draw_board()
+
+    def play_turn(self, col):
+        """
+        Gère un tour de jeu en insérant un jeton dans la colonne sélectionnée et vérifie l'état du jeu.
+        :param col: Index de la colonne où insérer le jeton.
+        """
+        if self.search_game is not None:
+            return  # L'IA réfléchit encore
+        if self.game.turn == "R" and self.game.insert_token(col, "R"):
+            self.game.turn = "J"
+            self.draw_board()
+            if self.game.is_game_over():
+                # Victoire, ou plateau rempli par ce coup : l'IA n'a plus rien à jouer
+                self.end_game(self.game.check_winner())
+                return
+            self.ai_move()
+
+    def ia_vs_ia_move(self):
+        """
+        Lance le coup de l'IA dont c'est le tour dans un jeu entièrement géré par l'IA ; le coup suivant est programmé
+        avec after() une fois celui-ci joué, sans bloquer la boucle Tk.
+        """
+        self.ia_vs_ia = True
+        if self.cancelled or self.game.is_game_over():
+            return
+        self.start_search(self.game.turn)
+
+    def ai_move(self):
+        """
+        Lance la réflexion de l'IA Jaune ; le coup est joué par apply_ai_move quand la recherche se termine.
+        """
+        self.start_search("J")
+
+    def start_search(self, player):
+        """
+        Démarre la recherche du meilleur coup dans un fil séparé et affiche l'indicateur de réflexion.
+        :param player: Joueur pour lequel chercher un coup ('R' ou 'J').
+        """
+        self.search_game = self.game.copy()
+        for btn in self.buttons:
+            btn.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.thinking_ticks = 0
+        threading.Thread(
+            target=self.run_search, args=(self.search_game, player), daemon=True
+        ).start()
+        self.poll_search()
+
+    def run_search(self, game, player):
+        """
+        Exécutée dans le fil de recherche : calcule le coup et le transmet à l'interface par la file de résultats.
+        :param game: Copie de la partie sur laquelle chercher.
+        :param player: Joueur pour lequel chercher un coup.
+        """
+        col = game.best_move(player, time_limit_ms=self.time_limit_ms)
+        if col is None and not game.is_game_over():
+            # Recherche interrompue sans résultat complet : premier coup dans l'ordre de préférence
+            col = game.order_moves(game.generate_possible_moves(), player)[0]
+        self.search_results.put((player, col))
+
+    def poll_search(self):
+        """
+        Vérifie périodiquement (via after) si la recherche a abouti, en animant l'indicateur de réflexion.
+        """
+        try:
+            player, col = self.search_results.get_nowait()
+        except queue.Empty:
+            name = "Rouge" if self.game.turn == "R" else "Jaune"
+            dots = "." * (self.thinking_ticks // 5 % 4)
+            self.status_label.config(text=f"L'IA {name} réfléchit{dots}", fg="black")
+            self.thinking_ticks += 1
+            self.window.after(50, self.poll_search)
+            return
+        self.search_game = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.apply_ai_move(player, col)
+
+    def cancel_search(self):
+        """
+        Interrompt la réflexion en cours : en Joueur vs IA, l'IA joue le meilleur coup trouvé jusque-là ;
+        en IA vs IA, la partie s'arrête.
+        """
+        if self.search_game is None:
+            return
+        if self.ia_vs_ia:
+            self.cancelled = True
+        self.search_game.stop()
+
+    def apply_ai_move(self, player, col):
+        """
+        Joue sur le plateau affiché le coup calculé par l'IA et met à jour l'interface.
+        :param player: Joueur ayant calculé le coup.
+        :param col: Colonne choisie par l'IA.
+        """
+        if self.cancelled:
+            self.status_label.config(text="Partie IA vs IA interrompue", fg="black")
+            return
+        if col is None:
+            # Aucun coup possible : la partie s'est terminée avant la recherche
+            self.end_game(self.game.check_winner())
+            return
+        self.game.insert_token(col, player)
+        self.last_opponent_col = col
+        self.game.turn = "R" if player == "J" else "J"
+        self.draw_board()
+        if self.game.is_game_over():
+            self.end_game(self.game.check_winner())
+        elif self.ia_vs_ia:
+            self.window.after(500, self.ia_vs_ia_move)  # Délai pour observer le jeu
+        else:
+            for btn in self.buttons:
+                btn.config(state=tk.NORMAL)
+            self.update_status()
+
+    def cell_coords(self, row, col):
+        """
+        Calcule les coordonnées du cercle d'une case, à partir de la taille des cases.
+        :return: Tuple (x0, y0, x1, y1).
+        """
+        size = self.cell_size
+        margin = size // 10
+        x0 = col * size + margin
+        y0 = row * size + margin
+        return x0, y0, x0 + size - 2 * margin, y0 + size - 2 * margin
+
+    def create_board(self):
+        """
+        Crée une fois pour toutes les cercles des cases et l'anneau du dernier coup ; draw_board ne fait ensuite
+        que modifier les éléments existants (itemconfig, coords) au lieu de tout redessiner.
+        """
+        self.cell_items = [
+            [
+                self.canvas.create_oval(
+                    *self.cell_coords(row, col), fill="white", outline="black"
+                )
+                for col in range(self.game.cols)
+            ]
+            for row in range(self.game.rows)
+        ]
+        # Contenu affiché de chaque case, pour ne reconfigurer que celles qui changent
+        self.displayed = [[" "] * self.game.cols for _ in range(self.game.rows)]
+        # Anneau rose autour de la dernière position jouée par l'adversaire, caché tant qu'il n'y en a pas
+        self.last_move_ring = self.canvas.create_oval(
+            0, 0, 0, 0, fill="", outline="pink", width=3, state=tk.HIDDEN
+        )
+
+    def draw_board(self):
+        """
+        Met à jour le plateau dessiné : seules les cases dont le contenu a changé sont recolorées,
+        puis l'anneau du dernier coup est déplacé.
+        """
+        board = self.game.board
+        for row in range(self.game.rows):
+            displayed = self.displayed[row]
+            for col, cell in enumerate(board[row]):
+                if displayed[col] != cell:
+                    displayed[col] = cell
+                    self.canvas.itemconfig(
+                        self.cell_items[row][col], fill=CELL_COLORS[cell]
+                    )
+
+        if self.last_opponent_col is not None:
+            row = 0
+            while (
+                row < self.game.rows
+                and self.game.board[row][self.last_opponent_col] == " "
+            ):
+                row += 1
+            if row < self.game.rows:
+                self.last_opponent_row = row
+                self.canvas.coords(
+                    self.last_move_ring, *self.cell_coords(row, self.last_opponent_col)
+                )
+                self.canvas.itemconfig(self.last_move_ring, state=tk.NORMAL)
+                return
+        self.canvas.itemconfig(self.last_move_ring, state=tk.HIDDEN)
+
+    def update_status(self):
+        """
+        Met à jour le label d'état pour indiquer le tour actuel.
+        """
+        self.status_label.config(text="Joueur Rouge, c'est votre tour", fg="red")
+
+    def end_game(self, winner):
+        """
+        Termine le jeu en affichant le gagnant (ou le match nul) et désactive les boutons.
+        :param winner: Le joueur gagnant ('R' ou 'J'), ou None pour un match nul.
+        """
+        if winner is None:
+            self.status_label.config(text="Match nul !", fg="black")
+        else:
+            color = "Red" if winner == "R" else "Yellow"
+            self.status_label.config(text=f"Le joueur {color} a gagné !", fg="green")
+        for btn in self.buttons:
+            btn.config(state=tk.DISABLED)
+
+    def start(self):
+        """
+        Lance l'interface graphique principale.
+        """
+        self.window.mainloop()
+
+
+class MenuPrincipal:
+    def __init__(self, root, rows=6, cols=7, connect=4):
+        """
+        Initialise le menu principal pour la sélection du type de jeu et la difficulté de l'IA.
+        :param root: L'élément racine de Tkinter où ce menu sera attaché.
+        :param rows: Nombre de rangées du plateau des parties lancées.
+        :param cols: Nombre de colonnes du plateau des parties lancées.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        """
+        self.root = root
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.root.title("Menu Principal Puissance 4")
+
+        # Création d'un cadre pour contenir les boutons du menu principal
+
+        self.frame = tk.Frame(self.root)
+        self.frame.pack(padx=10, pady=10)
+
+        # Bouton pour démarrer un jeu Joueur vs IA
+        self.btn_joueur_vs_ia = tk.Button(
+            self.frame,
+            text="Joueur vs IA",
+            command=self.selection_difficulte_joueur_vs_ia,
+            height=2,
+            width=20,
+        )
+        self.btn_joueur_vs_ia.pack(pady=10)
+
+        # Bouton pour démarrer un jeu Joueur vs IA
+        self.btn_ia_vs_ia = tk.Button(
+            self.frame,
+            text="IA vs IA",
+            command=self.selection_difficulte_ia_vs_ia,
+            height=2,
+            width=20,
+        )
+        self.btn_ia_vs_ia.pack(pady=10)
+
+    def selection_difficulte_joueur_vs_ia(self):
+        """
+        Détruit le menu principal et affiche les options pour sélectionner la difficulté de l'IA dans un jeu Joueur vs IA.
+        """
+        self.frame.destroy()  # Ferme le menu principal
+
+        # Création d'un nouveau cadre pour la sélection de la difficulté
+
+        frame_selection = tk.Frame(self.root)
+        frame_selection.pack(padx=10, pady=10)
+
+        tk.Label(frame_selection, text="Choisissez la difficulté pour l'IA:").pack()
+        var_difficulty_IA = tk.StringVar(value="medium")
+        for difficulty in ["easy", "medium", "difficult"]:
+            tk.Radiobutton(
+                frame_selection,
+                text=difficulty,
+                variable=var_difficulty_IA,
+                value=difficulty,
+            ).pack()
+
+        var_time_limit = self.selection_temps_de_reflexion(frame_selection)
+
+        # Bouton pour démarrer le jeu après sélection de la difficulté
+        tk.Button(
+            frame_selection,
+            text="Commencer Joueur vs IA",
+            command=lambda: self.lancer_jeu_joueur_vs_ia(
+                var_difficulty_IA.get(), self.lire_temps(var_time_limit)
+            ),
+        ).pack(pady=20)
+
+    def selection_difficulte_ia_vs_ia(self):
+        """
+        Détruit le menu principal et affiche les options pour sélectionner la difficulté des deux IA dans un jeu IA vs IA.
+        """
+        self.frame.destroy()  # Ferme le menu principal
+
+        # Création d'un nouveau cadre pour la sélection des difficultés
+        frame_selection = tk.Frame(self.root)
+        frame_selection.pack(padx=10, pady=10)
+
+        # Sélection pour l'IA Rouge
+        tk.Label(frame_selection, text="Difficulté pour IA Rouge:").pack()
+        var_difficulty_R = tk.StringVar(value="medium")
+        for difficulty in ["easy", "medium", "difficult"]:
+            tk.Radiobutton(
+                frame_selection,
+                text=difficulty,
+                variable=var_difficulty_R,
+                value=difficulty,
+            ).pack()
+
+        # Sélection pour l'IA Jaune
+        tk.Label(frame_selection, text="Difficulté pour IA Jaune:").pack()
+        var_difficulty_J = tk.StringVar(value="medium")
+        for difficulty in ["easy", "medium", "difficult"]:
+            tk.Radiobutton(
+                frame_selection,
+                text=difficulty,
+                variable=var_difficulty_J,
+                value=difficulty,
+            ).pack()
+
+        var_time_limit = self.selection_temps_de_reflexion(frame_selection)
+
+        # Bouton pour démarrer le jeu IA vs IA
+        tk.Button(
+            frame_selection,
+            text="Commencer IA vs IA",
+            command=lambda: self.lancer_jeu_ia_vs_ia(
+                var_difficulty_R.get(),
+                var_difficulty_J.get(),
+                self.lire_temps(var_time_limit),
+            ),
+        ).pack(pady=20)
+
+    def selection_temps_de_reflexion(self, frame_selection):
+        """
+        Ajoute au cadre un champ pour le temps de réflexion de l'IA par coup.
+        :param frame_selection: Cadre de sélection où ajouter le champ.
+        :return: Variable Tkinter contenant le texte saisi.
+        """
+        tk.Label(
+            frame_selection, text="Temps par coup en ms (vide = profondeur fixe):"
+        ).pack()
+        var_time_limit = tk.StringVar(value="")
+        tk.Entry(frame_selection, textvariable=var_time_limit, width=10).pack()
+        return var_time_limit
+
+    def lire_temps(self, var_time_limit):
+        """
+        Convertit le temps de réflexion saisi en millisecondes.
+        :param var_time_limit: Variable Tkinter du champ de saisie.
+        :return: Temps en millisecondes, ou None si le champ est vide ou invalide.
+        """
+        text = var_time_limit.get().strip()
+        return int(text) if text.isdigit() else None
+
+    def lancer_jeu_joueur_vs_ia(self, difficulty_IA, time_limit_ms=None):
+        """
+        Lance un jeu de Puissance 4 en mode Joueur vs IA avec la difficulté spécifiée.
+        :param difficulty_IA: La difficulté de l'IA choisie.
+        :param time_limit_ms: Temps de réflexion de l'IA par coup, en millisecondes (None pour la profondeur fixe).
+        """
+        jeu = Puissance4(
+            rows=self.rows,
+            cols=self.cols,
+            difficulty_R="default",
+            difficulty_J=difficulty_IA,
+            connect=self.connect,
+        )
+        gui = Puissance4GUI(jeu, time_limit_ms=time_limit_ms)
+        gui.start()
+
+    def lancer_jeu_ia_vs_ia(self, difficulty_R, difficulty_J, time_limit_ms=None):
+        """
+        Lance un jeu de Puissance 4 en mode IA vs IA avec les difficultés spécifiées pour chaque IA.
+        :param difficulty_R: Difficulté de l'IA Rouge.
+        :param difficulty_J: Difficulté de l'IA Jaune.
+        :param time_limit_ms: Temps de réflexion des IA par coup, en millisecondes (None pour la profondeur fixe).
+        """
+        jeu = Puissance4(
+            rows=self.rows,
+            cols=self.cols,
+            difficulty_R=difficulty_R,
+            difficulty_J=difficulty_J,
+            connect=self.connect,
+        )
+        gui = Puissance4GUI(jeu, time_limit_ms=time_limit_ms)
+        gui.ia_vs_ia_move()
+        gui.start()
+
+
+def main(rows=6, cols=7, connect=4):
+    """
+    Lance le Menu Principal avec la possibilité de jouer contre l'IA et de faire des IA vs IA, tout en choisissant le niveau de difficulté des IA.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    """
+    root = tk.Tk()
+    app = MenuPrincipal(root, rows, cols, connect)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
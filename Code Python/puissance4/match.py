@@ -0,0 +1,370 @@
+import math
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .book import enumerate_positions, open_book, replay
+from .engine import SEARCH_DEPTHS, Puissance4
+
+# Paires fictives réparties sur les cinq scores de paire : sans elles, des résultats tous égaux (fréquents entre
+# moteurs déterministes) donneraient une variance nulle et un test concluant dès la première paire
+PRIOR_PAIRS = 1.0
+
+
+def parse_engine(spec):
+    """
+    Lit la description d'une configuration de moteur : difficulté, éventuellement suivie de ':' et d'une profondeur
+    maximale (ex. 'medium', 'difficult:6', 'mcts').
+    :param spec: Chaîne décrivant la configuration.
+    :return: Tuple (difficulté, profondeur maximale ou None).
+    """
+    difficulty, _, depth = spec.partition(":")
+    if difficulty not in list(SEARCH_DEPTHS) + ["perfect", "mcts"]:
+        raise ValueError(f"Difficulté inconnue dans {spec!r}")
+    if not depth:
+        return difficulty, None
+    if not depth.isdigit() or int(depth) < 1:
+        raise ValueError(f"Profondeur invalide dans {spec!r}")
+    return difficulty, int(depth)
+
+
+def opening_set(plies, seed=0, rows=6, cols=7, connect=4):
+    """
+    Construit l'ensemble d'ouvertures des matchs : toutes les positions distinctes de plies demi-coups, mélangées.
+    :param plies: Nombre de demi-coups de chaque ouverture.
+    :param seed: Graine du mélange.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Liste de suites de coups.
+    """
+    openings = [
+        moves
+        for moves in enumerate_positions(plies + 1, rows, cols, connect)
+        if len(moves) == plies
+    ]
+    random.Random(seed).shuffle(openings)
+    return openings
+
+
+def play_match_game(
+    rows,
+    cols,
+    connect,
+    engine_R,
+    engine_J,
+    opening,
+    seed,
+    time_limit_ms=None,
+    backend="bitboard",
+    book_path=None,
+    mcts_iterations=2000,
+):
+    """
+    Joue une partie de match depuis une ouverture ; fonction de module pour pouvoir être exécutée dans un processus séparé.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :param engine_R: Configuration du Rouge (voir parse_engine), éventuellement complétée par ses paramètres
+                     d'évaluation (tuple (difficulté, profondeur, paramètres)).
+    :param engine_J: Configuration du Jaune.
+    :param opening: Coups de l'ouverture, joués avant que les moteurs ne prennent la main.
+    :param seed: Graine de la partie.
+    :param time_limit_ms: Temps alloué par coup, en millisecondes (None pour la profondeur de la configuration).
+    :param backend: Représentation interne du plateau.
+    :param book_path: Chemin du livre d'ouvertures à consulter, ou None.
+    :param mcts_iterations: Nombre de simulations par coup de la difficulté 'mcts'.
+    :return: Tuple (gagnant 'R', 'J' ou None, colonnes jouées).
+    """
+    engines = {"R": engine_R, "J": engine_J}
+    # Une instance par joueur, chacune avec ses propres paramètres d'évaluation et sa table de transposition
+    games = {}
+    for player, (difficulty, _, *parameters) in engines.items():
+        overrides = (
+            {difficulty: parameters[0]} if parameters and parameters[0] else None
+        )
+        games[player] = Puissance4(
+            rows=rows,
+            cols=cols,
+            connect=connect,
+            difficulty_R=difficulty,
+            difficulty_J=difficulty,
+            backend=backend,
+            seed=seed,
+            opening_book=open_book(book_path) if book_path else None,
+            mcts_iterations=mcts_iterations,
+            evaluation_parameters=overrides,
+        )
+        replay(games[player], opening)
+    game = games["R"]
+    player = "R" if len(opening) % 2 == 0 else "J"
+    while not game.is_game_over():
+        col = games[player].best_move(
+            player, time_limit_ms=time_limit_ms, max_depth=engines[player][1]
+        )
+        for instance in games.values():
+            instance.insert_token(col, player)
+        player = "J" if player == "R" else "R"
+    winner = game.check_winner()
+    for instance in games.values():
+        instance.close()
+    return winner, list(game.moves_played)
+
+
+def play_match_pair(first, second, opening, seed, options):
+    """
+    Joue une paire de parties depuis la même ouverture, chaque configuration ayant les Rouges une fois.
+    :param first: Configuration évaluée.
+    :param second: Configuration de référence.
+    :param opening: Coups de l'ouverture.
+    :param seed: Graine de la paire.
+    :param options: Dictionnaire des paramètres communs de play_match_game (géométrie, temps, livre...).
+    :return: Liste de deux scores de first (1 victoire, 0,5 nul, 0 défaite).
+    """
+    scores = []
+    for index, (engine_R, engine_J) in enumerate(((first, second), (second, first))):
+        winner, _ = play_match_game(
+            options["rows"],
+            options["cols"],
+            options["connect"],
+            engine_R,
+            engine_J,
+            opening,
+            seed + index,
+            options["time_limit_ms"],
+            options["backend"],
+            options["book_path"],
+            options["mcts_iterations"],
+        )
+        first_color = "R" if index == 0 else "J"
+        if winner is None:
+            scores.append(0.5)
+        else:
+            scores.append(1.0 if winner == first_color else 0.0)
+    return scores
+
+
+def elo_from_score(score):
+    """
+    Convertit un score moyen en différence d'Elo (modèle logistique).
+    :param score: Score moyen entre 0 et 1.
+    :return: Différence d'Elo (infinie pour un score de 0 ou 1).
+    """
+    if score <= 0:
+        return float("-inf")
+    if score >= 1:
+        return float("inf")
+    return -400 * math.log10(1 / score - 1)
+
+
+def score_from_elo(elo):
+    """
+    Convertit une différence d'Elo en score attendu (modèle logistique).
+    :param elo: Différence d'Elo.
+    :return: Score attendu entre 0 et 1.
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def pair_statistics(pairs, prior=0.0):
+    """
+    Calcule la moyenne et la variance des scores de paires, ramenés entre 0 et 1.
+    Les paires (et non les parties) sont les échantillons indépendants : deux parties d'une même ouverture sont corrélées.
+    :param pairs: Décompte des paires par score total de first (dictionnaire 0, 0.5, 1, 1.5, 2 -> nombre).
+    :param prior: Nombre de paires fictives réparties uniformément sur les scores (voir PRIOR_PAIRS).
+    :return: Tuple (nombre de paires réellement jouées, score moyen, variance par paire).
+    """
+    count = sum(pairs.values())
+    weights = {total: n + prior / len(pairs) for total, n in pairs.items()}
+    weight = sum(weights.values())
+    if not weight:
+        return 0, 0.5, 0.0
+    mean = sum(total / 2 * n for total, n in weights.items()) / weight
+    variance = sum((total / 2 - mean) ** 2 * n for total, n in weights.items()) / weight
+    return count, mean, variance
+
+
+def sprt_llr(pairs, elo0, elo1):
+    """
+    Calcule le log du rapport de vraisemblance du test séquentiel (SPRT) entre les hypothèses
+    H0 : first a elo0 points d'Elo de plus que second, et H1 : il en a elo1, par l'approximation normale
+    sur les scores de paires (pentanomiale).
+    :param pairs: Décompte des paires par score total (voir pair_statistics).
+    :param elo0: Différence d'Elo de l'hypothèse nulle.
+    :param elo1: Différence d'Elo de l'hypothèse alternative.
+    :return: Log du rapport de vraisemblance (0 tant qu'aucune paire n'est jouée).
+    """
+    count, mean, variance = pair_statistics(pairs, PRIOR_PAIRS)
+    if not count:
+        return 0.0
+    score0 = score_from_elo(elo0)
+    score1 = score_from_elo(elo1)
+    return count * (score1 - score0) * (2 * mean - score0 - score1) / (2 * variance)
+
+
+def sprt_bounds(alpha, beta):
+    """
+    Calcule les bornes de décision du SPRT.
+    :param alpha: Risque de première espèce (accepter H1 à tort).
+    :param beta: Risque de seconde espèce (accepter H0 à tort).
+    :return: Tuple (borne inférieure, borne supérieure) du log du rapport de vraisemblance.
+    """
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def elo_interval(pairs, confidence=1.96):
+    """
+    Estime la différence d'Elo de first sur second et sa marge d'erreur.
+    :param pairs: Décompte des paires par score total (voir pair_statistics).
+    :param confidence: Nombre d'écarts-types de l'intervalle (1.96 pour 95 %).
+    :return: Tuple (Elo estimé, borne basse, borne haute).
+    """
+    count, mean, _ = pair_statistics(pairs)
+    if not count:
+        return 0.0, float("-inf"), float("inf")
+    _, _, variance = pair_statistics(pairs, PRIOR_PAIRS)
+    margin = confidence * math.sqrt(variance / count)
+    return (
+        elo_from_score(mean),
+        elo_from_score(mean - margin),
+        elo_from_score(mean + margin),
+    )
+
+
+def run_match(
+    first,
+    second,
+    elo0=0.0,
+    elo1=50.0,
+    alpha=0.05,
+    beta=0.05,
+    max_pairs=500,
+    workers=1,
+    seed=0,
+    opening_plies=3,
+    time_limit_ms=None,
+    rows=6,
+    cols=7,
+    connect=4,
+    backend="bitboard",
+    book_path=None,
+    mcts_iterations=2000,
+    callback=None,
+    first_parameters=None,
+    second_parameters=None,
+):
+    """
+    Compare deux configurations de moteur par paires de parties aux couleurs inversées, jouées depuis un ensemble
+    d'ouvertures variées, et s'arrête dès que le SPRT conclut (ou après max_pairs paires).
+    Les paires sont comptées dans l'ordre de leurs graines, quel que soit le nombre de processus : le résultat est reproductible.
+    :param first: Configuration évaluée (voir parse_engine).
+    :param second: Configuration de référence.
+    :param elo0: Différence d'Elo de l'hypothèse nulle.
+    :param elo1: Différence d'Elo de l'hypothèse alternative.
+    :param alpha: Risque d'accepter H1 à tort.
+    :param beta: Risque d'accepter H0 à tort.
+    :param max_pairs: Nombre maximal de paires de parties.
+    :param workers: Nombre de processus jouant les paires en parallèle (1 pour jouer en série, None pour tous les cœurs).
+    :param seed: Graine du mélange des ouvertures et des parties.
+    :param opening_plies: Nombre de demi-coups des ouvertures.
+    :param time_limit_ms: Temps alloué par coup, en millisecondes (None pour la profondeur des configurations).
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :param backend: Représentation interne du plateau.
+    :param book_path: Chemin du livre d'ouvertures à consulter, ou None.
+    :param mcts_iterations: Nombre de simulations par coup de la difficulté 'mcts'.
+    :param callback: Fonction appelée avec le résultat intermédiaire après chaque paire, ou None.
+    :param first_parameters: Paramètres d'évaluation de first (par exemple issus du réglage), ou None pour ceux
+                             de sa difficulté ; permet de comparer deux jeux de paramètres d'une même difficulté.
+    :param second_parameters: Paramètres d'évaluation de second, ou None.
+    :return: Dictionnaire du résultat (victoires, nuls, défaites de first, paires par score, Elo et intervalle à 95 %,
+             log du rapport de vraisemblance, bornes et décision 'H0', 'H1' ou None si le test n'a pas conclu).
+    """
+    engines = (
+        (*first, first_parameters),
+        (*second, second_parameters),
+    )
+    options = {
+        "rows": rows,
+        "cols": cols,
+        "connect": connect,
+        "time_limit_ms": time_limit_ms,
+        "backend": backend,
+        "book_path": book_path,
+        "mcts_iterations": mcts_iterations,
+    }
+    openings = opening_set(opening_plies, seed, rows, cols, connect)
+    if not openings:
+        raise ValueError(f"Aucune ouverture de {opening_plies} demi-coups")
+    lower, upper = sprt_bounds(alpha, beta)
+    result = {
+        "first": first,
+        "second": second,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "pairs": {total: 0 for total in (0.0, 0.5, 1.0, 1.5, 2.0)},
+        "llr": 0.0,
+        "bounds": (lower, upper),
+        "decision": None,
+    }
+
+    def pair_arguments(index):
+        return (
+            *engines,
+            openings[index % len(openings)],
+            seed + 2 * index,
+            options,
+        )
+
+    def record(scores):
+        for score in scores:
+            if score == 1.0:
+                result["wins"] += 1
+            elif score == 0.0:
+                result["losses"] += 1
+            else:
+                result["draws"] += 1
+        result["pairs"][sum(scores)] += 1
+        result["llr"] = sprt_llr(result["pairs"], elo0, elo1)
+        result["elo"], result["elo_low"], result["elo_high"] = elo_interval(
+            result["pairs"]
+        )
+        if result["llr"] >= upper:
+            result["decision"] = "H1"
+        elif result["llr"] <= lower:
+            result["decision"] = "H0"
+        if callback is not None:
+            callback(result)
+
+    if workers == 1:
+        for index in range(max_pairs):
+            record(play_match_pair(*pair_arguments(index)))
+            if result["decision"] is not None:
+                break
+        return result
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # Quelques paires d'avance par processus ; les résultats sont dépilés dans l'ordre de soumission
+        in_flight = 2 * (workers or os.cpu_count())
+        futures = deque()
+        submitted = 0
+        while submitted < min(in_flight, max_pairs):
+            futures.append(executor.submit(play_match_pair, *pair_arguments(submitted)))
+            submitted += 1
+        while futures:
+            record(futures.popleft().result())
+            if result["decision"] is not None:
+                break
+            if submitted < max_pairs:
+                futures.append(
+                    executor.submit(play_match_pair, *pair_arguments(submitted))
+                )
+                submitted += 1
+    finally:
+        # Les paires encore en attente sont abandonnées dès que le test a conclu
+        executor.shutdown(cancel_futures=True)
+    return result
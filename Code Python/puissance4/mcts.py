@@ -0,0 +1,271 @@
+import math
+import random
+import time
+
+from .bitboard import BitBoard
+
+# Résultat d'un nœud terminal, du point de vue du joueur qui vient de jouer
+ONGOING = 0
+WIN = 1
+DRAW = 2
+
+
+class MCTS:
+    def __init__(
+        self, rows=6, cols=7, max_nodes=500_000, exploration=1.4, seed=None, connect=4
+    ):
+        """
+        Recherche arborescente Monte-Carlo (UCT) travaillant sur les bitboards (jetons du joueur au trait, masque).
+        Les nœuds sont rangés dans des listes parallèles (pool) indexées par entier ; l'arbre est conservé d'un coup
+        à l'autre et le sous-arbre de la nouvelle position est réutilisé.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param max_nodes: Nombre maximal de nœuds du pool ; au-delà, l'arbre cesse de grandir.
+        :param exploration: Constante d'exploration de la formule UCT.
+        :param seed: Graine du générateur des simulations (None pour une graine arbitraire).
+        :param connect: Nombre de jetons à aligner pour gagner.
+        """
+        self.geometry = BitBoard(rows, cols, connect)
+        self.rows = rows
+        self.cols = cols
+        self.max_nodes = max_nodes
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.column_order = sorted(range(cols), key=lambda c: abs(2 * c - (cols - 1)))
+        self.iterations = 0  # Simulations effectuées lors du dernier appel à search
+        self.stop_requested = False  # Demande d'arrêt, consultée avec l'horloge
+        self.reset()
+
+    def reset(self):
+        """
+        Vide le pool de nœuds.
+        """
+        self.positions = []  # Jetons du joueur au trait dans le nœud
+        self.masks = []
+        self.parents = []
+        self.moves = []  # Colonne jouée pour atteindre le nœud
+        self.children = (
+            []
+        )  # Liste des nœuds fils, ou None tant que le nœud n'est pas développé
+        self.visits = []
+        self.wins = []  # Gains du joueur qui a joué le coup menant au nœud (nul = 0,5)
+        self.results = []  # ONGOING, WIN (le coup menant au nœud gagne) ou DRAW
+        self.root = None
+
+    def new_node(self, position, mask, parent, move, result):
+        """
+        Ajoute un nœud au pool.
+        :return: Index du nœud.
+        """
+        self.positions.append(position)
+        self.masks.append(mask)
+        self.parents.append(parent)
+        self.moves.append(move)
+        self.children.append(None)
+        self.visits.append(0)
+        self.wins.append(0.0)
+        self.results.append(result)
+        return len(self.positions) - 1
+
+    def set_root(self, position, mask):
+        """
+        Place la racine sur la position donnée, en réutilisant le sous-arbre correspondant s'il est à au plus
+        deux demi-coups de la racine précédente (notre coup puis la réponse adverse).
+        :param position: Jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        """
+        if self.root is not None and len(self.positions) < self.max_nodes:
+            frontier = [self.root]
+            for _ in range(3):
+                for node in frontier:
+                    if self.positions[node] == position and self.masks[node] == mask:
+                        self.root = node
+                        self.parents[node] = None
+                        return
+                frontier = [
+                    child for node in frontier for child in (self.children[node] or ())
+                ]
+        # Position inconnue, ou pool plein : on repart d'un arbre vide
+        self.reset()
+        self.root = self.new_node(position, mask, None, -1, ONGOING)
+
+    def search(self, position, mask, iterations=None, time_limit_ms=None):
+        """
+        Lance les simulations depuis la position et renvoie le nombre de visites de chaque coup de la racine.
+        :param position: Jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        :param iterations: Nombre de simulations (None pour n'être limité que par le temps).
+        :param time_limit_ms: Temps alloué, en millisecondes (None pour n'être limité que par le nombre de simulations).
+        :return: Dictionnaire colonne -> nombre de visites.
+        """
+        if iterations is None and time_limit_ms is None:
+            raise ValueError("Il faut un nombre de simulations ou un temps alloué")
+        self.set_root(position, mask)
+        deadline = None
+        if time_limit_ms is not None:
+            deadline = time.perf_counter() + time_limit_ms / 1000
+        self.iterations = 0
+        while iterations is None or self.iterations < iterations:
+            # L'horloge et la demande d'arrêt ne sont consultées que toutes les 64 simulations
+            if self.iterations % 64 == 0:
+                if self.stop_requested or (
+                    deadline is not None and time.perf_counter() >= deadline
+                ):
+                    break
+            self.iterate()
+            self.iterations += 1
+        self.stop_requested = False
+        return self.root_visits()
+
+    def root_visits(self):
+        """
+        Renvoie le nombre de visites de chaque coup de la racine, sous-arbre réutilisé compris.
+        :return: Dictionnaire colonne -> nombre de visites.
+        """
+        return {
+            self.moves[child]: self.visits[child]
+            for child in self.children[self.root] or ()
+        }
+
+    def iterate(self):
+        """
+        Effectue une simulation : sélection UCT, développement d'un nœud, partie aléatoire, rétropropagation.
+        """
+        node = self.root
+        children = self.children
+        visits = self.visits
+        wins = self.wins
+        while children[node] and self.results[node] == ONGOING:
+            log_visits = math.log(visits[node])
+            best = None
+            best_value = -1.0
+            for child in children[node]:
+                if visits[child] == 0:
+                    best = child
+                    break
+                value = wins[child] / visits[child] + self.exploration * math.sqrt(
+                    log_visits / visits[child]
+                )
+                if value > best_value:
+                    best_value = value
+                    best = child
+            node = best
+
+        result = self.results[node]
+        if result == ONGOING:
+            if children[node] is None and len(self.positions) < self.max_nodes:
+                self.expand(node)
+            # Score de la partie aléatoire pour le joueur au trait dans le nœud
+            outcome = self.rollout(self.positions[node], self.masks[node])
+            reward = 1.0 - outcome  # Pour le joueur qui a joué le coup menant au nœud
+        elif result == WIN:
+            reward = 1.0
+        else:
+            reward = 0.5
+
+        while node is not None:
+            visits[node] += 1
+            wins[node] += reward
+            reward = 1.0 - reward
+            node = self.parents[node]
+
+    def expand(self, node):
+        """
+        Crée les fils d'un nœud, du centre vers les bords.
+        """
+        geometry = self.geometry
+        position = self.positions[node]
+        mask = self.masks[node]
+        wins = geometry.winning_cells(position, mask)
+        created = []
+        for col in self.column_order:
+            if mask & geometry.top_masks[col]:
+                continue
+            move = (mask + geometry.bottom_masks[col]) & geometry.column_masks[col]
+            new_mask = mask | move
+            if wins & move:
+                result = WIN
+            elif new_mask == geometry.full_mask:
+                result = DRAW
+            else:
+                result = ONGOING
+            created.append(self.new_node(position ^ mask, new_mask, node, col, result))
+        self.children[node] = created
+
+    def rollout(self, position, mask):
+        """
+        Joue une partie aléatoire depuis la position ; un gain immédiat est toujours joué.
+        :param position: Jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        :return: 1 si le joueur au trait gagne, 0 s'il perd, 0,5 pour une partie nulle.
+        """
+        geometry = self.geometry
+        full_mask = geometry.full_mask
+        bottom_row = geometry.bottom_row
+        column_masks = geometry.column_masks
+        choice = self.random.choice
+        outcome = 1.0
+        while mask != full_mask:
+            playable = (mask + bottom_row) & full_mask
+            if geometry.winning_cells(position, mask) & playable:
+                return outcome
+            move = (
+                playable
+                & column_masks[
+                    choice(
+                        [
+                            col
+                            for col in range(self.cols)
+                            if playable & column_masks[col]
+                        ]
+                    )
+                ]
+            )
+            position ^= mask
+            mask |= move
+            outcome = 1.0 - outcome
+        return 0.5
+
+    def best_move(self, visits):
+        """
+        Choisit le coup le plus visité, le plus central en cas d'égalité.
+        :param visits: Dictionnaire colonne -> nombre de visites.
+        :return: Colonne à jouer, ou None s'il n'y a aucun coup.
+        """
+        if not visits:
+            return None
+        return max(self.column_order, key=lambda col: visits.get(col, -1))
+
+
+# Arbre conservé par chaque processus de la recherche parallèle (réutilisation des sous-arbres)
+_worker_trees = {}
+
+
+def mcts_root_visits(
+    rows, cols, connect, position, mask, iterations, time_limit_ms, seed
+):
+    """
+    Lance une recherche MCTS indépendante dans un processus du pool (parallélisation à la racine).
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :param position: Jetons du joueur au trait.
+    :param mask: Masque des cases occupées.
+    :param iterations: Nombre de simulations du processus (None pour n'être limité que par le temps).
+    :param time_limit_ms: Temps alloué, en millisecondes, ou None.
+    :param seed: Graine propre au processus, pour que les arbres diffèrent.
+    :return: Tuple (dictionnaire colonne -> visites de cette recherche, nombre de simulations).
+    """
+    geometry = (rows, cols, connect)
+    tree = _worker_trees.get(geometry)
+    if tree is None:
+        tree = _worker_trees[geometry] = MCTS(rows, cols, connect=connect)
+    tree.random.seed(seed)
+    # Un processus peut recevoir plusieurs tâches d'un même coup : seules les visites de cette recherche sont
+    # renvoyées, sans quoi celles du sous-arbre réutilisé seraient additionnées plusieurs fois
+    tree.set_root(position, mask)
+    previous = tree.root_visits()
+    visits = tree.search(position, mask, iterations, time_limit_ms)
+    return {
+        col: count - previous.get(col, 0) for col, count in visits.items()
+    }, tree.iterations
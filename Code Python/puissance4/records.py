@@ -0,0 +1,187 @@
+import os
+import struct
+
+from .engine import Puissance4
+
+# En-tête du fichier : signature, version, rangées, colonnes, alignement gagnant
+HEADER = struct.Struct("<4sBBBB")
+# En-tête d'une partie : gagnant, graine (-1 si aucune), longueurs des deux difficultés, nombre de coups
+RECORD = struct.Struct("<BqBBH")
+MAGIC = b"P4GR"
+VERSION = 2
+WINNERS = (None, "R", "J")
+
+
+class GameRecordWriter:
+    def __init__(self, path, rows=6, cols=7, connect=4):
+        """
+        Écrit des parties à la suite dans un fichier binaire compact, ouvert en ajout : un fichier existant est complété.
+        Chaque partie occupe une quinzaine d'octets d'en-tête plus un demi-octet par coup (un octet au-delà de 16 colonnes).
+        :param path: Chemin du fichier.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        """
+        self.path = path
+        self.rows = rows
+        self.cols = cols
+        self.connect = connect
+        self.count = 0  # Parties écrites par cette instance
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as file:
+                magic, version, *geometry = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Fichier de parties invalide : {path}")
+            if tuple(geometry) != (rows, cols, connect):
+                raise ValueError(
+                    f"Le fichier {path} contient des parties d'une autre géométrie"
+                )
+            self.file = open(path, "ab")
+        else:
+            self.file = open(path, "ab")
+            self.file.write(HEADER.pack(MAGIC, VERSION, rows, cols, connect))
+
+    def write(self, moves, winner=None, difficulty_R="", difficulty_J="", seed=None):
+        """
+        Ajoute une partie au fichier.
+        :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+        :param winner: Gagnant ('R', 'J') ou None pour une partie nulle ou interrompue.
+        :param difficulty_R: Difficulté de l'IA Rouge.
+        :param difficulty_J: Difficulté de l'IA Jaune.
+        :param seed: Graine de la partie, ou None.
+        """
+        name_R = difficulty_R.encode()
+        name_J = difficulty_J.encode()
+        header = RECORD.pack(
+            WINNERS.index(winner),
+            -1 if seed is None else seed,
+            len(name_R),
+            len(name_J),
+            len(moves),
+        )
+        self.file.write(header + name_R + name_J + pack_moves(moves, self.cols))
+        self.count += 1
+
+    def flush(self):
+        """
+        Force l'écriture sur disque des parties en mémoire tampon.
+        """
+        self.file.flush()
+
+    def close(self):
+        """
+        Ferme le fichier.
+        """
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameRecordReader:
+    def __init__(self, path):
+        """
+        Lit un fichier écrit par GameRecordWriter, partie par partie, sans le charger en mémoire.
+        :param path: Chemin du fichier.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            magic, version, self.rows, self.cols, self.connect = HEADER.unpack(
+                file.read(HEADER.size)
+            )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Fichier de parties invalide : {path}")
+
+    def __iter__(self):
+        """
+        Parcourt les parties du fichier dans l'ordre d'écriture.
+        :return: Générateur de dictionnaires (difficulty_R, difficulty_J, seed, winner, columns).
+        """
+        with open(self.path, "rb") as file:
+            file.seek(HEADER.size)
+            while True:
+                header = file.read(RECORD.size)
+                if len(header) < RECORD.size:
+                    return  # Fin du fichier (ou dernière partie tronquée par une écriture interrompue)
+                winner, seed, size_R, size_J, count = RECORD.unpack(header)
+                names = file.read(size_R + size_J)
+                packed = file.read(packed_size(count, self.cols))
+                if len(packed) < packed_size(count, self.cols):
+                    return
+                yield {
+                    "difficulty_R": names[:size_R].decode(),
+                    "difficulty_J": names[size_R:].decode(),
+                    "seed": None if seed < 0 else seed,
+                    "winner": WINNERS[winner],
+                    "columns": unpack_moves(packed, count, self.cols),
+                }
+
+
+def packed_size(count, cols):
+    """
+    Calcule la taille d'une suite de coups compactée.
+    :param count: Nombre de coups.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Nombre d'octets.
+    """
+    return (count + 1) // 2 if cols <= 16 else count
+
+
+def pack_moves(moves, cols):
+    """
+    Compacte une suite de coups : deux coups par octet (quartets) jusqu'à 16 colonnes, un octet par coup au-delà.
+    :param moves: Colonnes jouées.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Octets de la suite.
+    """
+    if cols > 16:
+        return bytes(moves)
+    padded = list(moves) + [0] * (len(moves) % 2)
+    return bytes(padded[i] | padded[i + 1] << 4 for i in range(0, len(padded), 2))
+
+
+def unpack_moves(data, count, cols):
+    """
+    Décompacte une suite de coups produite par pack_moves.
+    :param data: Octets de la suite.
+    :param count: Nombre de coups.
+    :param cols: Nombre de colonnes du plateau.
+    :return: Liste des colonnes jouées.
+    """
+    if cols > 16:
+        return list(data[:count])
+    moves = []
+    for byte in data:
+        moves.append(byte & 0x0F)
+        moves.append(byte >> 4)
+    return moves[:count]
+
+
+def read_game_records(path):
+    """
+    Parcourt les parties d'un fichier écrit par GameRecordWriter.
+    :param path: Chemin du fichier.
+    :return: Générateur de dictionnaires décrivant les parties.
+    """
+    return iter(GameRecordReader(path))
+
+
+def replay_record(record, rows=6, cols=7, connect=4):
+    """
+    Rejoue une partie enregistrée coup par coup.
+    La même instance de Puissance4 est renvoyée à chaque étape, modifiée en place.
+    :param record: Dictionnaire décrivant la partie (voir GameRecordReader).
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param connect: Nombre de jetons à aligner pour gagner.
+    :return: Générateur de tuples (partie, colonne jouée, joueur), après chaque coup.
+    """
+    game = Puissance4(rows=rows, cols=cols, tt_size_mb=0, connect=connect)
+    player = "R"
+    for col in record["columns"]:
+        game.insert_token(col, player)
+        yield game, col, player
+        player = "J" if player == "R" else "R"
@@ -0,0 +1,414 @@
+import asyncio
+import itertools
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .book import open_book, replay
+from .encoding import decode_moves, encode_moves
+from .engine import SEARCH_DEPTHS, Puissance4
+
+# Longueur maximale d'une ligne de requête, en octets
+MAX_LINE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    """
+    Levée par le traitement d'une requête invalide ou refusée ; son message est renvoyé au client.
+    """
+
+
+def parse_geometry(request):
+    """
+    Lit et valide la géométrie du plateau d'une requête ('rows', 'cols', 'connect').
+    La taille du plateau est bornée : il est construit dans la boucle asyncio.
+    :param request: Requête décodée.
+    :return: Tuple (rows, cols, connect).
+    :raises RequestError: Si la géométrie est absente de ces bornes ou mal formée.
+    """
+    try:
+        rows = int(request.get("rows", 6))
+        cols = int(request.get("cols", 7))
+        connect = int(request.get("connect", 4))
+    except (TypeError, ValueError):
+        raise RequestError("Géométrie invalide")
+    if not (
+        rows >= 1
+        and cols >= 1
+        and 2 <= connect <= max(rows, cols)
+        and rows * cols <= 400
+        and cols <= 35
+    ):
+        raise RequestError("Géométrie invalide")
+    return rows, cols, connect
+
+
+class GameServer:
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8765,
+        workers=None,
+        max_queue=64,
+        max_games=1000,
+        max_pipeline=8,
+        default_time_ms=1000,
+        book_path=None,
+    ):
+        """
+        Serveur asyncio de parties de Puissance 4 : une requête JSON par ligne sur TCP, une réponse JSON par ligne.
+        Les recherches (best_move) sont confiées à un pool de processus borné, si bien qu'une recherche longue
+        ne bloque pas les autres parties ; la boucle asyncio ne fait que valider les coups et tenir l'état des parties.
+        :param host: Adresse d'écoute.
+        :param port: Port d'écoute (0 pour un port libre, lu ensuite dans self.port).
+        :param workers: Nombre de processus de recherche (None pour tous les cœurs).
+        :param max_queue: Nombre maximal de recherches en attente ou en cours ; au-delà, les requêtes sont refusées.
+        :param max_games: Nombre maximal de parties ouvertes simultanément.
+        :param max_pipeline: Requêtes d'une même connexion traitées en parallèle ; au-delà, la lecture est suspendue.
+        :param default_time_ms: Temps de recherche alloué par défaut à un coup de l'IA, en millisecondes.
+        :param book_path: Livre d'ouvertures partagé (projeté en mémoire en lecture seule par chaque processus).
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_games = max_games
+        self.max_pipeline = max_pipeline
+        self.default_time_ms = default_time_ms
+        self.book_path = book_path
+        self.games = {}  # Identifiant -> état de la partie (voir command_new)
+        self.game_ids = itertools.count(1)
+        self.pending = 0  # Recherches en attente ou en cours dans le pool
+        # Flux d'écriture de chaque client connecté -> tâche qui le sert
+        self.connections = {}
+        self.executor = None
+        self.server = None
+        self.commands = {
+            "new": self.command_new,
+            "play": self.command_play,
+            "ai": self.command_ai,
+            "state": self.command_state,
+            "close": self.command_close,
+            "bestmove": self.command_bestmove,
+        }
+
+    async def start(self):
+        """
+        Démarre le pool de processus et l'écoute TCP.
+        """
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_LINE
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        Démarre le serveur et traite les connexions jusqu'à son arrêt.
+        """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """
+        Arrête l'écoute et le pool de processus.
+        """
+        if self.server is not None:
+            self.server.close()
+            # Fermer les connexions termine la lecture des clients (fin de flux) avant l'attente de l'arrêt
+            handlers = list(self.connections.values())
+            for writer in list(self.connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    async def handle_connection(self, reader, writer):
+        """
+        Lit les requêtes d'un client ligne par ligne ; chacune est traitée dans sa propre tâche,
+        dans la limite de max_pipeline requêtes en cours par connexion.
+        """
+        slots = asyncio.Semaphore(self.max_pipeline)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # Ligne trop longue ou connexion coupée
+                if not line:
+                    break
+                task = asyncio.create_task(
+                    self.handle_line(line, writer, write_lock, slots)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.connections.pop(writer, None)
+            writer.close()
+
+    async def handle_line(self, line, writer, write_lock, slots):
+        """
+        Traite une requête et écrit sa réponse, qui reprend l'identifiant 'id' de la requête.
+        """
+        request_id = None
+        try:
+            try:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    raise RequestError("Requête JSON invalide")
+                if not isinstance(request, dict):
+                    raise RequestError("La requête doit être un objet JSON")
+                request_id = request.get("id")
+                command = self.commands.get(request.get("op"))
+                if command is None:
+                    raise RequestError(f"Opération inconnue : {request.get('op')}")
+                response = {"ok": True, **await command(request)}
+            except RequestError as error:
+                response = {"ok": False, "error": str(error)}
+            except Exception as error:
+                # Erreur interne : le client reçoit tout de même une réponse, et la connexion reste utilisable
+                logger.exception("Erreur lors du traitement de la requête %r", line)
+                response = {"ok": False, "error": f"Erreur interne : {error}"}
+            response["id"] = request_id
+            try:
+                async with write_lock:
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    await writer.drain()
+            except ConnectionError:
+                pass
+        finally:
+            slots.release()
+
+    def get_game(self, request):
+        """
+        Renvoie l'état de la partie désignée par la requête.
+        :raises RequestError: Si la partie n'existe pas.
+        """
+        entry = self.games.get(request.get("game"))
+        if entry is None:
+            raise RequestError("Partie inconnue")
+        return entry
+
+    def describe(self, game_id):
+        """
+        Décrit une partie pour les réponses : coups joués, trait, plateau et résultat.
+        """
+        game = self.games[game_id]["game"]
+        return {
+            "game": game_id,
+            "moves": encode_moves(game.moves_played),
+            "turn": game.turn,
+            "board": ["".join(row) for row in game.board],
+            "over": game.is_game_over(),
+            "winner": game.check_winner(),
+        }
+
+    async def command_new(self, request):
+        """
+        Crée une partie contre l'IA : {"op": "new", "difficulty", "human" ('R' ou 'J'), "rows", "cols", "connect"}.
+        """
+        if len(self.games) >= self.max_games:
+            raise RequestError("Trop de parties ouvertes")
+        rows, cols, connect = parse_geometry(request)
+        difficulty = request.get("difficulty", "medium")
+        if difficulty not in list(SEARCH_DEPTHS) + ["perfect", "mcts"]:
+            raise RequestError(f"Difficulté inconnue : {difficulty}")
+        human = request.get("human", "R")
+        if human not in ("R", "J"):
+            raise RequestError("Le joueur humain doit être 'R' ou 'J'")
+        game_id = next(self.game_ids)
+        self.games[game_id] = {
+            # La partie du serveur ne sert qu'à valider les coups : pas de table de transposition
+            "game": Puissance4(rows=rows, cols=cols, connect=connect, tt_size_mb=0),
+            "difficulty": difficulty,
+            "human": human,
+            "lock": asyncio.Lock(),
+        }
+        return self.describe(game_id)
+
+    async def command_play(self, request):
+        """
+        Joue le coup du joueur humain : {"op": "play", "game", "col"} (colonne à partir de 0).
+        """
+        entry = self.get_game(request)
+        game = entry["game"]
+        async with entry["lock"]:
+            if game.is_game_over():
+                raise RequestError("La partie est terminée")
+            if game.turn != entry["human"]:
+                raise RequestError("Ce n'est pas au joueur humain de jouer")
+            col = request.get("col")
+            # bool est une sous-classe d'int : true jouerait la deuxième colonne
+            if (
+                not isinstance(col, int)
+                or isinstance(col, bool)
+                or not game.insert_token(col, game.turn)
+            ):
+                raise RequestError("Coup invalide")
+            game.turn = "J" if game.turn == "R" else "R"
+            return self.describe(request["game"])
+
+    async def command_ai(self, request):
+        """
+        Fait jouer l'IA : {"op": "ai", "game", "time_limit_ms", "deadline_ms"}.
+        """
+        entry = self.get_game(request)
+        game = entry["game"]
+        async with entry["lock"]:
+            if game.is_game_over():
+                raise RequestError("La partie est terminée")
+            if game.turn == entry["human"]:
+                raise RequestError("C'est au joueur humain de jouer")
+            col, nodes = await self.search(
+                game.rows,
+                game.cols,
+                game.connect,
+                entry["difficulty"],
+                list(game.moves_played),
+                request,
+            )
+            # La partie a pu être fermée pendant la recherche
+            if self.games.get(request["game"]) is not entry:
+                raise RequestError("Partie fermée pendant la recherche")
+            game.insert_token(col, game.turn)
+            game.turn = "J" if game.turn == "R" else "R"
+            return {"col": col, "nodes": nodes, **self.describe(request["game"])}
+
+    async def command_state(self, request):
+        """
+        Renvoie l'état d'une partie : {"op": "state", "game"}.
+        """
+        self.get_game(request)
+        return self.describe(request["game"])
+
+    async def command_close(self, request):
+        """
+        Ferme une partie : {"op": "close", "game"}.
+        """
+        self.get_game(request)
+        del self.games[request["game"]]
+        return {"game": request["game"]}
+
+    async def command_bestmove(self, request):
+        """
+        Calcule un coup sans partie ouverte : {"op": "bestmove", "position" (ex. "4453"), "difficulty",
+        "rows", "cols", "connect", "time_limit_ms", "deadline_ms"}.
+        """
+        rows, cols, connect = parse_geometry(request)
+        try:
+            moves = decode_moves(str(request.get("position", "")))
+        except (TypeError, ValueError) as error:
+            raise RequestError(f"Position invalide : {error}")
+        game = Puissance4(rows=rows, cols=cols, connect=connect, tt_size_mb=0)
+        player = "R"
+        for col in moves:
+            if game.is_game_over() or not game.insert_token(col, player):
+                raise RequestError("Position invalide")
+            player = "J" if player == "R" else "R"
+        if game.is_game_over():
+            raise RequestError("La partie est terminée")
+        difficulty = request.get("difficulty", "medium")
+        if difficulty not in list(SEARCH_DEPTHS) + ["perfect", "mcts"]:
+            raise RequestError(f"Difficulté inconnue : {difficulty}")
+        col, nodes = await self.search(rows, cols, connect, difficulty, moves, request)
+        return {"col": col, "nodes": nodes}
+
+    async def search(self, rows, cols, connect, difficulty, moves, request):
+        """
+        Confie une recherche au pool de processus, en refusant la requête si trop de recherches sont en attente.
+        L'échéance (deadline_ms, temps total file d'attente comprise) limite aussi la durée de la recherche elle-même.
+        :return: Tuple (colonne choisie, nœuds visités).
+        :raises RequestError: Si le serveur est saturé ou si l'échéance est dépassée.
+        """
+        if self.pending >= self.max_queue:
+            raise RequestError("Serveur saturé, réessayez plus tard")
+        time_limit_ms = request.get("time_limit_ms", self.default_time_ms)
+        deadline_ms = request.get("deadline_ms")
+        try:
+            time_limit_ms = None if time_limit_ms is None else float(time_limit_ms)
+            deadline = None if deadline_ms is None else float(deadline_ms) / 1000
+        except (TypeError, ValueError):
+            raise RequestError("Temps alloué invalide")
+        config = (rows, cols, connect, self.book_path)
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            future = loop.run_in_executor(
+                self.executor,
+                server_best_move,
+                config,
+                difficulty,
+                moves,
+                time_limit_ms,
+                None if deadline is None else time.time() + deadline,
+            )
+            try:
+                if deadline is None:
+                    col, nodes = await future
+                else:
+                    # Marge pour le retour du résultat : la recherche s'arrête d'elle-même à l'échéance
+                    col, nodes = await asyncio.wait_for(future, deadline + 0.5)
+            except asyncio.TimeoutError:
+                raise RequestError("Échéance dépassée")
+        finally:
+            self.pending -= 1
+        if col is None:
+            raise RequestError("Échéance dépassée")
+        return col, nodes
+
+
+# Parties conservées par chaque processus du pool (tables de transposition gardées chaudes)
+_server_games = {}
+
+
+def server_best_move(config, difficulty, moves, time_limit_ms, deadline):
+    """
+    Calcule le coup de l'IA dans un processus du pool du serveur.
+    :param config: Tuple (rows, cols, connect, chemin du livre d'ouvertures ou None).
+    :param difficulty: Difficulté de l'IA.
+    :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+    :param time_limit_ms: Temps de recherche alloué, en millisecondes (None pour la profondeur fixe de la difficulté).
+    :param deadline: Échéance absolue (time.time()) de la requête, ou None.
+    :return: Tuple (colonne ou None si l'échéance est dépassée avant le début de la recherche, nœuds visités).
+    """
+    if deadline is not None:
+        remaining_ms = (deadline - time.time()) * 1000
+        if remaining_ms <= 0:
+            return None, 0  # La requête a trop attendu dans la file
+        time_limit_ms = (
+            remaining_ms if time_limit_ms is None else min(time_limit_ms, remaining_ms)
+        )
+    game = _server_games.get((config, difficulty))
+    if game is None:
+        rows, cols, connect, book_path = config
+        game = Puissance4(
+            rows=rows,
+            cols=cols,
+            connect=connect,
+            difficulty_R=difficulty,
+            difficulty_J=difficulty,
+            opening_book=open_book(book_path) if book_path else None,
+        )
+        _server_games[(config, difficulty)] = game
+    replay(game, moves)
+    player = "R" if len(moves) % 2 == 0 else "J"
+    # Avec un temps alloué, l'approfondissement itératif s'arrête à la profondeur de la difficulté
+    max_depth = SEARCH_DEPTHS.get(difficulty) if time_limit_ms is not None else None
+    col = game.best_move(player, time_limit_ms=time_limit_ms, max_depth=max_depth)
+    return col, game.nodes
@@ -0,0 +1,207 @@
+from array import array
+
+from .bitboard import BitBoard
+from .encoding import mirror_key
+
+
+class Solver:
+    def __init__(
+        self, rows=6, cols=7, max_entries=2_000_000, connect=4, symmetry_plies=14
+    ):
+        """
+        Solveur exact de Puissance 4 (négamax à fenêtre nulle à la Pascal Pons) travaillant directement sur les bitboards.
+        Les positions sont représentées par (jetons du joueur au trait, masque des cases occupées).
+        Le score est positif si le joueur au trait gagne : il vaut le nombre de ses jetons restant à poser
+        après le coup gagnant, plus un ; il est négatif s'il perd, nul pour une partie nulle.
+        :param rows: Nombre de rangées du plateau.
+        :param cols: Nombre de colonnes du plateau.
+        :param max_entries: Nombre maximal de positions conservées dans la table du solveur.
+        :param connect: Nombre de jetons à aligner pour gagner.
+        :param symmetry_plies: Nombre de jetons en deçà duquel une position et sa symétrique partagent leur entrée
+                               de table ; plus loin dans la partie, les transpositions symétriques sont trop rares
+                               pour payer le calcul de la clé symétrique à chaque nœud.
+        """
+        self.geometry = BitBoard(rows, cols, connect)
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.min_score = -(self.cells // 2) + 3
+        self.max_entries = max_entries
+        self.symmetry_plies = symmetry_plies
+        # Table clé canonique de position -> borne supérieure du score (décalée pour rester strictement positive) ;
+        # une position et sa symétrique ont la même valeur et partagent leur entrée
+        self.table = {}
+        self.nodes = 0
+        self.column_order = sorted(range(cols), key=lambda c: abs(2 * c - (cols - 1)))
+
+    def solve(self, position, mask):
+        """
+        Calcule la valeur exacte d'une position par recherches successives à fenêtre nulle (dichotomie sur le score).
+        :param position: Bitboard des jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        :return: Score exact de la position pour le joueur au trait.
+        """
+        moves = mask.bit_count()
+        if self.can_win_next(position, mask):
+            return (self.cells + 1 - moves) // 2
+        low = -((self.cells - moves) // 2)
+        high = (self.cells + 1 - moves) // 2
+        while low < high:
+            middle = low + (high - low) // 2
+            # On teste d'abord les scores proches de 0, qui sont les plus fréquents
+            if middle <= 0 and int(low / 2) < middle:
+                middle = int(low / 2)
+            elif middle >= 0 and high // 2 > middle:
+                middle = high // 2
+            result = self.negamax(position, mask, moves, middle, middle + 1)
+            if result <= middle:
+                high = result
+            else:
+                low = result
+        return low
+
+    def analyze(self, position, mask):
+        """
+        Calcule le score exact de chaque coup jouable depuis la position.
+        :param position: Bitboard des jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        :return: Dictionnaire colonne -> score du coup pour le joueur au trait.
+        """
+        geometry = self.geometry
+        moves = mask.bit_count()
+        wins = geometry.winning_cells(position, mask)
+        scores = {}
+        for col in range(self.cols):
+            if mask & geometry.top_masks[col]:
+                continue
+            move = (mask + geometry.bottom_masks[col]) & geometry.column_masks[col]
+            if wins & move:
+                scores[col] = (self.cells + 1 - moves) // 2
+            else:
+                scores[col] = -self.solve(position ^ mask, mask | move)
+        return scores
+
+    def can_win_next(self, position, mask):
+        """
+        Indique si le joueur au trait peut gagner immédiatement.
+        """
+        geometry = self.geometry
+        playable = (mask + geometry.bottom_row) & geometry.full_mask
+        return bool(geometry.winning_cells(position, mask) & playable)
+
+    def non_losing_moves(self, position, mask):
+        """
+        Calcule les coups qui ne donnent pas une victoire immédiate à l'adversaire.
+        :return: Bitboard des cases jouables retenues (0 si tous les coups perdent).
+        """
+        geometry = self.geometry
+        playable = (mask + geometry.bottom_row) & geometry.full_mask
+        opponent_wins = geometry.winning_cells(position ^ mask, mask)
+        forced = playable & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return 0  # Deux menaces adverses : impossible de parer les deux
+            playable = forced
+        # Ne pas jouer juste sous une case gagnante de l'adversaire
+        return playable & ~(opponent_wins >> 1)
+
+    def negamax(self, position, mask, moves, alpha, beta):
+        """
+        Négamax avec élagage alpha-bêta, utilisé avec une fenêtre nulle par solve.
+        :param position: Bitboard des jetons du joueur au trait.
+        :param mask: Masque des cases occupées.
+        :param moves: Nombre de jetons déjà posés.
+        :param alpha: Borne inférieure de la fenêtre.
+        :param beta: Borne supérieure de la fenêtre.
+        :return: Score de la position, exact s'il est strictement dans la fenêtre.
+        """
+        self.nodes += 1
+        playable = self.non_losing_moves(position, mask)
+        if not playable:
+            return -((self.cells - moves) // 2)
+        if moves >= self.cells - 2:
+            return 0  # Aucun des deux joueurs ne peut plus gagner
+
+        lower = -((self.cells - 2 - moves) // 2)
+        if alpha < lower:
+            alpha = lower
+            if alpha >= beta:
+                return alpha
+        upper = (self.cells - 1 - moves) // 2
+        key = position + mask
+        if moves < self.symmetry_plies:
+            mirrored = mirror_key(key, self.rows, self.cols)
+            if mirrored < key:
+                key = mirrored
+        stored = self.table.get(key)
+        if stored is not None:
+            upper = stored + self.min_score - 1
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        # Les coups créant le plus de menaces sont explorés en premier (le centre départage)
+        geometry = self.geometry
+        candidates = []
+        for rank, col in enumerate(self.column_order):
+            move = playable & geometry.column_masks[col]
+            if move:
+                threats = geometry.winning_cells(position | move, mask).bit_count()
+                candidates.append((-threats, rank, move))
+        candidates.sort()
+
+        for _, _, move in candidates:
+            score = -self.negamax(
+                position ^ mask, mask | move, moves + 1, -beta, -alpha
+            )
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        if len(self.table) >= self.max_entries:
+            self.table.clear()
+        self.table[key] = alpha - self.min_score + 1
+        return alpha
+
+    def check_table_format(self):
+        """
+        Vérifie que la table du solveur peut être enregistrée : les clés de position sont stockées sur 64 bits
+        (et les bornes, qui ne dépassent alors pas le nombre de cases, sur un octet).
+        :raises ValueError: Si le plateau compte plus de 64 bits de bitboard.
+        """
+        if (self.rows + 1) * self.cols > 64:
+            raise ValueError(
+                f"Plateau {self.rows}x{self.cols} trop grand pour une table du solveur sur 64 bits"
+            )
+
+    def save(self, path):
+        """
+        Enregistre la table du solveur (clés de 64 bits et bornes) pour la réutiliser d'une session à l'autre.
+        :param path: Chemin du fichier à écrire.
+        :raises ValueError: Si le plateau est trop grand pour le format (voir check_table_format).
+        """
+        self.check_table_format()
+        keys = array("Q", self.table.keys())
+        values = array("b", self.table.values())
+        with open(path, "wb") as file:
+            array("Q", [len(keys)]).tofile(file)
+            keys.tofile(file)
+            values.tofile(file)
+
+    def load(self, path):
+        """
+        Charge une table enregistrée par save et la fusionne avec la table courante.
+        :param path: Chemin du fichier à lire.
+        :raises ValueError: Si le plateau est trop grand pour le format (voir check_table_format).
+        """
+        self.check_table_format()
+        with open(path, "rb") as file:
+            count = array("Q")
+            count.fromfile(file, 1)
+            keys = array("Q")
+            keys.fromfile(file, count[0])
+            values = array("b")
+            values.fromfile(file, count[0])
+        self.table.update(zip(keys, values))
@@ -0,0 +1,176 @@
+import time
+
+
+class SearchStats:
+    def __init__(self, profile=False):
+        """
+        Statistiques d'une recherche (un appel à best_move, ou l'agrégat de plusieurs).
+        :param profile: Mesure aussi le temps passé dans la détection de fin de partie et dans l'évaluation
+                        (plus coûteux : deux appels d'horloge par nœud).
+        """
+        self.profile = profile
+        self.searches = 0  # Nombre d'appels à best_move agrégés
+        self.nodes = 0  # Appels à minimax
+        self.interior_nodes = 0  # Nœuds dont les coups ont été développés
+        self.root_moves = (
+            0  # Coups de la racine cherchés (toutes itérations confondues)
+        )
+        self.leaves = 0  # Évaluations de feuilles (profondeur 0 ou fin de partie)
+        self.cutoffs = 0  # Coupures alpha-bêta
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.time = 0.0
+        self.game_over_time = (
+            0.0  # Temps dans is_game_over / check_winner (profil uniquement)
+        )
+        self.evaluate_time = 0.0  # Temps dans evaluate_board (profil uniquement)
+        # Profondeur -> {"nodes", "time", "col", "score"} pour chaque itération terminée
+        self.depths = {}
+
+    def timed(self, name, function, *args):
+        """
+        Appelle une fonction et, en mode profil, ajoute sa durée au compteur de temps donné.
+        :param name: Attribut cumulant la durée ('game_over_time' ou 'evaluate_time').
+        :param function: Fonction à appeler.
+        :return: Résultat de la fonction.
+        """
+        if not self.profile:
+            return function(*args)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    def record_depth(self, depth, nodes, duration, col, score):
+        """
+        Enregistre le résultat d'une itération terminée de la recherche.
+        :param depth: Profondeur de l'itération.
+        :param nodes: Nœuds visités pendant l'itération.
+        :param duration: Durée de l'itération, en secondes.
+        :param col: Meilleur coup trouvé.
+        :param score: Score de ce coup.
+        """
+        self.depths[depth] = {
+            "nodes": nodes,
+            "time": duration,
+            "col": col,
+            "score": score,
+        }
+
+    def branching_factor(self):
+        """
+        Calcule le facteur de branchement moyen observé (enfants cherchés par nœud développé).
+        :return: Facteur de branchement, ou 0 si aucun nœud n'a été développé.
+        """
+        if not self.interior_nodes:
+            return 0.0
+        return (self.nodes - self.root_moves) / self.interior_nodes
+
+    def tt_hit_rate(self):
+        """
+        Calcule la proportion de consultations de la table de transposition ayant trouvé la position.
+        :return: Taux de succès entre 0 et 1.
+        """
+        probes = self.tt_hits + self.tt_misses
+        return self.tt_hits / probes if probes else 0.0
+
+    def cutoff_rate(self):
+        """
+        Calcule la proportion de nœuds développés terminés par une coupure alpha-bêta.
+        :return: Taux de coupure entre 0 et 1.
+        """
+        return self.cutoffs / self.interior_nodes if self.interior_nodes else 0.0
+
+    def nodes_per_second(self):
+        """
+        Calcule le débit de la recherche.
+        :return: Nœuds visités par seconde.
+        """
+        return self.nodes / self.time if self.time else 0.0
+
+    def merge(self, other):
+        """
+        Ajoute les statistiques d'une autre recherche à celles-ci (agrégation sur plusieurs coups ou parties).
+        :param other: Instance de SearchStats à ajouter.
+        :return: Cette instance, pour chaîner les appels.
+        """
+        for name in (
+            "searches",
+            "nodes",
+            "interior_nodes",
+            "root_moves",
+            "leaves",
+            "cutoffs",
+            "tt_hits",
+            "tt_misses",
+            "time",
+            "game_over_time",
+            "evaluate_time",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.profile = self.profile or other.profile
+        for depth, entry in other.depths.items():
+            total = self.depths.setdefault(depth, {"nodes": 0, "time": 0.0})
+            total["nodes"] += entry["nodes"]
+            total["time"] += entry["time"]
+        return self
+
+    def to_dict(self):
+        """
+        Convertit les statistiques en dictionnaire sérialisable (JSON, envoi entre processus, métriques).
+        :return: Dictionnaire des compteurs et des taux dérivés.
+        """
+        return {
+            "profile": self.profile,
+            "searches": self.searches,
+            "nodes": self.nodes,
+            "interior_nodes": self.interior_nodes,
+            "root_moves": self.root_moves,
+            "leaves": self.leaves,
+            "cutoffs": self.cutoffs,
+            "tt_hits": self.tt_hits,
+            "tt_misses": self.tt_misses,
+            "time": self.time,
+            "game_over_time": self.game_over_time,
+            "evaluate_time": self.evaluate_time,
+            "depths": {str(depth): entry for depth, entry in self.depths.items()},
+            "nodes_per_second": self.nodes_per_second(),
+            "branching_factor": self.branching_factor(),
+            "tt_hit_rate": self.tt_hit_rate(),
+            "cutoff_rate": self.cutoff_rate(),
+        }
+
+    def summary(self):
+        """
+        Résume les statistiques sur une ligne, pour l'affichage en console.
+        :return: Chaîne lisible.
+        """
+        text = (
+            f"{self.nodes} nœuds ({self.nodes_per_second():.0f}/s), "
+            f"table {self.tt_hit_rate():.1%}, coupures {self.cutoff_rate():.1%}, "
+            f"branchement {self.branching_factor():.2f}"
+        )
+        if self.profile:
+            text += (
+                f", fin de partie {self.game_over_time:.2f}s, "
+                f"évaluation {self.evaluate_time:.2f}s"
+            )
+        return text
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Reconstruit des statistiques à partir de to_dict (par exemple reçues d'un autre processus).
+        :param data: Dictionnaire produit par to_dict.
+        :return: Instance de SearchStats.
+        """
+        stats = cls()
+        for name, value in data.items():
+            if name == "depths":
+                stats.depths = {
+                    int(depth): dict(entry) for depth, entry in value.items()
+                }
+            elif hasattr(stats, name) and not callable(getattr(stats, name)):
+                setattr(stats, name, value)
+        return stats
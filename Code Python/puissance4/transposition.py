@@ -0,0 +1,315 @@
+import functools
+import json
+import random
+from array import array
+from multiprocessing import shared_memory
+
+
+@functools.lru_cache(maxsize=None)
+def zobrist_keys(rows, cols, seed=0x50344B):
+    """
+    Génère les clés de Zobrist (64 bits) de chaque case pour chaque joueur, identiques d'un processus à l'autre.
+    :param rows: Nombre de rangées du plateau.
+    :param cols: Nombre de colonnes du plateau.
+    :param seed: Graine du générateur pseudo-aléatoire.
+    :return: Dictionnaire joueur -> tableau [rangée][colonne] de clés, plus la clé 'side' du trait.
+    """
+    rng = random.Random(seed)
+    keys = {
+        player: tuple(
+            tuple(rng.getrandbits(64) for _ in range(cols)) for _ in range(rows)
+        )
+        for player in ("R", "J")
+    }
+    keys["side"] = rng.getrandbits(64)  # Ajoutée quand le Jaune a le trait
+    return keys
+
+
+def profile_key(parameters):
+    """
+    Génère une clé de 64 bits propre à un vecteur de paramètres d'évaluation, pour séparer les entrées de la table
+    de transposition : deux moteurs de même difficulté mais de poids différents ne partagent aucune entrée.
+    :param parameters: Dictionnaire nom -> valeur des paramètres d'évaluation.
+    :return: Clé de 64 bits, stable d'un processus à l'autre.
+    """
+    profile = json.dumps(parameters, sort_keys=True)
+    return random.Random(f"profile:{profile}").getrandbits(64)
+
+
+def stored_value(value):
+    """
+    Restitue une valeur lue dans une table : les valeurs sont rangées en flottants (pour les bornes infinies
+    et les évaluations à poids non entiers), les scores entiers sont rendus entiers comme ceux de la recherche.
+    :param value: Valeur flottante lue dans la table.
+    :return: Entier si la valeur est entière, la valeur inchangée sinon.
+    """
+    return int(value) if value.is_integer() else value
+
+
+class TranspositionTable:
+    # Type de la valeur stockée : exacte, borne inférieure (coupure bêta) ou borne supérieure (coupure alpha)
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+    # Octets occupés par un bucket : deux entrées (clé 'Q', profondeur 'h', valeur 'd', type 'b', coup 'b')
+    BUCKET_BYTES = 2 * (8 + 2 + 8 + 1 + 1)
+
+    def __init__(self, size_mb=16):
+        """
+        Table de transposition de taille fixe, stockée dans des tableaux typés.
+        Chaque bucket contient une entrée « profondeur préférée » et une entrée « toujours remplacée ».
+        :param size_mb: Mémoire maximale allouée à la table, en mégaoctets.
+        """
+        buckets = max(1, int(size_mb * 2**20) // self.BUCKET_BYTES)
+        self.size = 1 << (
+            buckets.bit_length() - 1
+        )  # Puissance de 2 pour indexer par masque
+        self.index_mask = self.size - 1
+        self.deep_keys = array("Q", bytes(8 * self.size))
+        self.deep_depths = array("h", [-1]) * self.size
+        self.deep_values = array("d", bytes(8 * self.size))
+        self.deep_flags = array("b", bytes(self.size))
+        self.deep_moves = array("b", bytes(self.size))
+        self.recent_keys = array("Q", bytes(8 * self.size))
+        self.recent_depths = array("h", [-1]) * self.size
+        self.recent_values = array("d", bytes(8 * self.size))
+        self.recent_flags = array("b", bytes(self.size))
+        self.recent_moves = array("b", bytes(self.size))
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def probe(self, key):
+        """
+        Recherche une position dans la table.
+        :param key: Clé de Zobrist de la position.
+        :return: Tuple (profondeur, type, valeur, meilleur coup) ou None si la position est absente.
+        """
+        index = key & self.index_mask
+        if self.deep_depths[index] >= 0 and self.deep_keys[index] == key:
+            self.hits += 1
+            return (
+                self.deep_depths[index],
+                self.deep_flags[index],
+                stored_value(self.deep_values[index]),
+                self.deep_moves[index],
+            )
+        if self.recent_depths[index] >= 0 and self.recent_keys[index] == key:
+            self.hits += 1
+            return (
+                self.recent_depths[index],
+                self.recent_flags[index],
+                stored_value(self.recent_values[index]),
+                self.recent_moves[index],
+            )
+        self.misses += 1
+        if self.deep_depths[index] >= 0 or self.recent_depths[index] >= 0:
+            self.collisions += 1  # Le bucket est occupé par d'autres positions
+        return None
+
+    def store(self, key, depth, flag, value, move=-1):
+        """
+        Enregistre une position : l'entrée la plus profonde est conservée, l'autre emplacement est toujours remplacé.
+        :param key: Clé de Zobrist de la position.
+        :param depth: Profondeur de recherche restante de l'évaluation.
+        :param flag: Type de la valeur (EXACT, LOWER ou UPPER).
+        :param value: Valeur de la position.
+        :param move: Meilleur coup trouvé, ou -1 s'il n'y en a pas.
+        """
+        index = key & self.index_mask
+        deep_depth = self.deep_depths[index]
+        if deep_depth < 0 or self.deep_keys[index] == key or depth >= deep_depth:
+            if deep_depth >= 0 and self.deep_keys[index] != key:
+                # L'ancienne entrée profonde est rétrogradée plutôt que perdue
+                self.recent_keys[index] = self.deep_keys[index]
+                self.recent_depths[index] = deep_depth
+                self.recent_values[index] = self.deep_values[index]
+                self.recent_flags[index] = self.deep_flags[index]
+                self.recent_moves[index] = self.deep_moves[index]
+            self.deep_keys[index] = key
+            self.deep_depths[index] = depth
+            self.deep_values[index] = value
+            self.deep_flags[index] = flag
+            self.deep_moves[index] = move
+        else:
+            self.recent_keys[index] = key
+            self.recent_depths[index] = depth
+            self.recent_values[index] = value
+            self.recent_flags[index] = flag
+            self.recent_moves[index] = move
+
+    def clear(self):
+        """
+        Vide la table sans réallouer la mémoire.
+        """
+        self.deep_depths[:] = array("h", [-1]) * self.size
+        self.recent_depths[:] = array("h", [-1]) * self.size
+        self.hits = self.misses = self.collisions = 0
+
+    def stats(self):
+        """
+        Renvoie les compteurs d'utilisation de la table.
+        :return: Dictionnaire avec les succès, échecs, collisions et la mémoire occupée.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "size": self.size,
+            "bytes": self.size * self.BUCKET_BYTES,
+        }
+
+
+class SharedTranspositionTable(TranspositionTable):
+    # Octets occupés par un bucket : deux entrées de trois mots de 64 bits (vérification, valeur, informations)
+    BUCKET_BYTES = 2 * 3 * 8
+    # En-tête du segment : nombre de buckets, pour que les processus qui s'y attachent retrouvent la taille
+    HEADER_BYTES = 8
+
+    def __init__(self, size_mb=16, name=None):
+        """
+        Table de transposition stockée dans un segment de mémoire partagée (multiprocessing.shared_memory),
+        commune à tous les processus qui s'y attachent : la mémoire est plafonnée une seule fois pour tous.
+        Les écritures se font sans verrou ; chaque entrée stocke clé ^ valeur ^ informations, si bien qu'une entrée
+        lue pendant qu'un autre processus l'écrit ne se vérifie pas et compte comme absente.
+        La table se transmet aux processus du pool par son nom (pickle) ; seul le processus qui l'a créée la détruit.
+        :param size_mb: Mémoire maximale allouée à la table, en mégaoctets (ignorée pour s'attacher à une table existante).
+        :param name: Nom d'un segment existant auquel s'attacher, ou None pour créer une nouvelle table.
+        """
+        if name is None:
+            buckets = max(1, int(size_mb * 2**20) // self.BUCKET_BYTES)
+            size = 1 << (buckets.bit_length() - 1)
+            self.memory = shared_memory.SharedMemory(
+                create=True, size=self.HEADER_BYTES + size * self.BUCKET_BYTES
+            )
+            self.memory.buf[: self.HEADER_BYTES] = size.to_bytes(8, "little")
+            self.owner = True
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+            size = int.from_bytes(self.memory.buf[: self.HEADER_BYTES], "little")
+            self.owner = False
+        self.name = self.memory.name
+        self.size = size
+        self.index_mask = size - 1
+        # Deux vues du même segment : mots de 64 bits et valeurs flottantes (index identiques)
+        data = self.memory.buf[
+            self.HEADER_BYTES : self.HEADER_BYTES + size * self.BUCKET_BYTES
+        ]
+        self.words = data.cast("Q")
+        self.values = data.cast("d")
+        data.release()
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def __reduce__(self):
+        return attach_shared_table, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read(self, offset):
+        """
+        Lit une entrée et vérifie sa cohérence.
+        :param offset: Index du premier mot de l'entrée.
+        :return: Tuple (clé, profondeur, type, valeur, meilleur coup), ou None si l'entrée est vide ou en cours d'écriture.
+        """
+        words = self.words
+        info = words[offset + 2]
+        if not info:
+            return None
+        bits = words[offset + 1]
+        value = stored_value(self.values[offset + 1])
+        if words[offset + 1] != bits:
+            return None  # Valeur remplacée entre les deux lectures
+        return (
+            words[offset] ^ bits ^ info,
+            (info & 0xFFFF) - 1,
+            info >> 16 & 0xFF,
+            value,
+            (info >> 24) - 1,
+        )
+
+    def write(self, offset, key, depth, flag, value, move):
+        """
+        Écrit une entrée ; le mot de vérification est écrit en dernier.
+        """
+        words = self.words
+        info = (depth + 1) | flag << 16 | (move + 1) << 24
+        words[offset + 2] = info
+        self.values[offset + 1] = value
+        words[offset] = key ^ words[offset + 1] ^ info
+
+    def probe(self, key):
+        """
+        Recherche une position dans la table.
+        :param key: Clé de Zobrist de la position.
+        :return: Tuple (profondeur, type, valeur, meilleur coup) ou None si la position est absente.
+        """
+        offset = (key & self.index_mask) * 6
+        occupied = False
+        for entry_offset in (offset, offset + 3):
+            entry = self.read(entry_offset)
+            if entry is not None:
+                if entry[0] == key:
+                    self.hits += 1
+                    return entry[1:]
+                occupied = True
+        self.misses += 1
+        if occupied:
+            self.collisions += 1  # Le bucket est occupé par d'autres positions
+        return None
+
+    def store(self, key, depth, flag, value, move=-1):
+        """
+        Enregistre une position : l'entrée la plus profonde est conservée, l'autre emplacement est toujours remplacé.
+        :param key: Clé de Zobrist de la position.
+        :param depth: Profondeur de recherche restante de l'évaluation.
+        :param flag: Type de la valeur (EXACT, LOWER ou UPPER).
+        :param value: Valeur de la position.
+        :param move: Meilleur coup trouvé, ou -1 s'il n'y en a pas.
+        """
+        offset = (key & self.index_mask) * 6
+        deep = self.read(offset)
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            if deep is not None and deep[0] != key:
+                # L'ancienne entrée profonde est rétrogradée plutôt que perdue
+                self.write(offset + 3, *deep)
+            self.write(offset, key, depth, flag, value, move)
+        else:
+            self.write(offset + 3, key, depth, flag, value, move)
+
+    def clear(self):
+        """
+        Vide la table (pour tous les processus) sans réallouer la mémoire.
+        """
+        self.memory.buf[self.HEADER_BYTES :] = bytes(
+            len(self.memory.buf) - self.HEADER_BYTES
+        )
+        self.hits = self.misses = self.collisions = 0
+
+    def close(self):
+        """
+        Détache la table du processus ; le segment est détruit si ce processus l'a créé.
+        """
+        if self.memory is None:
+            return
+        self.words.release()
+        self.values.release()
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+        self.memory = None
+
+
+@functools.lru_cache(maxsize=None)
+def attach_shared_table(name):
+    """
+    S'attache à une table de transposition partagée une seule fois par processus.
+    :param name: Nom du segment de mémoire partagée.
+    :return: Instance de SharedTranspositionTable partagée.
+    """
+    return SharedTranspositionTable(name=name)
@@ -0,0 +1,345 @@
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import Puissance4
+from .evaluation import evaluation_parameters
+from .records import GameRecordReader, replay_record
+
+# Paramètres réglés par défaut : 'win' ne compte que sur un plateau gagné (évalué ±1000 avant les fenêtres)
+# et 'scale' ne fait que changer l'unité du score
+TUNED_PARAMETERS = ("three", "two", "opponent_three", "center")
+# Label d'une position selon le résultat de la partie, du point de vue du Jaune (maximisant)
+LABELS = {"J": 1.0, "R": 0.0, None: 0.5}
+
+
+def labelled_positions(path, skip_plies=4, limit=None):
+    """
+    Extrait d'un fichier de parties (GameRecordWriter) les positions non terminées, étiquetées par le résultat final.
+    :param path: Chemin du fichier de parties.
+    :param skip_plies: Nombre de premiers demi-coups ignorés de chaque partie (positions d'ouverture trop communes).
+    :param limit: Nombre maximal de positions, ou None.
+    :return: Tuple ((rows, cols, connect), liste de tuples (coups joués, label)).
+    """
+    reader = GameRecordReader(path)
+    geometry = (reader.rows, reader.cols, reader.connect)
+    positions = []
+    for record in reader:
+        label = LABELS[record["winner"]]
+        for ply, (game, _, _) in enumerate(replay_record(record, *geometry), 1):
+            if ply >= skip_plies and not game.is_game_over():
+                positions.append((record["columns"][:ply], label))
+                if limit is not None and len(positions) >= limit:
+                    return geometry, positions
+    return geometry, positions
+
+
+def position_features(game):
+    """
+    Résume une position pour l'évaluation : jetons Jaunes de la colonne centrale et nombre de fenêtres
+    par (jetons Jaunes, jetons Rouges). L'évaluation est alors une somme pondérée de ces effectifs.
+    :param game: Instance de Puissance4 positionnée.
+    :return: Tuple (jetons Jaunes au centre, liste de tuples (jetons J, jetons R, nombre de fenêtres)).
+    """
+    evaluator = game.evaluator
+    histogram = Counter(zip(evaluator.counts["J"], evaluator.counts["R"]))
+    return evaluator.center_count, [
+        (count_J, count_R, n) for (count_J, count_R), n in histogram.items()
+    ]
+
+
+# Positions et caractéristiques conservées par chaque processus du pool de réglage
+_worker_data = {}
+
+
+def init_worker(geometry, positions):
+    """
+    Initialise un processus de réglage : les positions sont transmises une seule fois, leurs caractéristiques
+    calculées à la demande puis conservées d'une évaluation de la perte à l'autre.
+    :param geometry: Tuple (rows, cols, connect).
+    :param positions: Liste de tuples (coups joués, label).
+    """
+    _worker_data.clear()
+    _worker_data["geometry"] = geometry
+    _worker_data["positions"] = positions
+    _worker_data["features"] = {}
+
+
+def chunk_features(start, stop):
+    """
+    Renvoie les caractéristiques d'une tranche de positions, calculées une seule fois par processus.
+    :return: Liste de tuples (caractéristiques, label).
+    """
+    features = _worker_data["features"].get((start, stop))
+    if features is None:
+        rows, cols, connect = _worker_data["geometry"]
+        game = Puissance4(rows=rows, cols=cols, connect=connect, tt_size_mb=0)
+        features = []
+        for moves, label in _worker_data["positions"][start:stop]:
+            player = "R"
+            for col in moves:
+                game.insert_token(col, player)
+                player = "J" if player == "R" else "R"
+            features.append((position_features(game), label))
+            for col in reversed(moves):
+                game.undo_move(col)
+        _worker_data["features"][(start, stop)] = features
+    return features
+
+
+def chunk_loss(difficulty, parameters, scaling, start, stop):
+    """
+    Calcule la somme des erreurs quadratiques (label - probabilité de gain prédite) sur une tranche de positions.
+    La probabilité de gain du Jaune est 1 / (1 + 10^(-scaling * évaluation / 400)) (méthode de Texel).
+    :param difficulty: Difficulté dont les paramètres sont réglés.
+    :param parameters: Dictionnaire des paramètres d'évaluation à essayer.
+    :param scaling: Facteur d'échelle de l'évaluation dans la sigmoïde.
+    :param start: Index de la première position de la tranche.
+    :param stop: Index suivant la dernière position de la tranche.
+    :return: Tuple (somme des erreurs, nombre de positions).
+    """
+    rows, cols, connect = _worker_data["geometry"]
+    game = Puissance4(
+        rows=rows,
+        cols=cols,
+        connect=connect,
+        tt_size_mb=0,
+        evaluation_parameters={difficulty: parameters},
+    )
+    table = game.evaluator.build_table(difficulty)
+    profile = game.parameters(difficulty)
+    error = 0.0
+    features = chunk_features(start, stop)
+    for (center_count, histogram), label in features:
+        score = center_count * profile["center"]
+        for count_J, count_R, n in histogram:
+            score += n * table[count_J][count_R]
+        exponent = max(-50.0, min(50.0, -scaling * score * profile["scale"] / 400))
+        error += (label - 1 / (1 + 10**exponent)) ** 2
+    return error, len(features)
+
+
+class Tuner:
+    def __init__(
+        self,
+        geometry,
+        positions,
+        difficulty="medium",
+        names=TUNED_PARAMETERS,
+        workers=1,
+        chunk_size=2000,
+        seed=0,
+        checkpoint=None,
+    ):
+        """
+        Règle les paramètres d'évaluation d'une difficulté sur des positions étiquetées, par SPSA (perturbation
+        simultanée de tous les paramètres) sur la perte de Texel.
+        Chaque évaluation de la perte est découpée en tranches réparties sur un pool de processus ; les deux pertes
+        d'une itération sont soumises ensemble. L'état est enregistré après chaque itération pour pouvoir reprendre.
+        :param geometry: Tuple (rows, cols, connect) des positions.
+        :param positions: Liste de tuples (coups joués, label), par exemple issue de labelled_positions.
+        :param difficulty: Difficulté dont les paramètres sont réglés.
+        :param names: Noms des paramètres réglés ; les autres gardent leur valeur.
+        :param workers: Nombre de processus (1 pour calculer en série, None pour tous les cœurs).
+        :param chunk_size: Nombre de positions par tranche.
+        :param seed: Graine des perturbations.
+        :param checkpoint: Fichier JSON d'état à reprendre s'il existe et à mettre à jour, ou None.
+        """
+        self.geometry = geometry
+        self.positions = positions
+        self.difficulty = difficulty
+        self.names = tuple(names)
+        self.workers = workers
+        self.seed = seed
+        self.checkpoint = checkpoint
+        self.chunks = [
+            (start, min(start + chunk_size, len(positions)))
+            for start in range(0, len(positions), chunk_size)
+        ]
+        self.base = dict(evaluation_parameters(difficulty))
+        self.values = [float(self.base[name]) for name in self.names]
+        # Facteur de la sigmoïde, ajusté sur les paramètres de départ
+        self.scaling = None
+        self.iteration = 0
+        self.step_size = None  # Gain 'a' du SPSA, calibré à la première itération
+        self.history = []  # Perte à chaque itération
+        self.executor = None
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self.load(checkpoint)
+
+    def parameters(self, values=None):
+        """
+        Construit le dictionnaire complet des paramètres pour un vecteur de valeurs réglées.
+        :param values: Valeurs des paramètres réglés (par défaut, les valeurs courantes).
+        :return: Dictionnaire nom -> valeur.
+        """
+        values = self.values if values is None else values
+        return {**self.base, **dict(zip(self.names, values))}
+
+    def losses(self, candidates, scalings=None):
+        """
+        Calcule la perte moyenne de plusieurs vecteurs de paramètres en une seule soumission au pool.
+        :param candidates: Liste de dictionnaires de paramètres.
+        :param scalings: Facteur de la sigmoïde de chaque candidat (par défaut, celui du réglage).
+        :return: Liste des pertes moyennes, dans l'ordre des candidats.
+        """
+        if scalings is None:
+            scalings = [self.scaling] * len(candidates)
+        tasks = [
+            (self.difficulty, parameters, scaling, start, stop)
+            for parameters, scaling in zip(candidates, scalings)
+            for start, stop in self.chunks
+        ]
+        if self.workers == 1:
+            if _worker_data.get("positions") is not self.positions:
+                init_worker(self.geometry, self.positions)
+            results = [chunk_loss(*task) for task in tasks]
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=init_worker,
+                    initargs=(self.geometry, self.positions),
+                )
+            results = list(self.executor.map(chunk_loss, *zip(*tasks)))
+        losses = []
+        for index in range(len(candidates)):
+            part = results[index * len(self.chunks) : (index + 1) * len(self.chunks)]
+            losses.append(sum(error for error, _ in part) / sum(n for _, n in part))
+        return losses
+
+    def fit_scaling(self, low=0.01, high=10.0, steps=30):
+        """
+        Ajuste le facteur de la sigmoïde sur les paramètres de départ (recherche par section dorée sur son logarithme),
+        pour que la perte mesure ensuite les paramètres et non l'unité du score.
+        :return: Facteur retenu.
+        """
+        ratio = (math.sqrt(5) - 1) / 2
+        low, high = math.log(low), math.log(high)
+        for _ in range(steps):
+            left = high - ratio * (high - low)
+            right = low + ratio * (high - low)
+            loss_left, loss_right = self.losses(
+                [self.parameters()] * 2, [math.exp(left), math.exp(right)]
+            )
+            if loss_left < loss_right:
+                high = right
+            else:
+                low = left
+        self.scaling = math.exp((low + high) / 2)
+        return self.scaling
+
+    def run(self, iterations, perturbation=0.5, step=0.5, stability=10, callback=None):
+        """
+        Poursuit le réglage jusqu'à l'itération donnée (les itérations d'un état repris ne sont pas rejouées).
+        :param iterations: Nombre total d'itérations.
+        :param perturbation: Amplitude initiale 'c' des perturbations.
+        :param step: Déplacement maximal visé à la première itération, qui calibre le gain 'a'.
+        :param stability: Constante de stabilité 'A' de la suite des gains.
+        :param callback: Fonction appelée avec (itération, perte, paramètres) après chaque itération, ou None.
+        :return: Dictionnaire des paramètres réglés.
+        """
+        if self.scaling is None:
+            self.fit_scaling()
+        try:
+            while self.iteration < iterations:
+                k = self.iteration + 1
+                c = perturbation / k**0.101
+                rng = random.Random(self.seed * 1_000_003 + self.iteration)
+                delta = [rng.choice((-1, 1)) for _ in self.names]
+                plus = [v + c * d for v, d in zip(self.values, delta)]
+                minus = [v - c * d for v, d in zip(self.values, delta)]
+                loss_plus, loss_minus = self.losses(
+                    [self.parameters(plus), self.parameters(minus)]
+                )
+                gradient = [(loss_plus - loss_minus) / (2 * c * d) for d in delta]
+                if self.step_size is None:
+                    largest = max(abs(g) for g in gradient) or 1.0
+                    self.step_size = step * (stability + 1) ** 0.602 / largest
+                a = self.step_size / (k + stability) ** 0.602
+                self.values = [v - a * g for v, g in zip(self.values, gradient)]
+                self.iteration = k
+                self.history.append((loss_plus + loss_minus) / 2)
+                if self.checkpoint is not None:
+                    self.save(self.checkpoint)
+                if callback is not None:
+                    callback(k, self.history[-1], self.parameters())
+        finally:
+            self.close()
+        return self.parameters()
+
+    def state(self):
+        """
+        Renvoie l'état du réglage sous forme sérialisable en JSON.
+        """
+        return {
+            "difficulty": self.difficulty,
+            "names": list(self.names),
+            "values": self.values,
+            "scaling": self.scaling,
+            "iteration": self.iteration,
+            "step_size": self.step_size,
+            "seed": self.seed,
+            "history": self.history,
+        }
+
+    def save(self, path):
+        """
+        Enregistre l'état du réglage ; le fichier est remplacé d'un bloc pour rester lisible en cas d'interruption.
+        :param path: Chemin du fichier JSON.
+        """
+        temporary = path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.state(), file, indent=2)
+        os.replace(temporary, path)
+
+    def load(self, path):
+        """
+        Reprend un réglage enregistré par save.
+        :param path: Chemin du fichier JSON.
+        """
+        with open(path) as file:
+            state = json.load(file)
+        if state["difficulty"] != self.difficulty or state["names"] != list(self.names):
+            raise ValueError(f"L'état {path} concerne un autre réglage")
+        self.values = state["values"]
+        self.scaling = state["scaling"]
+        self.iteration = state["iteration"]
+        self.step_size = state["step_size"]
+        self.seed = state["seed"]
+        self.history = state["history"]
+
+    def close(self):
+        """
+        Arrête le pool de processus.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def save_parameters(path, difficulty, parameters):
+    """
+    Ajoute (ou remplace) les paramètres d'une difficulté dans un fichier JSON difficulté -> paramètres,
+    lisible par load_parameters et utilisable comme evaluation_parameters de Puissance4.
+    :param path: Chemin du fichier JSON.
+    :param difficulty: Difficulté réglée.
+    :param parameters: Dictionnaire des paramètres.
+    """
+    profiles = load_parameters(path) if os.path.exists(path) else {}
+    profiles[difficulty] = parameters
+    with open(path, "w") as file:
+        json.dump(profiles, file, indent=2, sort_keys=True)
+
+
+def load_parameters(path):
+    """
+    Lit un fichier de paramètres d'évaluation écrit par save_parameters.
+    :param path: Chemin du fichier JSON.
+    :return: Dictionnaire difficulté -> paramètres.
+    """
+    with open(path) as file:
+        return json.load(file)
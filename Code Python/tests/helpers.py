@@ -0,0 +1,57 @@
+import random
+
+from puissance4 import Puissance4
+
+
+def play_random(game, plies, rng):
+    """
+    Joue des coups aléatoires depuis la position actuelle, sans dépasser la fin de partie.
+    :param game: Instance de Puissance4 à faire avancer.
+    :param plies: Nombre maximal de coups à jouer.
+    :param rng: Générateur aléatoire.
+    :return: Liste des colonnes jouées.
+    """
+    moves = []
+    player = "R" if len(game.moves_played) % 2 == 0 else "J"
+    while len(moves) < plies and not game.is_game_over():
+        col = rng.choice(game.generate_possible_moves())
+        game.insert_token(col, player)
+        moves.append(col)
+        player = "J" if player == "R" else "R"
+    return moves
+
+
+def random_positions(count, rows=6, cols=7, connect=4, seed=0, max_plies=None):
+    """
+    Tire des suites de coups aléatoires reproductibles menant à des positions non terminées.
+    :param count: Nombre de positions.
+    :param seed: Graine du générateur.
+    :param max_plies: Nombre maximal de coups par position (None pour le plateau presque plein).
+    :return: Liste de suites de coups (Rouge commence).
+    """
+    rng = random.Random(seed)
+    game = Puissance4(rows=rows, cols=cols, connect=connect, tt_size_mb=0)
+    positions = []
+    while len(positions) < count:
+        for col in reversed(list(game.moves_played)):
+            game.undo_move(col)
+        plies = rng.randint(0, rows * cols - 1 if max_plies is None else max_plies)
+        moves = play_random(game, plies, rng)
+        if not game.is_game_over():
+            positions.append(moves)
+    return positions
+
+
+def position_game(moves, **options):
+    """
+    Crée une partie placée sur une position.
+    :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+    :param options: Paramètres de Puissance4.
+    :return: Tuple (partie, joueur au trait).
+    """
+    game = Puissance4(**options)
+    player = "R"
+    for col in moves:
+        game.insert_token(col, player)
+        player = "J" if player == "R" else "R"
+    return game, player
@@ -0,0 +1,95 @@
+import io
+import json
+
+import pytest
+
+from puissance4.analysis import (
+    analyse_positions,
+    completed_lines,
+    output_format,
+    parse_board,
+    read_positions,
+)
+from puissance4.cli import main
+from puissance4.encoding import encode_moves
+
+from tests.helpers import random_positions
+
+BOARD = "......./......./......./......./......./...RJ.."
+
+
+def analyse(positions, **options):
+    output = io.StringIO()
+    count = analyse_positions(positions, output, max_depth=3, **options)
+    lines = output.getvalue().splitlines()
+    assert count == len(lines)
+    return lines
+
+
+def test_parse_board():
+    board = parse_board(BOARD)
+    assert board[5][3:5] == ["R", "J"]
+    for invalid in [
+        "......./......./......./......./......./...RR..",
+        "......./......./......./......./...R.../.......",
+        "......./......./......./......./......./...RX..",
+        "......./.......",
+    ]:
+        with pytest.raises(ValueError):
+            parse_board(invalid)
+
+
+def test_one_line_per_position():
+    lines = analyse(
+        read_positions(["# commentaire", "4453", "", BOARD, "44!", "1212121"])
+    )
+    assert len(lines) == 4
+    position, best, score, depth, nodes = lines[0].split("\t")
+    assert position == "4453" and 1 <= int(best) <= 7 and depth == "3"
+    assert lines[1].startswith(BOARD + "\t")
+    assert lines[2].split("\t")[1] == "erreur"
+    assert lines[3].split("\t")[1] == "erreur"
+
+
+def test_board_and_moves_give_the_same_result():
+    lines = analyse(["45", BOARD], fresh_table=True, as_json=True)
+    first, second = (json.loads(line) for line in lines)
+    assert {k: v for k, v in first.items() if k != "position"} == {
+        k: v for k, v in second.items() if k != "position"
+    }
+    assert isinstance(first["score"], int)
+
+
+def test_fresh_table_results_do_not_depend_on_workers():
+    positions = [encode_moves(moves) for moves in random_positions(40, seed=16)]
+    serial = analyse(positions, fresh_table=True, chunk_size=7)
+    parallel = analyse(positions, fresh_table=True, workers=2, chunk_size=5)
+    assert serial == parallel
+    assert analyse(positions, fresh_table=True, skip=25) == serial[25:]
+
+
+def test_completed_lines_and_format(tmp_path):
+    path = tmp_path / "results.tsv"
+    assert completed_lines(path) == 0 and output_format(path) is None
+    path.write_text("4\t4\t1\t3\t10\n44\t3\t2\t3\t20\n45\t3")
+    assert completed_lines(path) == 2
+    assert path.read_text().endswith("20\n")
+    assert output_format(path) == "tsv"
+    path.write_text('{"position": "4"}\n')
+    assert output_format(path) == "json"
+
+
+def test_cli_resume(tmp_path, capsys):
+    source = tmp_path / "positions.txt"
+    output = tmp_path / "results.tsv"
+    positions = [encode_moves(moves) for moves in random_positions(12, seed=17)]
+    source.write_text("\n".join(positions) + "\n")
+    options = ["analyze", str(source), "--max-depth", "3", "--fresh-table"]
+    main(options + ["--output", str(output)])
+    complete = output.read_text()
+    output.write_text("".join(complete.splitlines(True)[:5]) + "partial")
+    main(options + ["--output", str(output), "--resume"])
+    assert output.read_text() == complete
+    with pytest.raises(SystemExit):
+        main(options + ["--output", str(output), "--resume", "--json"])
+    assert output.read_text() == complete
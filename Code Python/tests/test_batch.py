@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from tests.helpers import play_random, position_game, random_positions
+
+np = pytest.importorskip("numpy")
+
+from puissance4.batch import BatchEvaluator, encode_boards  # noqa: E402
+
+DIFFICULTIES = ["easy", "medium", "difficult"]
+
+
+def finished_positions(count, seed):
+    """
+    Tire des parties aléatoires jouées jusqu'à leur fin (victoire ou plateau plein).
+    """
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        game, _ = position_game([], tt_size_mb=0)
+        positions.append(play_random(game, 42, rng))
+    return positions
+
+
+@pytest.mark.parametrize("geometry", [(6, 7, 4), (5, 8, 5)])
+def test_batch_matches_evaluate_board(geometry):
+    rows, cols, connect = geometry
+    positions = random_positions(80, rows, cols, connect, seed=6)
+    if geometry == (6, 7, 4):
+        positions += finished_positions(20, seed=7)
+    games = [
+        position_game(moves, rows=rows, cols=cols, connect=connect, tt_size_mb=0)[0]
+        for moves in positions
+    ]
+    evaluator = BatchEvaluator(rows, cols, connect)
+    boards = encode_boards([game.board for game in games])
+    for difficulty in DIFFICULTIES:
+        scores = evaluator.evaluate(boards, difficulty).tolist()
+        assert scores == [game.evaluate_board(difficulty) for game in games]
+
+
+def test_both_players_aligned():
+    # Position impossible en partie : le Jaune aligné sur la rangée du bas, le Rouge dans la dernière colonne
+    game, _ = position_game([], tt_size_mb=0)
+    for col in range(4):
+        game.insert_token(col, "J")
+    for _ in range(4):
+        game.insert_token(6, "R")
+    assert game.check_winner() == "R"
+    scores = BatchEvaluator().evaluate(encode_boards([game.board]), "medium")
+    assert scores.tolist() == [game.evaluate_board("medium")] == [-1000]
+
+
+def test_batch_with_tuned_parameters():
+    parameters = {"medium": {"three": 4.5, "center": 2.25}}
+    evaluator = BatchEvaluator(evaluation_parameters=parameters)
+    games = [
+        position_game(moves, tt_size_mb=0, evaluation_parameters=parameters)[0]
+        for moves in random_positions(50, seed=8)
+    ]
+    scores = evaluator.evaluate(
+        encode_boards([game.board for game in games]), "medium"
+    ).tolist()
+    expected = [game.evaluate_board("medium") for game in games]
+    assert scores == pytest.approx(expected)
+
+
+def test_evaluate_children():
+    evaluator = BatchEvaluator()
+    for moves in random_positions(20, seed=9):
+        game, player = position_game(moves, tt_size_mb=0)
+        children = evaluator.evaluate_children(game, player, "difficult")
+        assert sorted(children) == game.generate_possible_moves()
+        for col, score in children.items():
+            game.insert_token(col, player)
+            assert score == game.evaluate_board("difficult")
+            game.undo_move(col)
@@ -0,0 +1,55 @@
+import pytest
+
+from puissance4.benchmark import FORMAT_VERSION, compare, metric_direction
+
+
+def results(**metrics):
+    """
+    Construit des résultats de run_benchmarks réduits à leurs métriques.
+    :param metrics: Métriques (les points des noms sont remplacés par des doubles soulignés).
+    :return: Dictionnaire des résultats.
+    """
+    return {
+        "version": FORMAT_VERSION,
+        "metrics": {name.replace("__", "."): value for name, value in metrics.items()},
+    }
+
+
+def test_metric_directions():
+    assert metric_direction("minimax.easy.nodes_per_s") == 1
+    assert metric_direction("check_winner.ops_per_s") == 1
+    assert metric_direction("best_move.easy.all.p99_ms") == -1
+    assert metric_direction("transposition_table.peak_bytes") == -1
+    assert metric_direction("transposition_table.bytes") == -1
+    assert metric_direction("transposition_table.entries") == 0
+
+
+def test_compare_flags_regressions_only_on_performance_metrics():
+    baseline = results(
+        minimax__nodes_per_s=1000,
+        best_move__p50_ms=10,
+        transposition_table__peak_bytes=500,
+        transposition_table__entries=100,
+    )
+    current = results(
+        minimax__nodes_per_s=850,
+        best_move__p50_ms=10.5,
+        transposition_table__peak_bytes=600,
+        transposition_table__entries=400,
+        check_winner__ops_per_s=10,
+    )
+    rows = {name: row for name, *row in compare(current, baseline, tolerance=0.1)}
+    # Les entrées de la table sont informatives, et une métrique absente de la référence est ignorée
+    assert sorted(rows) == [
+        "best_move.p50_ms",
+        "minimax.nodes_per_s",
+        "transposition_table.peak_bytes",
+    ]
+    assert rows["minimax.nodes_per_s"] == [1000, 850, 0.85, True]
+    assert rows["best_move.p50_ms"][3] is False
+    assert rows["transposition_table.peak_bytes"][3] is True
+
+
+def test_compare_rejects_other_versions():
+    with pytest.raises(ValueError):
+        compare(results(), {"version": FORMAT_VERSION + 1, "metrics": {}})
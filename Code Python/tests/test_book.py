@@ -0,0 +1,63 @@
+import pytest
+
+from puissance4 import OpeningBook, build_book, write_book
+from puissance4.book import book_move, enumerate_positions, open_book
+
+from tests.helpers import position_game
+
+
+def test_write_and_lookup(tmp_path):
+    path = tmp_path / "book.bin"
+    entries = {
+        "easy": {5: 3, 1: 0, 2**63 + 7: 6},
+        "difficult": {9: 2},
+    }
+    write_book(path, 6, 7, entries)
+    book = OpeningBook(path)
+    try:
+        assert (book.rows, book.cols, book.connect) == (6, 7, 4)
+        for difficulty, moves in entries.items():
+            for key, col in moves.items():
+                assert book.lookup(key, difficulty) == col
+        assert book.lookup(3, "easy") is None
+        assert book.lookup(5, "medium") is None
+    finally:
+        book.close()
+
+
+def test_write_rejects_wide_boards(tmp_path):
+    with pytest.raises(ValueError):
+        write_book(tmp_path / "book.bin", 8, 8, {"easy": {}})
+
+
+def test_built_book_is_used_by_the_engine(tmp_path):
+    path = str(tmp_path / "book.bin")
+    counts = build_book(path, plies=3, difficulties=["easy"])
+    positions = enumerate_positions(3)
+    assert counts == {"easy": len(positions)}
+    book = open_book(path)
+    try:
+        for moves in positions:
+            game, player = position_game(
+                moves, difficulty_R="easy", difficulty_J="easy", opening_book=book
+            )
+            key, canonical_col = book_move(6, 7, "easy", moves)
+            assert book.lookup(key, "easy") == canonical_col
+            col = game.book_move(player, "easy")
+            assert col in game.generate_possible_moves()
+            # La position symétrique reçoit le coup symétrique
+            mirrored, _ = position_game(
+                [6 - move for move in moves],
+                difficulty_R="easy",
+                difficulty_J="easy",
+                opening_book=book,
+            )
+            assert mirrored.book_move(player, "easy") == 6 - col
+        # Hors du livre, aucun coup n'est proposé
+        game, player = position_game(
+            [3, 3, 2, 4], difficulty_R="easy", difficulty_J="easy", opening_book=book
+        )
+        assert game.book_move(player, "easy") is None
+    finally:
+        book.close()
+        open_book.cache_clear()
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from puissance4 import Puissance4
+
+from tests.helpers import play_random, position_game, random_positions
+
+DIFFICULTIES = ["easy", "medium", "difficult"]
+
+
+def reference_window(window, player, difficulty):
+    """
+    Évaluation d'une fenêtre de 4 cases telle qu'écrite avant l'évaluation incrémentale.
+    """
+    score = 0
+    opponent = "J" if player == "R" else "R"
+    if window.count(player) == 4:
+        score += 100
+    elif window.count(player) == 3 and window.count(" ") == 1:
+        score += 5
+    elif window.count(player) == 2 and window.count(" ") == 2:
+        score += 2
+    if difficulty == "difficult":
+        if window.count(opponent) == 3 and window.count(" ") == 1:
+            score -= 4
+    return score
+
+
+def reference_evaluation(board, difficulty, winner):
+    """
+    Évaluation du plateau standard telle qu'écrite avant l'évaluation incrémentale : parcours de toutes les fenêtres.
+    """
+    if winner == "J":
+        return 1000
+    if winner == "R":
+        return -1000
+    rows, cols = len(board), len(board[0])
+    center = [board[row][cols // 2] for row in range(rows)].count("J")
+    score = center * (2 if difficulty == "easy" else 3)
+    windows = []
+    for row in range(rows):
+        for col in range(cols - 3):
+            windows.append([board[row][col + i] for i in range(4)])
+    for col in range(cols):
+        for row in range(rows - 3):
+            windows.append([board[row + i][col] for i in range(4)])
+    for row in range(rows - 3):
+        for col in range(cols - 3):
+            windows.append([board[row + i][col + i] for i in range(4)])
+    for row in range(3, rows):
+        for col in range(cols - 3):
+            windows.append([board[row - i][col + i] for i in range(4)])
+    for player, sign in (("J", 1), ("R", -1)):
+        for window in windows:
+            score += sign * reference_window(window, player, difficulty)
+    if difficulty == "easy":
+        score /= 2
+    return score
+
+
+@pytest.mark.parametrize("backend", ["bitboard", "list"])
+def test_incremental_evaluation_matches_reference(backend):
+    rng = random.Random(1)
+    for _ in range(60):
+        game = Puissance4(backend=backend, tt_size_mb=0)
+        for _ in range(rng.randint(1, 41)):
+            play_random(game, 1, rng)
+            for difficulty in DIFFICULTIES:
+                expected = reference_evaluation(
+                    game.board, difficulty, game.check_winner()
+                )
+                assert game.evaluate_board(difficulty) == expected
+                assert game.evaluate_board_scan(difficulty) == expected
+            if game.is_game_over():
+                break
+
+
+@pytest.mark.parametrize("backend", ["bitboard", "list"])
+def test_evaluation_is_restored_after_undo(backend):
+    for moves in random_positions(30, seed=2):
+        game, _ = position_game(moves, backend=backend, tt_size_mb=0)
+        played = list(game.moves_played)
+        before = {d: game.evaluate_board(d) for d in DIFFICULTIES}
+        extra = play_random(game, 6, random.Random(3))
+        for col in reversed(extra):
+            game.undo_move(col)
+        assert game.moves_played == played
+        for difficulty in DIFFICULTIES:
+            assert game.evaluate_board(difficulty) == before[difficulty]
+            assert game.evaluate_board_scan(difficulty) == before[difficulty]
+
+
+@pytest.mark.parametrize("geometry", [(5, 8, 4), (7, 9, 5), (4, 4, 3)])
+def test_scan_matches_incremental_on_other_geometries(geometry):
+    rows, cols, connect = geometry
+    for moves in random_positions(30, rows, cols, connect, seed=4):
+        game, _ = position_game(
+            moves, rows=rows, cols=cols, connect=connect, tt_size_mb=0
+        )
+        for difficulty in DIFFICULTIES:
+            assert game.evaluate_board(difficulty) == game.evaluate_board_scan(
+                difficulty
+            )
@@ -0,0 +1,138 @@
+import math
+
+import pytest
+
+from puissance4 import match
+from puissance4.match import (
+    PRIOR_PAIRS,
+    elo_from_score,
+    elo_interval,
+    pair_statistics,
+    play_match_pair,
+    run_match,
+    score_from_elo,
+    sprt_bounds,
+    sprt_llr,
+)
+
+OPTIONS = {
+    "rows": 6,
+    "cols": 7,
+    "connect": 4,
+    "time_limit_ms": None,
+    "backend": "bitboard",
+    "book_path": None,
+    "mcts_iterations": 100,
+}
+
+
+def counts(**pairs):
+    """
+    Construit un décompte de paires par score total de first.
+    :param pairs: Nombre de paires par résultat (loss, half_loss, draw, half_win, win).
+    :return: Dictionnaire score total -> nombre de paires (voir pair_statistics).
+    """
+    names = {"loss": 0.0, "half_loss": 0.5, "draw": 1.0, "half_win": 1.5, "win": 2.0}
+    result = {total: 0 for total in names.values()}
+    for name, count in pairs.items():
+        result[names[name]] = count
+    return result
+
+
+def test_llr_sign():
+    assert sprt_llr(counts(win=5, draw=5), 0, 50) > 0
+    assert sprt_llr(counts(loss=5, draw=5), 0, 50) < 0
+    # Un score de 50 % est plus proche de H0 (0 Elo) que de H1 (50 Elo)
+    assert sprt_llr(counts(win=5, loss=5), 0, 50) < 0
+    assert sprt_llr(counts(), 0, 50) == 0.0
+
+
+def test_llr_crosses_the_bounds():
+    lower, upper = sprt_bounds(0.05, 0.05)
+    assert lower == pytest.approx(-math.log(19))
+    assert upper == pytest.approx(math.log(19))
+    assert sprt_llr(counts(win=30, draw=10), 0, 50) >= upper
+    assert sprt_llr(counts(loss=30, draw=10), 0, 50) <= lower
+    assert lower < sprt_llr(counts(win=2, draw=2), 0, 50) < upper
+
+
+@pytest.mark.parametrize("scores, decision", [([1.0, 1.0], "H1"), ([0.0, 0.5], "H0")])
+def test_match_stops_on_decision(monkeypatch, scores, decision):
+    monkeypatch.setattr(match, "play_match_pair", lambda *args: scores)
+    result = run_match(("easy", None), ("easy", None), max_pairs=500)
+    assert result["decision"] == decision
+    played = sum(result["pairs"].values())
+    assert played < 500
+    # Le test conclut à la première paire qui franchit une borne
+    previous = sprt_llr({**result["pairs"], sum(scores): played - 1}, 0, 50)
+    lower, upper = result["bounds"]
+    assert lower < previous < upper
+
+
+def test_elo_score_round_trip():
+    for elo in (-400, -35.5, 0, 12, 250):
+        assert elo_from_score(score_from_elo(elo)) == pytest.approx(elo)
+    assert score_from_elo(0) == 0.5
+    assert elo_from_score(0) == float("-inf")
+    assert elo_from_score(1) == float("inf")
+
+
+def test_elo_interval_width():
+    elo, low, high = elo_interval(counts(win=6, draw=10, loss=4))
+    _, mean, _ = pair_statistics(counts(win=6, draw=10, loss=4))
+    assert elo == pytest.approx(elo_from_score(mean))
+    assert low < elo < high
+    # Quatre fois plus de paires : un intervalle environ deux fois plus étroit
+    _, low4, high4 = elo_interval(counts(win=24, draw=40, loss=16))
+    assert high4 - low4 == pytest.approx((high - low) / 2, rel=0.05)
+    assert elo_interval(counts()) == (0.0, float("-inf"), float("inf"))
+
+
+def test_zero_variance_is_smoothed_by_prior_pairs():
+    pairs = counts(draw=3)
+    assert pair_statistics(pairs) == (3, 0.5, 0.0)
+    count, mean, variance = pair_statistics(pairs, PRIOR_PAIRS)
+    assert count == 3
+    assert mean == pytest.approx(0.5)
+    assert variance > 0
+    # Des paires toutes gagnées ne concluent pas dès la première
+    lower, upper = sprt_bounds(0.05, 0.05)
+    assert lower < sprt_llr(counts(win=1), 0, 50) < upper
+    _, low, high = elo_interval(pairs)
+    assert low < 0 < high
+
+
+def test_pair_swaps_colours(monkeypatch):
+    calls = []
+
+    def fake_game(rows, cols, connect, engine_R, engine_J, opening, seed, *args):
+        calls.append((engine_R, engine_J, seed))
+        # Le Rouge gagne la première partie, la seconde est nulle
+        return ("R" if len(calls) == 1 else None), []
+
+    monkeypatch.setattr(match, "play_match_game", fake_game)
+    first, second = ("difficult", None, None), ("easy", None, None)
+    assert play_match_pair(first, second, [3], 10, OPTIONS) == [1.0, 0.5]
+    assert calls == [(first, second, 10), (second, first, 11)]
+
+    monkeypatch.setattr(match, "play_match_game", lambda *args: ("R", []))
+    # Chaque configuration gagne avec les Rouges : la paire est partagée
+    assert play_match_pair(first, second, [3], 10, OPTIONS) == [1.0, 0.0]
+    monkeypatch.setattr(match, "play_match_game", lambda *args: ("J", []))
+    assert play_match_pair(first, second, [3], 10, OPTIONS) == [0.0, 1.0]
+
+
+def test_match_is_independent_of_workers():
+    options = dict(
+        max_pairs=4,
+        seed=3,
+        opening_plies=2,
+        rows=5,
+        cols=5,
+        connect=4,
+    )
+    serial = run_match(("medium", 2), ("easy", 1), workers=1, **options)
+    parallel = run_match(("medium", 2), ("easy", 1), workers=2, **options)
+    assert serial == parallel
+    assert sum(serial["pairs"].values()) == 4
+    assert serial["wins"] + serial["draws"] + serial["losses"] == 8
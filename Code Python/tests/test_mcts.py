@@ -0,0 +1,97 @@
+from puissance4.mcts import MCTS, mcts_root_visits
+
+from tests.helpers import position_game
+
+
+def root_position(moves, rows=6, cols=7):
+    """
+    Calcule les bitboards d'une position pour la recherche Monte-Carlo.
+    :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+    :return: Tuple (jetons du joueur au trait, masque des cases occupées).
+    """
+    game, player = position_game(moves, rows=rows, cols=cols, tt_size_mb=0)
+    bitboard = game.to_bitboard()
+    return bitboard.pieces[player], bitboard.mask
+
+
+def test_takes_an_immediate_win():
+    tree = MCTS(seed=0)
+    visits = tree.search(*root_position([0, 1, 0, 1, 0, 1]), iterations=300)
+    assert tree.best_move(visits) == 0
+
+
+def test_blocks_an_immediate_loss():
+    tree = MCTS(seed=0)
+    visits = tree.search(*root_position([0, 1, 0, 1, 6, 1]), iterations=1000)
+    assert tree.best_move(visits) == 1
+
+
+def test_engine_plays_the_tactics():
+    game, player = position_game(
+        [0, 1, 0, 1, 6, 1], difficulty_R="mcts", mcts_iterations=1000, seed=0
+    )
+    assert game.best_move(player) == 1
+
+
+def test_iteration_budget():
+    tree = MCTS(seed=0)
+    position, mask = root_position([3])
+    visits = tree.search(position, mask, iterations=250)
+    assert tree.iterations == 250
+    # La première simulation développe la racine sans visiter de fils
+    assert sum(visits.values()) == 249
+    assert tree.visits[tree.root] == 250
+    visits = tree.search(position, mask, iterations=100)
+    assert tree.iterations == 100
+    assert tree.visits[tree.root] == 350
+
+    game, player = position_game([3], difficulty_J="mcts", mcts_iterations=300)
+    game.best_move(player)
+    assert game.nodes == 300
+    assert game.mcts.iterations == 300
+
+
+def test_set_root_reuses_the_subtree():
+    tree = MCTS(seed=0)
+    visits = tree.search(*root_position([3]), iterations=2000)
+    reply = tree.best_move(visits)
+    old_root = tree.root
+    # Notre coup puis la réponse adverse : le petit-fils de l'ancienne racine devient la racine
+    child = next(c for c in tree.children[old_root] if tree.moves[c] == reply)
+    grandchild = max(tree.children[child], key=lambda node: tree.visits[node])
+    answer = tree.moves[grandchild]
+    size = len(tree.positions)
+    grandchild_visits = tree.visits[grandchild]
+    assert grandchild_visits > 0
+
+    tree.set_root(*root_position([3, reply, answer]))
+    assert tree.root == grandchild
+    assert tree.parents[grandchild] is None
+    assert len(tree.positions) == size
+    assert tree.visits[grandchild] == grandchild_visits
+
+    # Une position sans rapport repart d'un arbre vide
+    tree.set_root(*root_position([0, 0, 0]))
+    assert len(tree.positions) == 1
+
+
+def test_root_visits_add_up():
+    position, mask = root_position([3, 3])
+    # Deux tâches du même coup traitées par le même processus : chacune ne compte que ses propres visites
+    first, first_iterations = mcts_root_visits(6, 7, 4, position, mask, 200, None, 1)
+    second, second_iterations = mcts_root_visits(6, 7, 4, position, mask, 200, None, 2)
+    assert first_iterations == second_iterations == 200
+    assert sum(first.values()) == 199
+    assert sum(second.values()) == 200
+    assert all(count >= 0 for count in second.values())
+
+    game, player = position_game(
+        [3, 3], difficulty_R="mcts", mcts_iterations=400, search_workers=2, seed=0
+    )
+    try:
+        col = game.best_move(player)
+        assert col in game.generate_possible_moves()
+        # Le budget est partagé entre les processus
+        assert game.nodes == 400
+    finally:
+        game.close()
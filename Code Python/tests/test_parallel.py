@@ -0,0 +1,48 @@
+import pytest
+
+from puissance4 import SharedTranspositionTable
+
+from tests.helpers import position_game, random_positions
+
+
+@pytest.fixture(scope="module")
+def positions():
+    return random_positions(6, seed=10, max_plies=20)
+
+
+@pytest.mark.parametrize("difficulty", ["medium", "difficult"])
+def test_parallel_root_search_matches_serial(positions, difficulty):
+    parallel = None
+    try:
+        for moves in positions:
+            serial, player = position_game(
+                moves, difficulty_R=difficulty, difficulty_J=difficulty, seed=0
+            )
+            game, _ = position_game(
+                moves,
+                difficulty_R=difficulty,
+                difficulty_J=difficulty,
+                seed=0,
+                search_workers=2,
+            )
+            if parallel is not None:
+                # Le pool est réutilisé d'une position à l'autre
+                game.executor, parallel.executor = parallel.executor, None
+            parallel = game
+            assert game.best_move(player) == serial.best_move(player), moves
+    finally:
+        if parallel is not None:
+            parallel.close()
+
+
+def test_parallel_root_search_with_shared_table(positions):
+    with SharedTranspositionTable(size_mb=1) as table:
+        for moves in positions[:3]:
+            serial, player = position_game(moves, seed=0)
+            game, _ = position_game(
+                moves, seed=0, search_workers=2, transposition_table=table
+            )
+            try:
+                assert game.best_move(player) == serial.best_move(player), moves
+            finally:
+                game.close()
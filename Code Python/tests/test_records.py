@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from puissance4 import (
+    GameRecordReader,
+    GameRecordWriter,
+    board_to_key,
+    decode_moves,
+    encode_moves,
+    key_to_board,
+    read_game_records,
+)
+from puissance4.encoding import mirror_key
+from puissance4.records import pack_moves, replay_record, unpack_moves
+
+from tests.helpers import position_game, random_positions
+
+
+def test_encode_decode_moves():
+    moves = list(range(35))
+    assert decode_moves(encode_moves(moves)) == moves
+    assert decode_moves(" 4453A ") == [3, 3, 4, 2, 9]
+    with pytest.raises(ValueError):
+        decode_moves("44!")
+
+
+@pytest.mark.parametrize("cols", [7, 16, 20])
+def test_pack_unpack_moves(cols):
+    rng = random.Random(cols)
+    for length in range(12):
+        moves = [rng.randrange(cols) for _ in range(length)]
+        packed = pack_moves(moves, cols)
+        assert unpack_moves(packed, length, cols) == moves
+
+
+def test_board_keys_round_trip():
+    for moves in random_positions(50, seed=11):
+        game, _ = position_game(moves, tt_size_mb=0)
+        key = board_to_key(game.board)
+        assert key == game.position_key()
+        assert key_to_board(key) == game.board
+        mirrored, _ = position_game([6 - col for col in moves], tt_size_mb=0)
+        assert mirror_key(key) == mirrored.position_key()
+
+
+def test_records_round_trip(tmp_path):
+    path = tmp_path / "games.p4r"
+    games = [
+        {
+            "difficulty_R": "easy",
+            "difficulty_J": "difficult",
+            "seed": index,
+            "winner": winner,
+            "columns": moves,
+        }
+        for index, (moves, winner) in enumerate(
+            zip(random_positions(6, seed=12), ["R", "J", None] * 2)
+        )
+    ]
+    games[0]["seed"] = None
+    with GameRecordWriter(path) as writer:
+        for game in games[:4]:
+            writer.write(
+                game["columns"],
+                game["winner"],
+                game["difficulty_R"],
+                game["difficulty_J"],
+                game["seed"],
+            )
+    # Un fichier existant est complété
+    with GameRecordWriter(path) as writer:
+        for game in games[4:]:
+            writer.write(
+                game["columns"],
+                game["winner"],
+                game["difficulty_R"],
+                game["difficulty_J"],
+                game["seed"],
+            )
+    assert list(read_game_records(path)) == games
+
+    # Une dernière partie tronquée par une écriture interrompue est ignorée
+    with open(path, "r+b") as file:
+        file.truncate(path.stat().st_size - 1)
+    assert list(GameRecordReader(path)) == games[:-1]
+
+
+def test_records_reject_other_geometry(tmp_path):
+    path = tmp_path / "games.p4r"
+    GameRecordWriter(path).close()
+    with pytest.raises(ValueError):
+        GameRecordWriter(path, rows=5)
+
+
+def test_replay_record():
+    moves = random_positions(1, seed=13)[0]
+    steps = list(replay_record({"columns": moves}))
+    assert [col for _, col, _ in steps] == moves
+    assert [player for _, _, player in steps] == ["R", "J"] * (len(moves) // 2) + [
+        "R"
+    ] * (len(moves) % 2)
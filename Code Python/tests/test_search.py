@@ -0,0 +1,166 @@
+import pytest
+
+from puissance4.engine import SEARCH_DEPTHS, SearchTimeout
+
+from tests.helpers import position_game, random_positions
+
+
+def plain_minimax(game, depth, alpha, beta, maximizing, difficulty):
+    """
+    Minimax alpha-bêta de référence : sans table de transposition, coups dans l'ordre des colonnes.
+    :param game: Partie placée sur la position.
+    :param depth: Profondeur restante.
+    :param alpha: Borne inférieure de la fenêtre.
+    :param beta: Borne supérieure de la fenêtre.
+    :param maximizing: Booléen indiquant si le Jaune (maximisant) a le trait.
+    :param difficulty: Difficulté utilisée pour l'évaluation.
+    :return: Valeur de la position, exacte avec une fenêtre infinie.
+    """
+    if depth == 0 or game.is_game_over():
+        return game.evaluate_board(difficulty)
+    player = "J" if maximizing else "R"
+    best = float("-inf") if maximizing else float("inf")
+    for col in game.generate_possible_moves():
+        game.insert_token(col, player)
+        value = plain_minimax(game, depth - 1, alpha, beta, not maximizing, difficulty)
+        game.undo_move(col)
+        if maximizing:
+            best = max(best, value)
+            alpha = max(alpha, value)
+        else:
+            best = min(best, value)
+            beta = min(beta, value)
+        if beta <= alpha:
+            break
+    return best
+
+
+def root_values(game, player, depth, difficulty):
+    """
+    Calcule la valeur de référence de chaque coup de la racine.
+    :param game: Partie placée sur la position.
+    :param player: Joueur au trait ('R' ou 'J').
+    :param depth: Profondeur de recherche, coup de la racine compris.
+    :param difficulty: Difficulté utilisée pour l'évaluation.
+    :return: Dictionnaire colonne -> valeur.
+    """
+    values = {}
+    for col in game.generate_possible_moves():
+        game.insert_token(col, player)
+        values[col] = plain_minimax(
+            game, depth - 1, float("-inf"), float("inf"), player == "R", difficulty
+        )
+        game.undo_move(col)
+    return values
+
+
+def best_value(values, player):
+    """
+    Renvoie la meilleure valeur de la racine pour le joueur au trait (le Jaune maximise).
+    """
+    return max(values.values()) if player == "J" else min(values.values())
+
+
+@pytest.fixture(scope="module")
+def positions():
+    return random_positions(25, seed=31, max_plies=24)
+
+
+@pytest.mark.parametrize("difficulty", list(SEARCH_DEPTHS))
+def test_root_values_match_plain_minimax(positions, difficulty):
+    depth = SEARCH_DEPTHS[difficulty]
+    options = dict(
+        difficulty_R=difficulty, difficulty_J=difficulty, seed=0, collect_stats=True
+    )
+    for moves in positions:
+        game, player = position_game(moves, **options)
+        reference = {
+            k: root_values(game, player, k, difficulty) for k in range(1, depth + 1)
+        }
+        # Profondeur fixe : le coup choisi a la meilleure valeur de référence
+        col = game.best_move(player)
+        assert game.last_stats.depths[depth]["score"] == best_value(
+            reference[depth], player
+        ), moves
+        assert reference[depth][col] == best_value(reference[depth], player), moves
+
+        # Les bornes mémorisées ne faussent pas les valeurs exactes des coups de la racine
+        for move, value in reference[depth].items():
+            game.insert_token(move, player)
+            try:
+                score = game.minimax(
+                    depth - 1, float("-inf"), float("inf"), player == "R", difficulty
+                )
+            finally:
+                game.undo_move(move)
+            assert score == value, (moves, move)
+
+        # Approfondissement itératif : chaque itération terminée est exacte à sa profondeur
+        game, _ = position_game(moves, **options)
+        game.best_move(player, max_depth=depth)
+        for k, entry in game.last_stats.depths.items():
+            assert entry["score"] == best_value(reference[k], player), (moves, k)
+            assert reference[k][entry["col"]] == entry["score"], (moves, k)
+
+
+def test_interrupted_iteration_is_discarded(monkeypatch):
+    game, player = position_game([3, 3, 2], seed=0, collect_stats=True)
+    search_depth = game.search_depth
+
+    def interrupted(player, depth, difficulty, moves):
+        if depth == 3:
+            # La troisième itération est interrompue en cours de route
+            game.search_root(player, 2, difficulty, list(reversed(moves)))
+            raise SearchTimeout()
+        return search_depth(player, depth, difficulty, moves)
+
+    monkeypatch.setattr(game, "search_depth", interrupted)
+    col = game.best_move(player, time_limit_ms=60_000)
+    assert sorted(game.last_stats.depths) == [1, 2]
+    assert col == game.last_stats.depths[2]["col"]
+    assert game.deadline is None
+
+
+def test_time_limit_returns_last_completed_depth():
+    game, player = position_game([3], seed=0, collect_stats=True)
+    col = game.best_move(player, time_limit_ms=100)
+    depths = game.last_stats.depths
+    assert depths
+    # Le plateau n'est pas résolu en 100 ms : la recherche s'arrête avant la profondeur maximale
+    assert max(depths) < 41
+    assert col == depths[max(depths)]["col"]
+    assert game.search_time < 1
+
+
+def test_move_priorities():
+    # Le Rouge gagne en 0, le Jaune menace en 1
+    game, player = position_game([0, 1, 0, 1, 0, 1])
+    game.killers[len(game.moves_played)] = [6]
+    moves = game.generate_possible_moves()
+    assert game.order_moves(moves, player, tt_move=5) == [0, 5, 1, 6, 3, 2, 4]
+    game.move_ordering = False
+    assert game.order_moves(moves, player, tt_move=5) == moves
+
+
+@pytest.mark.parametrize("difficulty", list(SEARCH_DEPTHS))
+def test_ordering_keeps_values_and_saves_nodes(positions, difficulty):
+    ordered_nodes = plain_nodes = 0
+    for moves in positions[:10]:
+        results = []
+        for move_ordering in (True, False):
+            game, player = position_game(
+                moves,
+                difficulty_R=difficulty,
+                difficulty_J=difficulty,
+                seed=0,
+                collect_stats=True,
+                move_ordering=move_ordering,
+            )
+            game.best_move(player)
+            results.append(game.last_stats.depths[SEARCH_DEPTHS[difficulty]]["score"])
+            if move_ordering:
+                ordered_nodes += game.nodes
+            else:
+                plain_nodes += game.nodes
+        assert results[0] == results[1], moves
+    assert ordered_nodes < plain_nodes
@@ -0,0 +1,183 @@
+import asyncio
+import json
+
+import pytest
+
+from puissance4.server import GameServer
+
+
+class Client:
+    """
+    Client de test : une requête JSON par ligne, une réponse JSON par ligne.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, request):
+        line = request if isinstance(request, bytes) else json.dumps(request).encode()
+        self.writer.write(line + b"\n")
+        await self.writer.drain()
+
+    async def receive(self):
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 30))
+
+    async def request(self, request):
+        await self.send(request)
+        return await self.receive()
+
+
+def run_with_server(scenario, **options):
+    """
+    Démarre un serveur sur un port libre, exécute le scénario avec un client connecté, puis arrête tout.
+    """
+
+    async def main():
+        server = GameServer(port=0, workers=1, default_time_ms=None, **options)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            try:
+                return await scenario(Client(reader, writer), server)
+            finally:
+                writer.close()
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_game_against_the_ai():
+    async def scenario(client, server):
+        game = await client.request(
+            {"op": "new", "difficulty": "easy", "human": "R", "id": 1}
+        )
+        assert game["ok"] and game["id"] == 1 and game["turn"] == "R"
+        played = await client.request({"op": "play", "game": game["game"], "col": 3})
+        assert played["ok"] and played["moves"] == "4" and played["turn"] == "J"
+        refused = await client.request({"op": "play", "game": game["game"], "col": 3})
+        assert not refused["ok"]
+        answer = await client.request({"op": "ai", "game": game["game"]})
+        assert answer["ok"] and answer["turn"] == "R"
+        assert answer["moves"] == "4" + str(answer["col"] + 1)
+        state = await client.request({"op": "state", "game": game["game"]})
+        assert state["moves"] == answer["moves"]
+        closed = await client.request({"op": "close", "game": game["game"]})
+        assert closed["ok"]
+        missing = await client.request({"op": "state", "game": game["game"]})
+        assert not missing["ok"]
+
+    run_with_server(scenario)
+
+
+def test_bestmove():
+    async def scenario(client, server):
+        answer = await client.request(
+            {"op": "bestmove", "position": "4453", "difficulty": "medium"}
+        )
+        assert answer["ok"] and 0 <= answer["col"] < 7 and answer["nodes"] > 0
+        over = await client.request({"op": "bestmove", "position": "1212121"})
+        assert not over["ok"]
+
+    run_with_server(scenario)
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        b"not json",
+        b"[1, 2]",
+        {"op": "unknown"},
+        {"op": "bestmove", "rows": 0},
+        {"op": "bestmove", "rows": 10**6},
+        {"op": "bestmove", "rows": "six"},
+        {"op": "bestmove", "position": "44!"},
+        {"op": "new", "connect": 9},
+        {"op": "new", "difficulty": "impossible"},
+        {"op": "bestmove", "time_limit_ms": "fast"},
+    ],
+)
+def test_invalid_requests_get_an_error(request_):
+    async def scenario(client, server):
+        answer = await client.request(request_)
+        assert answer["ok"] is False and answer["error"]
+        # La connexion reste utilisable
+        assert (await client.request({"op": "new"}))["ok"]
+
+    run_with_server(scenario)
+
+
+def test_boolean_column_is_refused():
+    async def scenario(client, server):
+        game = await client.request({"op": "new", "human": "R"})
+        answer = await client.request({"op": "play", "game": game["game"], "col": True})
+        assert not answer["ok"]
+
+    run_with_server(scenario)
+
+
+def test_game_closed_during_the_search():
+    async def scenario(client, server):
+        game = await client.request(
+            {"op": "new", "human": "J", "difficulty": "difficult"}
+        )
+        await client.send(
+            {"op": "ai", "game": game["game"], "time_limit_ms": 500, "id": "ai"}
+        )
+        await client.send({"op": "close", "game": game["game"], "id": "close"})
+        answers = {}
+        for _ in range(2):
+            answer = await client.receive()
+            answers[answer["id"]] = answer
+        assert answers["close"]["ok"]
+        assert answers["ai"] == {
+            "ok": False,
+            "error": "Partie fermée pendant la recherche",
+            "id": "ai",
+        }
+
+    run_with_server(scenario)
+
+
+def test_internal_errors_are_reported_and_release_the_slot():
+    async def broken(request):
+        raise RuntimeError("panne")
+
+    async def scenario(client, server):
+        server.commands["broken"] = broken
+        for index in range(3):
+            answer = await client.request({"op": "broken", "id": index})
+            assert answer == {"ok": False, "error": answer["error"], "id": index}
+            assert "panne" in answer["error"]
+        assert (await client.request({"op": "new"}))["ok"]
+
+    # Avec une seule requête en cours par connexion, un emplacement perdu bloquerait la suivante
+    run_with_server(scenario, max_pipeline=1)
+
+
+def test_pipelined_requests_keep_their_ids():
+    async def scenario(client, server):
+        for index in range(5):
+            await client.send({"op": "new", "id": index})
+        answers = [await client.receive() for _ in range(5)]
+        assert sorted(answer["id"] for answer in answers) == list(range(5))
+        assert all(answer["ok"] for answer in answers)
+
+    run_with_server(scenario)
+
+
+def test_saturated_server_refuses_searches():
+    async def scenario(client, server):
+        answer = await client.request({"op": "bestmove", "position": "44"})
+        assert not answer["ok"]
+
+    run_with_server(scenario, max_queue=0)
+
+
+def test_game_limit():
+    async def scenario(client, server):
+        assert (await client.request({"op": "new"}))["ok"]
+        assert not (await client.request({"op": "new"}))["ok"]
+
+    run_with_server(scenario, max_games=1)
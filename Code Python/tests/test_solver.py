@@ -0,0 +1,93 @@
+import pytest
+
+from puissance4 import Solver
+
+from tests.helpers import position_game, random_positions
+
+
+def brute_force(game, player, memo=None):
+    """
+    Valeur exacte par exploration complète, avec la convention de score du solveur :
+    (cases + 1 - jetons posés avant le coup gagnant) // 2 pour une victoire, 0 pour une partie nulle.
+    """
+    if memo is None:
+        memo = {}
+    key = str(game.board)
+    if key in memo:
+        return memo[key]
+    cells = game.rows * game.cols
+    played = len(game.moves_played)
+    moves = game.generate_possible_moves()
+    if not moves:
+        return 0
+    opponent = "J" if player == "R" else "R"
+    best = None
+    for col in moves:
+        game.insert_token(col, player)
+        if game.check_winner() == player:
+            score = (cells + 1 - played) // 2
+        else:
+            score = -brute_force(game, opponent, memo)
+        game.undo_move(col)
+        if best is None or score > best:
+            best = score
+    memo[key] = best
+    return best
+
+
+@pytest.mark.parametrize(
+    "geometry, min_plies",
+    [((4, 4, 3), 4), ((4, 5, 4), 8), ((5, 4, 4), 8), ((6, 7, 4), 30)],
+)
+def test_solver_matches_brute_force(geometry, min_plies):
+    rows, cols, connect = geometry
+    positions = [
+        moves
+        for moves in random_positions(200, rows, cols, connect, seed=5)
+        if len(moves) >= min_plies
+    ][:15]
+    assert positions
+    solver = Solver(rows, cols, connect=connect)
+    for moves in positions:
+        game, player = position_game(
+            moves, rows=rows, cols=cols, connect=connect, tt_size_mb=0
+        )
+        game.solver = solver
+        assert game.solve(player) == brute_force(game, player), moves
+
+
+def test_analyze_scores_every_move():
+    game, player = position_game(
+        [3, 3, 2, 4, 4, 2, 5, 1, 1, 5, 0, 0, 6, 6, 2, 2, 4, 4, 3, 3, 1, 1, 0, 0, 6, 6],
+        tt_size_mb=0,
+    )
+    bitboard = game.to_bitboard()
+    solver = Solver()
+    scores = solver.analyze(bitboard.pieces[player], bitboard.mask)
+    assert sorted(scores) == game.generate_possible_moves()
+    assert max(scores.values()) == solver.solve(bitboard.pieces[player], bitboard.mask)
+
+
+def test_table_round_trip(tmp_path):
+    path = str(tmp_path / "solver.bin")
+    game, player = position_game([3, 3, 2, 4, 4, 2, 5, 1, 1, 5], rows=5, cols=6)
+    bitboard = game.to_bitboard()
+    solver = Solver(5, 6)
+    score = solver.solve(bitboard.pieces[player], bitboard.mask)
+    solver.save(path)
+    loaded = Solver(5, 6)
+    loaded.load(path)
+    assert loaded.table == solver.table
+    assert loaded.solve(bitboard.pieces[player], bitboard.mask) == score
+
+
+def test_table_format_rejects_wide_boards(tmp_path):
+    path = tmp_path / "solver.bin"
+    solver = Solver(8, 8)
+    # Les clés d'un plateau 8x8 dépassent 64 bits : l'enregistrement est refusé sans écrire de fichier
+    solver.table[2**70] = 1
+    with pytest.raises(ValueError):
+        solver.save(str(path))
+    assert not path.exists()
+    with pytest.raises(ValueError):
+        solver.load(str(path))
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from puissance4 import SearchStats
+
+from tests.helpers import position_game
+
+
+def sample_stats(scale, profile=False):
+    """
+    Construit des statistiques dont chaque compteur est un multiple de scale.
+    :param scale: Facteur appliqué à tous les compteurs.
+    :param profile: Mode profil des statistiques.
+    :return: Instance de SearchStats.
+    """
+    stats = SearchStats(profile)
+    stats.searches = scale
+    stats.nodes = 10 * scale
+    stats.interior_nodes = 3 * scale
+    stats.root_moves = 2 * scale
+    stats.leaves = 6 * scale
+    stats.cutoffs = scale
+    stats.tt_hits = 4 * scale
+    stats.tt_misses = 6 * scale
+    stats.time = 0.5 * scale
+    stats.record_depth(1, 4 * scale, 0.1 * scale, 3, 0)
+    stats.record_depth(2, 6 * scale, 0.4 * scale, 2, -5)
+    return stats
+
+
+def test_merge():
+    total = sample_stats(1).merge(sample_stats(2, profile=True))
+    assert (total.searches, total.nodes, total.leaves, total.cutoffs) == (3, 30, 18, 3)
+    assert (total.tt_hits, total.tt_misses, total.root_moves) == (12, 18, 6)
+    assert total.time == pytest.approx(1.5)
+    assert total.profile
+    assert total.depths[2]["nodes"] == 18
+    assert total.depths[1]["time"] == pytest.approx(0.3)
+    # Les rapports sont recalculés sur les totaux
+    assert total.tt_hit_rate() == pytest.approx(0.4)
+    assert total.branching_factor() == pytest.approx((30 - 6) / 9)
+    assert total.cutoff_rate() == pytest.approx(1 / 3)
+    assert total.nodes_per_second() == pytest.approx(20)
+    assert SearchStats().branching_factor() == SearchStats().tt_hit_rate() == 0.0
+
+
+def test_to_dict_round_trip():
+    stats = sample_stats(3, profile=True)
+    data = json.loads(json.dumps(stats.to_dict()))
+    assert data["nodes"] == 30
+    assert data["depths"]["2"]["score"] == -5
+    assert data["tt_hit_rate"] == pytest.approx(0.4)
+    copy = SearchStats.from_dict(data)
+    assert copy.to_dict() == stats.to_dict()
+    assert copy.depths[1]["col"] == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_search_stats_are_consistent(workers):
+    game, player = position_game(
+        [3, 3, 2, 4],
+        difficulty_R="difficult",
+        seed=0,
+        search_workers=workers,
+        collect_stats=True,
+    )
+    try:
+        game.best_move(player)
+    finally:
+        game.close()
+    stats = game.last_stats
+    moves = len(game.generate_possible_moves())
+    assert stats.searches == 1
+    assert stats.nodes == game.nodes > 0
+    # Chaque appel à minimax consulte la table une fois, dans le processus principal comme dans les autres
+    assert stats.tt_hits + stats.tt_misses == stats.nodes
+    assert stats.root_moves == moves
+    assert stats.leaves > 0 and stats.interior_nodes > 0
+    assert list(stats.depths) == [5]
+    assert stats.depths[5]["nodes"] == stats.nodes
@@ -0,0 +1,149 @@
+import pytest
+
+from puissance4 import Solver, TranspositionTable, build_book, write_book
+from puissance4.book import book_move, enumerate_positions, open_book
+from puissance4.encoding import mirror_key
+
+from tests.helpers import position_game, random_positions
+
+
+def mirrored_pair(moves, **options):
+    """
+    Crée une position et sa symétrique (colonnes inversées), partageant les options de Puissance4.
+    :param moves: Colonnes jouées depuis le plateau vide (Rouge commence).
+    :param options: Paramètres de Puissance4 (cols compris).
+    :return: Tuple (partie, partie symétrique, joueur au trait).
+    """
+    cols = options.get("cols", 7)
+    game, player = position_game(moves, **options)
+    mirror, _ = position_game([cols - 1 - col for col in moves], **options)
+    return game, mirror, player
+
+
+def table_move(game, maximizing, table):
+    """
+    Lit le meilleur coup mémorisé pour la position, ramené dans son orientation comme le fait minimax.
+    :param game: Partie placée sur la position.
+    :param maximizing: Booléen indiquant si le Jaune a le trait.
+    :param table: Table de transposition de la partie.
+    :return: Colonne, ou None si la position est absente de la table.
+    """
+    key, mirrored = game.search_key(maximizing, "medium")
+    entry = table.probe(key)
+    if entry is None:
+        return None
+    move = entry[3]
+    return game.cols - 1 - move if mirrored and move >= 0 else move
+
+
+@pytest.mark.parametrize("moves", [[0], [1, 3, 2], [6, 6, 5, 0, 2], [3, 3, 1]])
+def test_mirrored_positions_share_table_entries(moves):
+    table = TranspositionTable(size_mb=1)
+    game, mirror, player = mirrored_pair(moves, transposition_table=table, seed=0)
+    maximizing = player == "J"
+    key, mirrored = game.search_key(maximizing, "medium")
+    other_key, mirror_mirrored = mirror.search_key(maximizing, "medium")
+    assert key == other_key
+    if game.hash != mirror.hash:
+        assert mirrored != mirror_mirrored
+
+    value = game.minimax(4, float("-inf"), float("inf"), maximizing, "medium")
+    move = table_move(game, maximizing, table)
+    assert move in game.generate_possible_moves()
+    # La position symétrique retrouve l'entrée exacte sans la chercher, coup symétrisé
+    mirror.nodes = 0
+    assert mirror.minimax(4, float("-inf"), float("inf"), maximizing, "medium") == value
+    assert mirror.nodes == 1
+    assert table_move(mirror, maximizing, table) == 6 - move
+
+
+def test_even_columns_are_not_canonicalized():
+    table = TranspositionTable(size_mb=1)
+    for moves in random_positions(10, rows=5, cols=6, seed=21, max_plies=12):
+        game, mirror, player = mirrored_pair(
+            moves, rows=5, cols=6, transposition_table=table
+        )
+        if game.hash == mirror.hash:
+            continue
+        maximizing = player == "J"
+        key, mirrored = game.search_key(maximizing, "medium")
+        # L'évaluation n'est pas symétrique : chaque orientation garde sa propre entrée
+        assert not mirrored
+        assert not mirror.search_key(maximizing, "medium")[1]
+        assert key != mirror.search_key(maximizing, "medium")[0]
+        assert game.canonical_key() == (game.position_key(), False)
+        assert mirror.canonical_key() == (mirror.position_key(), False)
+
+
+def test_mirrored_book_entries(tmp_path):
+    path = str(tmp_path / "book.bin")
+    positions = [
+        moves for moves in enumerate_positions(3) if moves <= [6 - c for c in moves]
+    ]
+    # Le livre ne reçoit que l'une des deux orientations de chaque position
+    write_book(
+        path, 6, 7, {"easy": dict(book_move(6, 7, "easy", m) for m in positions)}
+    )
+    book = open_book(path)
+    try:
+        for moves in positions:
+            game, mirror, player = mirrored_pair(
+                moves, difficulty_R="easy", difficulty_J="easy", opening_book=book
+            )
+            assert game.canonical_key()[0] == mirror.canonical_key()[0]
+            col = game.book_move(player, "easy")
+            assert col in game.generate_possible_moves()
+            assert mirror.book_move(player, "easy") == 6 - col
+    finally:
+        book.close()
+        open_book.cache_clear()
+
+
+def test_even_column_book(tmp_path):
+    path = str(tmp_path / "book.bin")
+    build_book(path, plies=2, difficulties=["easy"], rows=5, cols=6)
+    book = open_book(path)
+    try:
+        for moves in enumerate_positions(2, rows=5, cols=6):
+            game, mirror, player = mirrored_pair(
+                moves, rows=5, cols=6, difficulty_R="easy", opening_book=book
+            )
+            key, col = book_move(5, 6, "easy", moves)
+            assert key == game.position_key()
+            assert book.lookup(key, "easy") == col
+            assert game.book_move(player, "easy") == col
+            # La symétrique a sa propre entrée, lue sans symétriser le coup
+            mirror_col = book.lookup(mirror.position_key(), "easy")
+            assert mirror.book_move(player, "easy") == mirror_col
+            if game.hash != mirror.hash:
+                assert mirror.position_key() != key
+    finally:
+        book.close()
+        open_book.cache_clear()
+
+
+@pytest.mark.parametrize("geometry", [(4, 5, 4), (5, 4, 4)])
+def test_mirrored_positions_share_solver_entries(geometry):
+    rows, cols, connect = geometry
+    positions = random_positions(20, rows, cols, connect, seed=8, max_plies=12)
+    for moves in [moves for moves in positions if len(moves) >= 6][:6]:
+        solver = Solver(rows, cols, connect=connect)
+        options = dict(rows=rows, cols=cols, connect=connect, tt_size_mb=0)
+        game, mirror, player = mirrored_pair(moves, **options)
+        bitboard = game.to_bitboard()
+        position, mask = bitboard.pieces[player], bitboard.mask
+        mirror_bitboard = mirror.to_bitboard()
+        mirror_position = mirror_bitboard.pieces[player]
+        mirror_mask = mirror_bitboard.mask
+
+        score = solver.solve(position, mask)
+        # Même entrée de table pour la position et sa symétrique, quelle que soit la parité des colonnes
+        key = position + mask
+        assert min(key, mirror_key(key, rows, cols)) in solver.table
+        mirrored = mirror_position + mirror_mask
+        assert min(mirrored, mirror_key(mirrored, rows, cols)) in solver.table
+        assert solver.solve(mirror_position, mirror_mask) == score
+
+        scores = solver.analyze(position, mask)
+        mirror_scores = solver.analyze(mirror_position, mirror_mask)
+        assert mirror_scores == {cols - 1 - col: value for col, value in scores.items()}
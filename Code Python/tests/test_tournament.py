@@ -0,0 +1,46 @@
+from puissance4 import Puissance4
+
+
+def deterministic(results):
+    """
+    Retire des résultats d'un tournoi les durées mesurées, seules à dépendre de l'exécution.
+    :param results: Résultats de Puissance4.tournament.
+    :return: Copie des résultats sans durées ni statistiques de temps.
+    """
+    clocks = ("time", "cpu_time", "stats")
+    return {
+        first: {
+            second: {
+                **{key: value for key, value in entry.items() if key not in clocks},
+                "games": [
+                    {key: value for key, value in game.items() if key not in clocks}
+                    for game in entry["games"]
+                ],
+            }
+            for second, entry in opponents.items()
+        }
+        for first, opponents in results.items()
+    }
+
+
+def test_tournament_is_independent_of_workers():
+    game = Puissance4(rows=5, cols=5, tt_size_mb=1)
+    options = dict(num_games=2, seed=4, difficulties=["easy", "medium"])
+    serial = deterministic(game.tournament(workers=1, **options))
+    parallel = deterministic(game.tournament(workers=2, **options))
+    assert serial == parallel
+    games = serial["easy"]["medium"]["games"]
+    assert sorted(record["seed"] for record in games) == [4, 5, 6, 7]
+    entry = serial["easy"]["medium"]
+    assert entry["wins"] + entry["losses"] + entry["draws"] == 4
+
+
+def test_tournament_profile():
+    game = Puissance4(rows=5, cols=5, tt_size_mb=1)
+    results = game.tournament(
+        num_games=1, seed=2, difficulties=["easy", "medium"], profile=True
+    )
+    stats = results["medium"]["easy"]["stats"]
+    assert stats["searches"] > 0
+    assert stats["nodes"] > 0
+    assert stats["profile"]
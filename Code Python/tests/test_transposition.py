@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+
+from puissance4 import SharedTranspositionTable, TranspositionTable
+from puissance4.evaluation import evaluation_parameters
+from puissance4.transposition import attach_shared_table
+
+from tests.helpers import position_game
+
+
+@pytest.fixture(params=["local", "shared"])
+def table(request):
+    if request.param == "local":
+        yield TranspositionTable(size_mb=1)
+    else:
+        with SharedTranspositionTable(size_mb=1) as shared:
+            yield shared
+
+
+def test_store_and_probe(table):
+    table.store(12345, 3, TranspositionTable.EXACT, -7, 2)
+    depth, flag, value, move = table.probe(12345)
+    assert (depth, flag, value, move) == (3, TranspositionTable.EXACT, -7, 2)
+    # Les scores entiers restent entiers, les autres valeurs sont rendues telles quelles
+    assert type(value) is int
+    table.store(54321, 1, TranspositionTable.LOWER, 2.5)
+    assert table.probe(54321) == (1, TranspositionTable.LOWER, 2.5, -1)
+    table.store(99, 2, TranspositionTable.UPPER, float("-inf"))
+    assert table.probe(99)[2] == float("-inf")
+    assert table.probe(777) is None
+
+
+def test_deepest_entry_is_kept(table):
+    key = 42
+    other = key + table.size  # Même bucket
+    table.store(key, 5, TranspositionTable.EXACT, 1)
+    table.store(other, 2, TranspositionTable.EXACT, 2)
+    assert table.probe(key)[0] == 5
+    assert table.probe(other)[0] == 2
+    # Une entrée plus profonde prend la place de l'entrée profonde, qui est rétrogradée
+    third = key + 2 * table.size
+    table.store(third, 6, TranspositionTable.EXACT, 3)
+    assert table.probe(third)[0] == 6
+    assert table.probe(key)[0] == 5
+    assert table.probe(other) is None
+
+
+def test_clear(table):
+    table.store(1, 1, TranspositionTable.EXACT, 1)
+    table.clear()
+    assert table.probe(1) is None
+
+
+def test_shared_table_is_pickled_by_name():
+    with SharedTranspositionTable(size_mb=1) as table:
+        table.store(7, 4, TranspositionTable.EXACT, 11, 3)
+        attached = pickle.loads(pickle.dumps(table))
+        try:
+            assert attached.name == table.name
+            assert not attached.owner
+            assert attached.probe(7) == (4, TranspositionTable.EXACT, 11, 3)
+        finally:
+            attached.close()
+            attach_shared_table.cache_clear()
+
+
+def test_entries_are_separated_by_evaluation_parameters():
+    tuned = {"medium": {"three": 7, "opponent_three": 1}}
+    default = {"medium": evaluation_parameters("medium")}
+    with SharedTranspositionTable(size_mb=1) as table:
+        game, player = position_game([3, 3, 2], transposition_table=table)
+        same, _ = position_game(
+            [3, 3, 2], transposition_table=table, evaluation_parameters=default
+        )
+        other, _ = position_game(
+            [3, 3, 2], transposition_table=table, evaluation_parameters=tuned
+        )
+        maximizing = player == "J"
+        key, _ = game.search_key(maximizing, "medium")
+        # Mêmes poids que la difficulté : même clé ; poids réglés : entrées distinctes
+        assert same.search_key(maximizing, "medium")[0] == key
+        assert other.search_key(maximizing, "medium")[0] != key
+        assert game.search_key(maximizing, "easy")[0] != key
+
+        col = game.best_move(player, max_depth=3)
+        # Les positions filles de la racine ont été mémorisées sous les seuls poids de game
+        for engine in (game, other):
+            engine.insert_token(col, player)
+        assert table.probe(game.search_key(not maximizing, "medium")[0]) is not None
+        assert table.probe(other.search_key(not maximizing, "medium")[0]) is None
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from puissance4 import GameRecordWriter
+from puissance4.evaluation import EVALUATION_PARAMETERS, evaluation_parameters
+from puissance4.tuning import (
+    LABELS,
+    Tuner,
+    chunk_loss,
+    init_worker,
+    labelled_positions,
+    load_parameters,
+    save_parameters,
+)
+
+from tests.helpers import play_random, position_game, random_positions
+
+TUNED = {"medium": {"three": 6.5, "two": 1.25, "center": 4, "opponent_three": 2}}
+
+
+@pytest.fixture
+def records(tmp_path):
+    """
+    Fichier de parties aléatoires jouées jusqu'au bout.
+    """
+    path = str(tmp_path / "games.p4r")
+    rng = random.Random(14)
+    with GameRecordWriter(path) as writer:
+        for _ in range(30):
+            game, _ = position_game([], tt_size_mb=0)
+            moves = play_random(game, 42, rng)
+            writer.write(moves, game.check_winner())
+    return path
+
+
+def test_default_parameters():
+    assert evaluation_parameters("medium") == EVALUATION_PARAMETERS["medium"]
+    assert evaluation_parameters("medium", TUNED)["three"] == 6.5
+    assert evaluation_parameters("medium", TUNED)["win"] == 100
+    assert evaluation_parameters("easy", TUNED) == EVALUATION_PARAMETERS["easy"]
+
+
+def test_tuned_parameters_in_the_engine():
+    for moves in random_positions(30, seed=15):
+        game, _ = position_game(moves, tt_size_mb=0, evaluation_parameters=TUNED)
+        reference, _ = position_game(moves, tt_size_mb=0)
+        assert game.evaluate_board("medium") == game.evaluate_board_scan("medium")
+        assert game.copy().evaluate_board("medium") == game.evaluate_board("medium")
+        # Les autres difficultés ne sont pas touchées
+        assert game.evaluate_board("difficult") == reference.evaluate_board("difficult")
+
+
+def test_labelled_positions(records):
+    geometry, positions = labelled_positions(records, skip_plies=4)
+    assert geometry == (6, 7, 4)
+    assert positions and all(len(moves) >= 4 for moves, _ in positions)
+    assert {label for _, label in positions} <= set(LABELS.values())
+    _, limited = labelled_positions(records, skip_plies=4, limit=10)
+    assert limited == positions[:10]
+
+
+def test_loss_uses_the_engine_evaluation(records):
+    geometry, positions = labelled_positions(records)
+    init_worker(geometry, positions)
+    parameters = evaluation_parameters("medium", TUNED)
+    error, count = chunk_loss("medium", parameters, 0.7, 0, len(positions))
+    expected = 0.0
+    for moves, label in positions:
+        game, _ = position_game(moves, tt_size_mb=0, evaluation_parameters=TUNED)
+        probability = 1 / (1 + 10 ** (-0.7 * game.evaluate_board("medium") / 400))
+        expected += (label - probability) ** 2
+    assert count == len(positions)
+    assert error == pytest.approx(expected)
+
+
+def test_tuner_resumes_from_its_checkpoint(records, tmp_path):
+    geometry, positions = labelled_positions(records)
+    straight = Tuner(geometry, positions, chunk_size=100).run(4)
+
+    checkpoint = str(tmp_path / "state.json")
+    Tuner(geometry, positions, chunk_size=100, checkpoint=checkpoint).run(2)
+    resumed = Tuner(geometry, positions, chunk_size=100, checkpoint=checkpoint)
+    assert resumed.iteration == 2
+    assert resumed.run(4) == straight
+
+
+def test_save_and_load_parameters(tmp_path):
+    path = str(tmp_path / "parameters.json")
+    save_parameters(path, "medium", TUNED["medium"])
+    save_parameters(path, "easy", {"center": 1})
+    assert load_parameters(path) == {**TUNED, "easy": {"center": 1}}